@@ -0,0 +1,29 @@
+import json
+import os
+
+
+def load_accounts(path):
+    """Baca daftar akun dari file JSON: [{"email": ..., "password": ..., "server": ...}, ...]"""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    if not isinstance(data, list):
+        raise ValueError(f"{path} harus berisi list akun")
+
+    accounts = []
+    for i, entry in enumerate(data):
+        missing = [key for key in ("email", "password", "server") if not entry.get(key)]
+        if missing:
+            raise ValueError(f"Akun #{i + 1} di {path} tidak punya: {', '.join(missing)}")
+        accounts.append({"email": entry["email"], "password": entry["password"], "server": entry["server"]})
+    return accounts
+
+
+def account_from_env():
+    """Akun tunggal dari variabel EMAIL/PASSWORD/SERVER (config.env), atau None"""
+    email = os.getenv("EMAIL")
+    password = os.getenv("PASSWORD")
+    server = os.getenv("SERVER")
+    if not email or not password or not server:
+        return None
+    return {"email": email, "password": password, "server": server}
@@ -0,0 +1,230 @@
+"""Benchmark flow bot memakai FakeBackend (tanpa Chrome) dan startup CLI.
+
+Startup command non-browser (ledger, report, doctor) diukur dan dijaga
+dengan budget, serta dicek tidak ikut meng-import Selenium.
+
+Contoh:
+    python bench.py --accounts 5000
+    python bench.py --skip-flow --max-startup-ms 200
+    python bench.py --skip-flow --skip-startup --pipeline 20 --claim-workers 2
+    python bench.py --skip-flow --skip-startup --launch all --launch-runs 3
+"""
+import argparse
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from fake_backend import FakeBackend
+from ninja_heroes_bot import NinjaHeroesBot
+
+
+def bench_flow(accounts, latency=None, jitter=0.0):
+    """Jalankan flow lengkap untuk sejumlah akun simulasi, kembalikan statistik"""
+    succeeded = 0
+    virtual_total = 0.0
+    started = time.perf_counter()
+
+    for i in range(accounts):
+        backend = FakeBackend(latency=latency, jitter=jitter, seed=i)
+        bot = NinjaHeroesBot(
+            email=f"akun{i}@example.com",
+            password="rahasia",
+            server_choice="Server 39 - SSINJAA",
+            backend=backend
+        )
+        if bot.run():
+            succeeded += 1
+        virtual_total += backend.now()
+
+    elapsed = time.perf_counter() - started
+    return {
+        "accounts": accounts,
+        "succeeded": succeeded,
+        "wall_seconds": elapsed,
+        "accounts_per_second": accounts / elapsed if elapsed else 0.0,
+        "virtual_seconds_per_account": virtual_total / accounts if accounts else 0.0,
+    }
+
+
+def bench_pipeline(accounts, time_scale=0.01, claim_workers=1, depth=None):
+    """Bandingkan batch berurutan dengan PipelineRunner memakai FakeBackend berjam nyata"""
+    from pipeline import PipelineRunner
+
+    def make_account(i):
+        return {"email": f"akun{i}@example.com", "password": "rahasia", "server": "Server 39 - SSINJAA"}
+
+    def factory():
+        return FakeBackend(time_scale=time_scale)
+
+    started = time.perf_counter()
+    for i in range(accounts):
+        account = make_account(i)
+        NinjaHeroesBot(email=account["email"], password=account["password"], server_choice=account["server"],
+                       backend=factory()).run()
+    sequential = time.perf_counter() - started
+
+    runner = PipelineRunner(factory, claim_workers=claim_workers, depth=depth, ledger_path=os.devnull,
+                            write_screenshots=False)
+    runner.run([make_account(i) for i in range(accounts)])
+    return sequential, runner.stats()
+
+
+def bench_launch(profile, runs=3, url=None, claim=True):
+    """Ukur profil launch Chrome: cold start, waktu halaman pertama, RSS process tree, dan claim.
+
+    Tanpa url, halaman dari mock_site.py dijalankan lokal dan flow claim
+    lengkap dijalankan untuk memastikan profil tetap bisa claim.
+    """
+    import mock_site
+    import proc_stats
+    from selenium_backend import SeleniumBackend
+
+    server = None
+    if url is None:
+        server, url = mock_site.start_in_background()
+
+    stats = {"profile": profile, "runs": runs, "cold_start": [], "first_page": [], "rss": [], "processes": [],
+             "claims": 0, "claim_checked": claim and server is not None, "errors": []}
+    try:
+        for _ in range(runs):
+            backend = SeleniumBackend(profile=profile)
+            try:
+                started = time.perf_counter()
+                backend.start()
+                stats["cold_start"].append(time.perf_counter() - started)
+
+                started = time.perf_counter()
+                backend.navigate(url)
+                backend.wait_for_selector("body", 30, 0.05)
+                stats["first_page"].append(time.perf_counter() - started)
+
+                tree = proc_stats.tree_stats(backend.process_id())
+                if tree:
+                    stats["rss"].append(tree["rss"])
+                    stats["processes"].append(tree["processes"])
+
+                if stats["claim_checked"]:
+                    bot = NinjaHeroesBot(email="bench@example.com", password="rahasia",
+                                         server_choice="Server 39 - SSINJAA", backend=backend, event_url=url)
+                    bot.page_ready = True
+                    bot.screenshot_sink = lambda filename, png: None
+                    if bot.run_tasks() and bot.last_status == "success":
+                        stats["claims"] += 1
+            except Exception as e:
+                stats["errors"].append(str(e).splitlines()[0] if str(e) else type(e).__name__)
+            finally:
+                try:
+                    backend.quit()
+                except Exception:
+                    pass
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+    return stats
+
+
+def _median(values, scale=1.0, fmt="{:.2f}"):
+    """Median terformat, "-" jika tidak ada data"""
+    return fmt.format(statistics.median(values) * scale) if values else "-"
+
+
+# Command CLI yang tidak boleh memuat browser, beserta budget startup-nya
+STARTUP_COMMANDS = [["ledger"], ["report"], ["doctor"]]
+STARTUP_BUDGET_MS = 300
+HEAVY_MODULES = ("selenium", "fake_backend", "selenium_backend")
+
+
+def bench_startup(command, runs=5):
+    """Median waktu startup `cli.py <command>` (ms) dan modul berat yang ikut ter-import"""
+    cli_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cli.py")
+    # Ledger kosong agar hasil tidak bergantung pada isi runs.jsonl lokal
+    argv = [sys.executable, cli_path, "--ledger", os.devnull] + command
+
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    trace = subprocess.run([sys.executable, "-X", "importtime"] + argv[1:],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True).stderr
+    imported = {line.rsplit("|", 1)[-1].strip() for line in trace.splitlines() if "|" in line}
+    heavy = sorted(name for name in imported if name.split(".")[0] in HEAVY_MODULES)
+    return statistics.median(timings), heavy
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark flow Ninja Heroes bot dengan FakeBackend")
+    parser.add_argument("--accounts", type=int, default=2000, help="Jumlah akun simulasi")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Variasi latensi relatif (0.2 = ±20%%)")
+    parser.add_argument("--skip-flow", action="store_true", help="Hanya ukur startup CLI")
+    parser.add_argument("--skip-startup", action="store_true", help="Hanya ukur flow")
+    parser.add_argument("--pipeline", type=int, default=0, metavar="N",
+                        help="Bandingkan batch berurutan vs pipeline untuk N akun (jam nyata)")
+    parser.add_argument("--time-scale", type=float, default=0.01,
+                        help="Faktor jam nyata FakeBackend untuk --pipeline (0.01 = 1 detik virtual -> 10 ms)")
+    parser.add_argument("--claim-workers", type=int, default=1, help="Worker stage claim untuk --pipeline")
+    parser.add_argument("--launch", metavar="PROFIL",
+                        help="Ukur profil launch Chrome (dipisah koma, atau 'all'); butuh Chrome")
+    parser.add_argument("--launch-runs", type=int, default=3, help="Jumlah launch per profil")
+    parser.add_argument("--launch-url", help="Ukur halaman ini alih-alih mock site lokal (tanpa cek claim)")
+    parser.add_argument("--launch-no-claim", action="store_true", help="Jangan jalankan flow claim di mock site")
+    parser.add_argument("--startup-runs", type=int, default=5)
+    parser.add_argument("--max-startup-ms", type=float, default=STARTUP_BUDGET_MS,
+                        help="Budget median startup command non-browser")
+    args = parser.parse_args(argv)
+
+    # Log per-step terlalu mahal untuk ribuan akun
+    logging.getLogger().setLevel(logging.WARNING)
+
+    ok = True
+    if not args.skip_flow:
+        stats = bench_flow(args.accounts, jitter=args.jitter)
+        print(f"Akun               : {stats['accounts']} ({stats['succeeded']} sukses)")
+        print(f"Waktu nyata        : {stats['wall_seconds']:.2f} s")
+        print(f"Throughput         : {stats['accounts_per_second']:.0f} akun/s")
+        print(f"Waktu virtual/akun : {stats['virtual_seconds_per_account']:.2f} s")
+        ok = stats["succeeded"] == stats["accounts"]
+
+    if args.pipeline:
+        from pipeline import format_stats
+
+        sequential, stats = bench_pipeline(args.pipeline, args.time_scale, args.claim_workers)
+        print(f"Berurutan          : {sequential:.2f} s")
+        print(f"Pipeline           : {stats['wall_seconds']:.2f} s ({sequential / stats['wall_seconds']:.2f}x)")
+        print(format_stats(stats))
+
+    if args.launch:
+        from launch_profiles import PROFILE_NAMES
+
+        profiles = PROFILE_NAMES if args.launch == "all" else [p.strip() for p in args.launch.split(",")]
+        print(f"{'profil':<14}{'cold start':>11}{'halaman 1':>11}{'RSS MB':>9}{'proses':>8}{'claim':>8}")
+        for profile in profiles:
+            stats = bench_launch(profile, args.launch_runs, args.launch_url, claim=not args.launch_no_claim)
+            claims = f"{stats['claims']}/{stats['runs']}" if stats["claim_checked"] else "-"
+            print(f"{profile:<14}{_median(stats['cold_start'], fmt='{:.2f}s'):>11}"
+                  f"{_median(stats['first_page'], fmt='{:.2f}s'):>11}"
+                  f"{_median(stats['rss'], 1 / 2 ** 20, '{:.0f}'):>9}{_median(stats['processes'], fmt='{:.0f}'):>8}"
+                  f"{claims:>8}")
+            for error in stats["errors"]:
+                print(f"    ❌ {error}")
+            ok = ok and not stats["errors"] and (not stats["claim_checked"] or stats["claims"] == stats["runs"])
+
+    if not args.skip_startup:
+        print(f"Startup CLI (median {args.startup_runs}x, budget {args.max_startup_ms:.0f} ms):")
+        for command in STARTUP_COMMANDS:
+            median_ms, heavy = bench_startup(command, args.startup_runs)
+            within = median_ms <= args.max_startup_ms and not heavy
+            ok = ok and within
+            note = f"  ❌ import berat: {', '.join(heavy)}" if heavy else ""
+            print(f"  {'✅' if within else '❌'} {' '.join(command):<10} {median_ms:7.1f} ms{note}")
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,213 @@
+import time
+
+
+class BackendTimeout(Exception):
+    """Kondisi yang ditunggu tidak terpenuhi dalam batas waktu"""
+
+
+class ClickIntercepted(Exception):
+    """Klik tertahan oleh elemen lain (misalnya overlay modal)"""
+
+
+# Snapshot DOM yang dipangkas untuk deteksi perubahan markup (lihat page_capture.py).
+# arguments[0] = {region: [selector, ancestor_selector]}, arguments[1] = {role: [selector, ...]}
+DOM_SNAPSHOT_SCRIPT = r"""
+var regions = arguments[0], roles = arguments[1];
+var KEEP = /^(id|class|name|type|value|href|role|placeholder|onclick|disabled|data-.*)$/;
+var DROP = {SCRIPT: 1, STYLE: 1, SVG: 1, NOSCRIPT: 1, IFRAME: 1, LINK: 1, META: 1};
+function clip(text, n) { text = (text || "").replace(/\s+/g, " ").trim(); return text.length > n ? text.slice(0, n) + "…" : text; }
+function trim(node, depth) {
+  if (node.nodeType === 3) { var t = clip(node.textContent, 80); return t ? document.createTextNode(t) : null; }
+  if (node.nodeType !== 1 || DROP[node.tagName.toUpperCase()]) return null;
+  var copy = document.createElement(node.tagName.toLowerCase());
+  for (var i = 0; i < node.attributes.length; i++) {
+    var attr = node.attributes[i];
+    if (KEEP.test(attr.name)) copy.setAttribute(attr.name, clip(attr.value, 120));
+  }
+  var display = window.getComputedStyle(node).display;
+  if (display === "none") copy.setAttribute("style", "display: none");
+  if (depth < 10) {
+    var kept = 0;
+    for (var c = node.firstChild; c && kept < 40; c = c.nextSibling) {
+      var child = trim(c, depth + 1);
+      if (child) { copy.appendChild(child); kept++; }
+    }
+  }
+  return copy;
+}
+function find(selector) {
+  try {
+    if (selector.indexOf("//") === 0) {
+      var found = [], snap = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+      for (var i = 0; i < snap.snapshotLength; i++) found.push(snap.snapshotItem(i));
+      return found;
+    }
+    return Array.prototype.slice.call(document.querySelectorAll(selector));
+  } catch (e) { return null; }
+}
+var ids = new Map(), elements = {};
+function describe(el) {
+  if (ids.has(el)) return ids.get(el);
+  var id = "e" + ids.size;
+  ids.set(el, id);
+  var attrs = {};
+  for (var i = 0; i < el.attributes.length; i++) {
+    if (KEEP.test(el.attributes[i].name)) attrs[el.attributes[i].name] = clip(el.attributes[i].value, 120);
+  }
+  var info = {tag: el.tagName.toLowerCase(), text: clip(el.innerText || el.textContent, 80), attrs: attrs,
+              visible: !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length),
+              enabled: !el.disabled};
+  if (el.tagName === "SELECT") {
+    info.options = Array.prototype.map.call(el.options, function (o) { return [o.value, clip(o.text, 80)]; });
+  }
+  elements[id] = info;
+  return id;
+}
+var out = {url: location.href, regions: {}, elements: elements, matches: {}};
+Object.keys(regions).forEach(function (name) {
+  var spec = regions[name], html = null;
+  for (var i = 0; i < spec[0].length && html === null; i++) {
+    var found = find(spec[0][i]);
+    if (found && found.length) {
+      var root = spec[1] ? (found[0].closest(spec[1]) || found[0]) : found[0];
+      html = trim(root, 0).outerHTML.slice(0, 50000);
+    }
+  }
+  out.regions[name] = html;
+});
+Object.keys(roles).forEach(function (role) {
+  out.matches[role] = {};
+  roles[role].forEach(function (selector) {
+    var found = find(selector);
+    out.matches[role][selector] = found === null ? null : found.map(describe);
+  });
+});
+return out;
+"""
+
+
+class BrowserBackend:
+    """Antarmuka tipis untuk operasi browser yang dipakai flow bot.
+
+    Selector yang diawali "//" dianggap XPath, selain itu CSS selector.
+    Elemen yang dikembalikan minimal punya is_displayed(), is_enabled(),
+    atribut text dan get_attribute(name).
+    """
+
+    def start(self):
+        """Jalankan browser"""
+        raise NotImplementedError
+
+    def quit(self):
+        """Tutup browser"""
+        raise NotImplementedError
+
+    def reset_session(self):
+        """Hapus cookie dan storage semua origin agar browser bisa dipakai akun berikutnya dalam keadaan logout"""
+        raise NotImplementedError
+
+    def navigate(self, url):
+        """Buka URL"""
+        raise NotImplementedError
+
+    def query_selector_all(self, selector):
+        """Kembalikan list elemen yang cocok dengan selector"""
+        raise NotImplementedError
+
+    def click(self, element, method="native"):
+        """Klik elemen; method: native, script, actions atau event"""
+        raise NotImplementedError
+
+    def type_text(self, element, text):
+        """Kosongkan field lalu ketik teks"""
+        raise NotImplementedError
+
+    def list_options(self, element):
+        """Kembalikan list (value, text) dari elemen select"""
+        raise NotImplementedError
+
+    def select_option(self, element, text=None, value=None):
+        """Pilih option berdasarkan teks yang terlihat atau value"""
+        raise NotImplementedError
+
+    def scroll_into_view(self, element):
+        """Scroll elemen ke tengah layar"""
+        raise NotImplementedError
+
+    def execute_script(self, script, *args):
+        """Jalankan JavaScript di halaman"""
+        raise NotImplementedError
+
+    def execute_async_script(self, script, *args, timeout=None):
+        """Jalankan JavaScript async; script memanggil argumen terakhir (callback) dengan hasilnya"""
+        raise NotImplementedError
+
+    def handle_dialog(self, timeout, accept=True):
+        """Tunggu dialog alert, accept/dismiss, kembalikan teksnya (None jika tidak ada)"""
+        raise NotImplementedError
+
+    def screenshot(self, path):
+        """Simpan screenshot ke file"""
+        raise NotImplementedError
+
+    def snapshot_dom(self, regions, roles):
+        """Snapshot DOM yang dipangkas: HTML tiap region dan elemen yang cocok dengan selector tiap role.
+
+        regions: {nama: ([selector, ...], selector_ancestor atau None)}
+        roles: {role: [selector, ...]}
+        Hasil: {url, regions: {nama: html/None}, elements: {id: info},
+        matches: {role: {selector: [id, ...] atau None jika selector tidak valid}}}
+        """
+        return self.execute_script(DOM_SNAPSHOT_SCRIPT, regions, roles)
+
+    def screenshot_png(self):
+        """Ambil screenshot sebagai bytes PNG (penulisan file diserahkan ke pemanggil)"""
+        raise NotImplementedError
+
+    def process_id(self):
+        """PID proses akar browser (untuk mengukur RSS process tree), None jika tidak ada"""
+        return None
+
+    def set_implicit_wait(self, seconds):
+        """Atur implicit wait pencarian elemen (opsional per backend)"""
+
+    def now(self):
+        """Waktu monotonic backend (detik)"""
+        return time.monotonic()
+
+    def sleep(self, seconds):
+        """Jeda di antara langkah flow"""
+        time.sleep(seconds)
+
+    def find_first(self, selector, visible=True, enabled=False):
+        """Elemen pertama yang cocok (dan terlihat/aktif jika diminta), atau None"""
+        for element in self.query_selector_all(selector):
+            if visible and not element.is_displayed():
+                continue
+            if enabled and not element.is_enabled():
+                continue
+            return element
+        return None
+
+    def wait_for(self, condition, timeout, poll=0.1):
+        """Polling condition(backend) sampai bernilai truthy, kembalikan nilainya"""
+        deadline = self.now() + timeout
+        while True:
+            try:
+                value = condition(self)
+            except BackendTimeout:
+                raise
+            except Exception:
+                value = None
+            if value:
+                return value
+            if self.now() >= deadline:
+                raise BackendTimeout(f"Kondisi tidak terpenuhi dalam {timeout} detik")
+            self.sleep(poll)
+
+    def wait_for_selector(self, selector, timeout, poll=0.1, visible=False, enabled=False):
+        """Tunggu elemen yang cocok dengan selector muncul"""
+        return self.wait_for(
+            lambda backend: backend.find_first(selector, visible=visible, enabled=enabled),
+            timeout, poll
+        )
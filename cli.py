@@ -0,0 +1,342 @@
+"""Entry point CLI Ninja Heroes bot.
+
+    python cli.py run       claim untuk akun di config.env
+    python cli.py batch     claim untuk semua akun di accounts.json
+    python cli.py report    ringkasan hasil dari ledger
+    python cli.py ledger    isi ledger per tanggal
+    python cli.py bench     benchmark flow (FakeBackend) dan startup CLI
+    python cli.py capture   diff snapshot DOM terhadap fixture, buat fixture
+    python cli.py soak      soak test kebocoran proses/fd/disk terhadap situs tiruan
+    python cli.py doctor    cek environment
+
+Hanya stdlib yang di-import di level modul. Selenium dan backend browser
+di-import di dalam command yang benar-benar menjalankan browser, sehingga
+command baca-saja (report, ledger, doctor) tetap cepat.
+"""
+import argparse
+import os
+import sys
+import time
+
+
+def _make_backend(name, headless, profile=None):
+    """Buat backend browser; import dilakukan lazy di sini"""
+    if name == "fake":
+        from fake_backend import FakeBackend
+        return FakeBackend()
+    from selenium_backend import SeleniumBackend
+    return SeleniumBackend(headless=headless, profile=profile)
+
+
+def _load_timing(args):
+    """Profil timing; FakeBackend tanpa --timing memakai profil di memori agar latensi virtual tidak ikut dipelajari"""
+    from timing_profile import TimingProfile
+
+    path = args.timing
+    if path is None and args.backend != "fake":
+        path = os.getenv("TIMING_PROFILE", "timing_profile.json")
+    return TimingProfile.load(path)
+
+
+def _run_account(account, args, timing):
+    """Jalankan flow untuk satu akun lalu catat hasilnya ke ledger"""
+    import ledger
+    from ninja_heroes_bot import NinjaHeroesBot
+
+    bot = NinjaHeroesBot(
+        email=account["email"],
+        password=account["password"],
+        server_choice=account["server"],
+        headless=args.headless,
+        backend=_make_backend(args.backend, args.headless, args.profile),
+        timing=timing,
+        event_url=args.event_url
+    )
+    bot.use_fast_login = not args.no_fast_login
+    if args.capture:
+        from page_capture import PageCapture
+        bot.page_capture = PageCapture(args.capture, account["email"])
+    started = time.monotonic()
+    ok = bot.run()
+    ledger.append(
+        ledger.make_record(account["email"], account["server"], bot.last_status or "failed",
+                           time.monotonic() - started, backend=args.backend, **bot.result_fields()),
+        args.ledger
+    )
+    return ok
+
+
+def cmd_run(args):
+    from dotenv import load_dotenv
+    from accounts import account_from_env
+
+    load_dotenv(args.config)
+    account = account_from_env()
+
+    # ✅ Validasi environment variables
+    if account is None:
+        print("❌ Error: EMAIL, PASSWORD, dan SERVER harus diset di config.env")
+        print("📝 Copy config.env.example menjadi config.env dan isi dengan data Anda")
+        return 1
+
+    # Cek apakah masih menggunakan nilai default/example
+    if account["email"] == "your_email@example.com":
+        print("❌ Error: Silakan ganti EMAIL di config.env dengan email asli Anda")
+        return 1
+
+    success = _run_account(account, args, _load_timing(args))
+
+    if success:
+        print("✅ Bot berhasil dijalankan!")
+        return 0
+    print("❌ Bot gagal dijalankan, periksa log untuk detail error")
+    return 1
+
+
+def cmd_batch(args):
+    import ledger
+    from accounts import load_accounts
+
+    accounts = load_accounts(args.accounts)
+    if args.skip_claimed:
+        done = ledger.claimed_emails(path=args.ledger)
+        skipped = [a for a in accounts if a["email"] in done]
+        accounts = [a for a in accounts if a["email"] not in done]
+        if skipped:
+            print(f"⏭️ {len(skipped)} akun sudah selesai hari ini, dilewati")
+
+    timing = _load_timing(args)
+    if args.pipeline:
+        return _run_pipeline(accounts, args, timing)
+
+    failed = []
+    for i, account in enumerate(accounts, 1):
+        print(f"▶️ [{i}/{len(accounts)}] {account['email']}")
+        if not _run_account(account, args, timing):
+            failed.append(account["email"])
+
+    print(f"✅ {len(accounts) - len(failed)} berhasil, ❌ {len(failed)} gagal")
+    for email in failed:
+        print(f"   - {email}")
+    return 1 if failed else 0
+
+
+def _parse_depth(values):
+    """Parse --depth STAGE=N menjadi dict"""
+    from pipeline import STAGES
+
+    depth = {}
+    for value in values or []:
+        stage, _, number = value.partition("=")
+        if stage not in STAGES or not number.isdigit() or int(number) < 1:
+            raise SystemExit(f"❌ --depth tidak valid: {value} (format STAGE=N, stage: {', '.join(STAGES)})")
+        depth[stage] = int(number)
+    return depth
+
+
+def _run_pipeline(accounts, args, timing):
+    """Batch dengan launch/claim/teardown yang tumpang tindih antar akun"""
+    from pipeline import PipelineRunner, format_stats
+
+    runner = PipelineRunner(
+        lambda: _make_backend(args.backend, args.headless, args.profile),
+        launch_workers=args.launch_workers,
+        claim_workers=args.claim_workers,
+        teardown_workers=args.teardown_workers,
+        depth=_parse_depth(args.depth),
+        timing=timing,
+        ledger_path=args.ledger,
+        backend_name=args.backend,
+        capture_dir=args.capture,
+        event_url=args.event_url,
+        fast_login=not args.no_fast_login,
+    )
+    results = runner.run(accounts)
+    failed = [r["email"] for r in results if not r["ok"]]
+
+    print(f"✅ {len(results) - len(failed)} berhasil, ❌ {len(failed)} gagal")
+    for email in failed:
+        print(f"   - {email}")
+    print(format_stats(runner.stats()))
+    return 1 if failed else 0
+
+
+def cmd_report(args):
+    import report
+    return report.run(args, args.ledger)
+
+
+def cmd_ledger(args):
+    import datetime
+    import ledger
+
+    date = args.date or datetime.date.today().isoformat()
+    records = ledger.records_for_date(date, args.ledger)
+    if args.email:
+        records = [r for r in records if r.get("email") == args.email]
+
+    # Status terakhir per akun pada tanggal itu
+    latest = {}
+    for record in records:
+        latest[record["email"]] = record
+
+    print(f"📒 Ledger {date}: {len(latest)} akun, {len(records)} run")
+    for email, record in sorted(latest.items()):
+        print(f"  {record['ts']}  {record['status']:<10} {record['duration']:>7.1f}s  {email}  ({record.get('server')})")
+    return 0
+
+
+def cmd_bench(args):
+    import bench
+    return bench.main(args.bench_args)
+
+
+def cmd_capture(args):
+    import page_capture
+    return page_capture.main(args.capture_args)
+
+
+def cmd_soak(args):
+    import soak
+    return soak.main(args.soak_args)
+
+
+def cmd_doctor(args):
+    import importlib.util
+    import json
+    import shutil
+
+    problems = 0
+
+    def check(ok, message, failure=None, fatal=True):
+        nonlocal problems
+        if ok:
+            print(f"✅ {message}")
+        elif fatal:
+            problems += 1
+            print(f"❌ {failure or message}")
+        else:
+            print(f"⚠️ {failure or message}")
+
+    check(sys.version_info >= (3, 8), f"Python {sys.version.split()[0]} (minimal 3.8)")
+    for module, package in (("selenium", "selenium"), ("dotenv", "python-dotenv")):
+        check(importlib.util.find_spec(module) is not None, f"Modul {module} terpasang",
+              f"Modul {module} belum terpasang (pip install {package})")
+
+    browsers = [name for name in ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+                if shutil.which(name)]
+    check(bool(browsers), f"Chrome ditemukan: {', '.join(browsers)}", "Chrome tidak ditemukan di PATH", fatal=False)
+    check(bool(shutil.which("chromedriver")), "chromedriver ditemukan di PATH",
+          "chromedriver tidak di PATH (Selenium Manager akan mengunduhnya)", fatal=False)
+
+    check(os.path.exists(args.config), f"{args.config} ditemukan",
+          f"{args.config} tidak ada (perlu untuk command run)", fatal=False)
+    if os.path.exists(args.accounts):
+        from accounts import load_accounts
+        try:
+            check(True, f"{args.accounts}: {len(load_accounts(args.accounts))} akun valid")
+        except (OSError, ValueError) as e:
+            check(False, f"{args.accounts} tidak valid: {e}")
+    else:
+        check(False, "", f"{args.accounts} tidak ada (perlu untuk batch/daemon)", fatal=False)
+
+    if os.path.exists(args.timing):
+        try:
+            with open(args.timing, encoding="utf-8") as f:
+                json.load(f)
+            check(True, f"Profil timing {args.timing} terbaca")
+        except ValueError as e:
+            check(False, "", f"Profil timing {args.timing} rusak: {e}")
+
+    ledger_dir = os.path.dirname(os.path.abspath(args.ledger or "runs.jsonl"))
+    check(os.access(ledger_dir, os.W_OK), f"Direktori ledger bisa ditulis: {ledger_dir}",
+          f"Direktori ledger tidak bisa ditulis: {ledger_dir}")
+
+    return 1 if problems else 0
+
+
+def build_parser():
+    from launch_profiles import PROFILE_NAMES
+
+    parser = argparse.ArgumentParser(prog="cli.py", description="Ninja Heroes daily income bot")
+    parser.add_argument("--ledger", default=os.getenv("RUN_LEDGER"), help="File ledger run (default runs.jsonl)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_browser_options(p):
+        p.add_argument("--backend", choices=["selenium", "fake"], default="selenium")
+        p.add_argument("--headless", action="store_true", help="Jalankan Chrome tanpa jendela")
+        p.add_argument("--profile", choices=PROFILE_NAMES, default=os.getenv("CHROME_PROFILE"),
+                       help="Profil launch Chrome (default: headless-new jika --headless, selain itu debug)")
+        p.add_argument("--timing",
+                       help="File profil timing adaptif (default timing_profile.json / env TIMING_PROFILE, "
+                            "kecuali --backend fake)")
+        p.add_argument("--event-url", default=os.getenv("EVENT_URL"),
+                       help="URL halaman daily event (mis. mock_site.py untuk uji lokal)")
+        p.add_argument("--capture", metavar="DIR", default=os.getenv("PAGE_CAPTURE"),
+                       help="Simpan snapshot DOM tiap step ke DIR (lihat page_capture.py)")
+        p.add_argument("--no-fast-login", action="store_true",
+                       help="Login step-by-step saja, tanpa script login satu round-trip")
+
+    p = sub.add_parser("run", help="Claim untuk akun di config.env")
+    p.add_argument("--config", default="config.env")
+    add_browser_options(p)
+    p.set_defaults(func=cmd_run)
+
+    p = sub.add_parser("batch", help="Claim untuk semua akun di file akun")
+    p.add_argument("--accounts", default="accounts.json")
+    p.add_argument("--skip-claimed", action="store_true", help="Lewati akun yang sudah selesai hari ini")
+    p.add_argument("--pipeline", action="store_true",
+                   help="Siapkan browser akun berikutnya selagi akun sekarang claim")
+    p.add_argument("--launch-workers", type=int, default=1, help="Worker stage launch (mode pipeline)")
+    p.add_argument("--claim-workers", type=int, default=1, help="Worker stage claim (mode pipeline)")
+    p.add_argument("--teardown-workers", type=int, default=1, help="Worker stage teardown (mode pipeline)")
+    p.add_argument("--depth", action="append", metavar="STAGE=N",
+                   help="Kedalaman antrean per stage, mis. --depth claim=2 (mode pipeline)")
+    add_browser_options(p)
+    p.set_defaults(func=cmd_batch)
+
+    p = sub.add_parser("report", help="Laporan fleet dari ledger (tabel, JSON atau HTML)")
+    import report
+    report.add_arguments(p)
+    p.set_defaults(func=cmd_report)
+
+    p = sub.add_parser("ledger", help="Isi ledger per tanggal")
+    p.add_argument("--date", help="Tanggal (YYYY-MM-DD), default hari ini")
+    p.add_argument("--email", help="Filter satu akun")
+    p.set_defaults(func=cmd_ledger)
+
+    p = sub.add_parser("bench", help="Benchmark flow dan startup CLI (argumen diteruskan ke bench.py)")
+    p.add_argument("bench_args", nargs=argparse.REMAINDER)
+    p.set_defaults(func=cmd_bench, passthrough="bench_args")
+
+    p = sub.add_parser("capture", help="Diff snapshot DOM / buat fixture (argumen diteruskan ke page_capture.py)")
+    p.add_argument("capture_args", nargs=argparse.REMAINDER)
+    p.set_defaults(func=cmd_capture, passthrough="capture_args")
+
+    p = sub.add_parser("soak", help="Soak test kebocoran jangka panjang (argumen diteruskan ke soak.py)")
+    p.add_argument("soak_args", nargs=argparse.REMAINDER)
+    p.set_defaults(func=cmd_soak, passthrough="soak_args")
+
+    p = sub.add_parser("doctor", help="Cek environment")
+    p.add_argument("--config", default="config.env")
+    p.add_argument("--accounts", default="accounts.json")
+    p.add_argument("--timing", default=os.getenv("TIMING_PROFILE", "timing_profile.json"))
+    p.set_defaults(func=cmd_doctor)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+    # REMAINDER tidak menangkap argumen yang diawali opsi (mis. `bench --skip-flow`)
+    passthrough = getattr(args, "passthrough", None)
+    if extra:
+        if passthrough is None:
+            parser.error(f"unrecognized arguments: {' '.join(extra)}")
+        setattr(args, passthrough, extra + getattr(args, passthrough))
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
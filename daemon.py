@@ -0,0 +1,446 @@
+"""Daemon worker Ninja Heroes dengan pool browser yang tetap hangat.
+
+Browser tiap worker dijalankan saat pool start (sebelum job pertama) lalu
+dipakai ulang antar akun (cookie dan storage dihapus lewat reset_session), sehingga
+claim on-demand tidak perlu membayar startup proses dan Chrome.
+
+API lokal (JSON, default http://127.0.0.1:8765):
+    GET  /status        kedalaman antrean, status worker, throughput & latensi
+    GET  /jobs          daftar job terakhir
+    GET  /jobs/<id>     status satu job
+    POST /jobs          {"email": ...} akun dari daftar, {"all": true} semua akun,
+                        atau {"email", "password", "server"} akun ad-hoc
+    POST /reload        baca ulang file akun tanpa restart
+    POST /drain         selesaikan antrean, tutup browser, hentikan daemon
+"""
+import argparse
+import collections
+import itertools
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import ledger
+from accounts import load_accounts
+from launch_profiles import PROFILE_NAMES
+from metrics import ThroughputWindow
+from ninja_heroes_bot import NinjaHeroesBot, unique_screenshot_path
+from timing_profile import TimingProfile
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+def make_backend_factory(name, headless=True, profile=None):
+    """Factory backend berdasarkan nama: selenium atau fake"""
+    if name == "fake":
+        from fake_backend import FakeBackend
+        return FakeBackend
+    if name == "selenium":
+        from selenium_backend import SeleniumBackend
+        return lambda: SeleniumBackend(headless=headless, profile=profile)
+    raise ValueError(f"Backend tidak dikenal: {name}")
+
+
+class PoolDraining(Exception):
+    """Pool sedang di-drain dan tidak menerima job baru"""
+
+
+class WorkerPool:
+    """Pool worker dengan browser hangat dan antrean job akun"""
+
+    def __init__(self, backend_factory, workers=2, accounts_path=None, max_jobs_kept=1000, timing=None,
+                 ledger_path=None, event_url=None, backend_name="selenium", max_screenshots=None):
+        self.backend_factory = backend_factory
+        # Dicatat di ledger; run "fake" tidak dihitung sebagai claim sungguhan
+        self.backend_name = backend_name
+        self.event_url = event_url
+        self.ledger_path = ledger_path
+        # Profil timing dipakai bersama semua worker
+        self.timing = timing if timing is not None else TimingProfile()
+        self.worker_count = workers
+        self.accounts_path = accounts_path
+        self.accounts = {}
+        self.queue = queue.Queue()
+        self.jobs = collections.OrderedDict()
+        self.max_jobs_kept = max_jobs_kept
+        self.throughput = ThroughputWindow()
+        self.draining = False
+        self.started_at = None
+        self.completed = 0
+        self.failed = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        # Nama file screenshot dipilih lalu ditulis secara atomik terhadap worker lain
+        self._screenshot_lock = threading.Lock()
+        # Screenshot yang ditulis pool ini, yang terlama dihapus jika melewati max_screenshots (None = tanpa batas)
+        self.max_screenshots = max_screenshots
+        self._screenshots = collections.deque()
+        self._threads = []
+        self._worker_state = {}
+
+        if accounts_path:
+            self.reload_accounts()
+
+    def start(self):
+        self.started_at = time.monotonic()
+        for index in range(self.worker_count):
+            thread = threading.Thread(target=self._worker_loop, args=(index,), name=f"worker-{index}", daemon=True)
+            self._worker_state[index] = "starting"
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"🚀 Pool dimulai dengan {self.worker_count} worker")
+
+    def reload_accounts(self):
+        """Baca ulang file akun; job yang sudah antre tidak terpengaruh"""
+        accounts = load_accounts(self.accounts_path)
+        with self._lock:
+            self.accounts = {account["email"]: account for account in accounts}
+        logger.info(f"🔄 {len(accounts)} akun dimuat dari {self.accounts_path}")
+        return len(accounts)
+
+    def enqueue(self, account):
+        """Tambahkan akun ke antrean, kembalikan data job"""
+        with self._lock:
+            if self.draining:
+                raise PoolDraining("Pool sedang di-drain")
+            job = {
+                "id": next(self._ids),
+                "email": account["email"],
+                "server": account["server"],
+                "status": "queued",
+                "result": None,
+                "error": None,
+                "worker": None,
+                "queued_at": time.time(),
+                "started_at": None,
+                "finished_at": None,
+                "duration": None,
+            }
+            self.jobs[job["id"]] = job
+            while len(self.jobs) > self.max_jobs_kept:
+                oldest_id, oldest = next(iter(self.jobs.items()))
+                if oldest["status"] in ("queued", "running"):
+                    break
+                del self.jobs[oldest_id]
+            # Masih di dalam lock: drain() tidak bisa menyisipkan _STOP sebelum job ini
+            self.queue.put((job, account))
+            return dict(job)
+
+    def enqueue_email(self, email):
+        with self._lock:
+            account = self.accounts.get(email)
+        if account is None:
+            raise KeyError(email)
+        return self.enqueue(account)
+
+    def enqueue_all(self):
+        with self._lock:
+            accounts = list(self.accounts.values())
+        return [self.enqueue(account) for account in accounts]
+
+    def get_job(self, job_id):
+        with self._lock:
+            job = self.jobs.get(job_id)
+            return dict(job) if job else None
+
+    def list_jobs(self, limit=100):
+        with self._lock:
+            return [dict(job) for job in list(self.jobs.values())[-limit:]]
+
+    def drain(self):
+        """Tolak job baru; worker berhenti setelah antrean yang ada selesai"""
+        with self._lock:
+            if self.draining:
+                return
+            self.draining = True
+        for _ in self._threads:
+            self.queue.put(_STOP)
+        logger.info("🛑 Drain dimulai, menunggu antrean selesai...")
+
+    def wait(self, timeout=None):
+        for thread in self._threads:
+            thread.join(timeout)
+        self._save_timing()
+
+    def status(self):
+        with self._lock:
+            counts = collections.Counter(job["status"] for job in self.jobs.values())
+            workers = dict(self._worker_state)
+            accounts = len(self.accounts)
+            completed, failed = self.completed, self.failed
+        return {
+            "queue_depth": counts.get("queued", 0),
+            "draining": self.draining,
+            "accounts_loaded": accounts,
+            "workers": {str(index): state for index, state in workers.items()},
+            "jobs": dict(counts),
+            "completed_total": completed,
+            "failed_total": failed,
+            "uptime_seconds": time.monotonic() - self.started_at if self.started_at else 0.0,
+            "throughput": self.throughput.snapshot(),
+        }
+
+    def _set_worker_state(self, index, state):
+        with self._lock:
+            self._worker_state[index] = state
+
+    def _save_timing(self, min_interval=0.0):
+        try:
+            self.timing.save(min_interval=min_interval)
+        except OSError as e:
+            logger.warning(f"⚠️ Gagal menyimpan profil timing: {e}")
+
+    def _warm_backend(self, index):
+        """Jalankan browser sebelum job datang; None jika gagal (dicoba lagi saat job pertama)"""
+        self._set_worker_state(index, "warming")
+        try:
+            backend = self.backend_factory()
+            backend.start()
+            return backend
+        except Exception as e:
+            logger.error(f"❌ Worker {index}: gagal menyiapkan browser: {e}")
+            return None
+
+    def _write_screenshot(self, filename, png):
+        with self._screenshot_lock:
+            path = unique_screenshot_path(filename)
+            with open(path, "wb") as f:
+                f.write(png)
+            self._screenshots.append(path)
+            expired = []
+            while self.max_screenshots and len(self._screenshots) > self.max_screenshots:
+                expired.append(self._screenshots.popleft())
+        logger.info(f"📸 Screenshot disimpan: {path}")
+        for old_path in expired:
+            try:
+                os.remove(old_path)
+            except OSError as e:
+                logger.warning(f"⚠️ Gagal menghapus screenshot lama {old_path}: {e}")
+
+    def _worker_loop(self, index):
+        backend = None
+        try:
+            while True:
+                fresh = False
+                if backend is None:
+                    backend = self._warm_backend(index)
+                    fresh = backend is not None
+                self._set_worker_state(index, "idle")
+                item = self.queue.get()
+                if item is _STOP:
+                    break
+                job, account = item
+                backend = self._run_job(index, backend, job, account, fresh)
+        finally:
+            if backend is not None:
+                try:
+                    backend.quit()
+                except Exception as e:
+                    logger.warning(f"Worker {index}: gagal menutup browser: {e}")
+            self._set_worker_state(index, "stopped")
+
+    def _run_job(self, index, backend, job, account, fresh=False):
+        """Jalankan satu job; kembalikan backend yang masih bisa dipakai (atau None)"""
+        self._set_worker_state(index, f"running job {job['id']}")
+        started = time.monotonic()
+        with self._lock:
+            job.update(status="running", worker=index, started_at=time.time())
+
+        ok = False
+        error = None
+        bot = None
+        try:
+            if backend is None:
+                backend = self.backend_factory()
+                backend.start()
+            elif not fresh:
+                backend.reset_session()
+
+            bot = NinjaHeroesBot(
+                email=account["email"],
+                password=account["password"],
+                server_choice=account["server"],
+                backend=backend,
+                timing=self.timing,
+                event_url=self.event_url
+            )
+            bot.screenshot_sink = self._write_screenshot
+            ok = bot.run_tasks()
+        except Exception as e:
+            error = str(e)
+            logger.error(f"❌ Worker {index}: job {job['id']} error, browser akan dibuat ulang: {e}")
+            # Browser dalam state tidak jelas, jangan dipakai ulang
+            if backend is not None:
+                try:
+                    backend.quit()
+                except Exception:
+                    pass
+            backend = None
+
+        duration = time.monotonic() - started
+        self.throughput.record(duration)
+        self._save_timing(min_interval=30)
+        status = bot.last_status if bot is not None and bot.last_status else "failed"
+        extra = bot.result_fields() if bot is not None else {}
+        try:
+            ledger.append(ledger.make_record(account["email"], account["server"], status, duration,
+                                             backend=self.backend_name, **extra), self.ledger_path)
+        except OSError as e:
+            logger.warning(f"⚠️ Gagal menulis ledger: {e}")
+        with self._lock:
+            self.completed += 1
+            self.failed += not ok
+            job.update(
+                status="success" if ok else "failed",
+                result=ok,
+                error=error,
+                finished_at=time.time(),
+                duration=duration,
+            )
+        return backend
+
+
+class ControlHandler(BaseHTTPRequestHandler):
+    """Handler HTTP JSON untuk mengontrol WorkerPool (server.pool)"""
+
+    @property
+    def pool(self):
+        return self.server.pool
+
+    def log_message(self, format, *args):
+        logger.debug("API " + format % args)
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        payload = json.loads(self.rfile.read(length))
+        if not isinstance(payload, dict):
+            raise ValueError("body harus objek JSON")
+        return payload
+
+    def do_GET(self):
+        path = self.path.rstrip("/")
+        if path == "/status":
+            return self._send(200, self.pool.status())
+        if path == "/jobs":
+            return self._send(200, {"jobs": self.pool.list_jobs()})
+        if path.startswith("/jobs/"):
+            try:
+                job = self.pool.get_job(int(path.split("/")[-1]))
+            except ValueError:
+                job = None
+            if job is None:
+                return self._send(404, {"error": "job tidak ditemukan"})
+            return self._send(200, job)
+        return self._send(404, {"error": "endpoint tidak dikenal"})
+
+    def do_POST(self):
+        path = self.path.rstrip("/")
+        try:
+            payload = self._read_json()
+        except ValueError:
+            return self._send(400, {"error": "body harus objek JSON"})
+
+        try:
+            if path == "/jobs":
+                if payload.get("all"):
+                    return self._send(202, {"jobs": self.pool.enqueue_all()})
+                if payload.get("password") and payload.get("server"):
+                    if not payload.get("email"):
+                        return self._send(400, {"error": "akun ad-hoc butuh email"})
+                    return self._send(202, self.pool.enqueue(payload))
+                if payload.get("email"):
+                    return self._send(202, self.pool.enqueue_email(payload["email"]))
+                return self._send(400, {"error": "butuh email, all, atau email+password+server"})
+            if path == "/reload":
+                if not self.pool.accounts_path:
+                    return self._send(400, {"error": "daemon dijalankan tanpa file akun"})
+                return self._send(200, {"accounts_loaded": self.pool.reload_accounts()})
+            if path == "/drain":
+                self.pool.drain()
+                self.server.on_drain()
+                return self._send(202, {"draining": True})
+        except PoolDraining as e:
+            return self._send(409, {"error": str(e)})
+        except KeyError as e:
+            return self._send(404, {"error": f"akun tidak ada di daftar: {e}"})
+        except (OSError, ValueError) as e:
+            return self._send(400, {"error": str(e)})
+        return self._send(404, {"error": "endpoint tidak dikenal"})
+
+
+def serve(pool, host="127.0.0.1", port=8765):
+    """Jalankan API kontrol sampai pool selesai di-drain"""
+    server = ThreadingHTTPServer((host, port), ControlHandler)
+    server.pool = pool
+
+    def shutdown_after_drain():
+        pool.wait()
+        server.shutdown()
+
+    server.on_drain = lambda: threading.Thread(target=shutdown_after_drain, daemon=True).start()
+
+    pool.start()
+    logger.info(f"🌐 API kontrol berjalan di http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pool.drain()
+        pool.wait()
+    finally:
+        server.server_close()
+    logger.info("🔚 Daemon berhenti")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Daemon worker Ninja Heroes dengan API kontrol lokal")
+    parser.add_argument("--accounts", help="File JSON daftar akun")
+    parser.add_argument("--workers", type=int, default=2, help="Jumlah browser hangat")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--backend", choices=["selenium", "fake"], default="selenium")
+    parser.add_argument("--show-browser", action="store_true", help="Jalankan Chrome tanpa headless")
+    parser.add_argument("--profile", choices=PROFILE_NAMES, default=os.getenv("CHROME_PROFILE"),
+                        help="Profil launch Chrome (default: headless-new, atau debug dengan --show-browser)")
+    parser.add_argument("--timing", help="File profil timing adaptif (default timing_profile.json, "
+                                         "kecuali --backend fake)")
+    parser.add_argument("--ledger", help="File ledger run (default runs.jsonl / env RUN_LEDGER)")
+    parser.add_argument("--event-url", default=os.getenv("EVENT_URL"),
+                        help="URL halaman daily event (mis. mock_site.py untuk uji lokal)")
+    parser.add_argument("--max-screenshots", type=int, default=1000,
+                        help="Simpan paling banyak N screenshot terbaru, yang lama dihapus (0 = tanpa batas)")
+    args = parser.parse_args(argv)
+    # Latensi virtual FakeBackend tidak boleh melatih profil timing Chrome
+    timing_path = args.timing or (None if args.backend == "fake" else "timing_profile.json")
+
+    pool = WorkerPool(
+        make_backend_factory(args.backend, headless=not args.show_browser, profile=args.profile),
+        workers=args.workers,
+        accounts_path=args.accounts,
+        timing=TimingProfile.load(timing_path),
+        ledger_path=args.ledger,
+        event_url=args.event_url,
+        backend_name=args.backend,
+        max_screenshots=args.max_screenshots,
+    )
+    serve(pool, args.host, args.port)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
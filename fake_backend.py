@@ -0,0 +1,427 @@
+import copy
+import json
+import random
+import re
+import time
+
+from browser_backend import BrowserBackend, BackendTimeout, ClickIntercepted
+
+# Fixture bawaan yang meniru alur halaman daily event:
+# tombol login -> modal LoginForm -> grid hadiah -> popup selserver -> alert -> notifikasi.
+# Selector dicocokkan secara persis (string sama), bukan diparse sebagai CSS/XPath.
+DEFAULT_FIXTURE = {
+    "elements": {
+        "body": {"selectors": ["body"]},
+        "login_button": {
+            "selectors": [
+                "a.btn.btn-login.login-shinobi.loginMethod",
+                ".loginMethod",
+                ".login-shinobi",
+            ],
+            "text": "LOGIN",
+            "on_click": {"show": ["login_form", "email", "password", "login_submit"], "delay": 0.1},
+        },
+        "login_form": {"selectors": ["#LoginForm", ".modal.fade.in[role='dialog']"], "visible": False},
+        "email": {
+            "selectors": ["#LoginForm input[name='email']", ".modal input[name='email']"],
+            "visible": False,
+        },
+        "password": {
+            "selectors": ["#LoginForm input[type='password']", ".modal input[type='password']"],
+            "visible": False,
+        },
+        "login_submit": {
+            "selectors": ["#LoginForm #form-login-btnSubmit", "#form-login-btnSubmit"],
+            "text": "SUBMIT",
+            "visible": False,
+            "on_click": {
+                "hide": ["login_button", "login_form", "email", "password", "login_submit"],
+                "show": ["reward"],
+                "delay": 1.5,
+                "login": True,
+            },
+        },
+        "reward_grid": {"selectors": [".reward-content", ".reward-list"]},
+        "reward": {
+            "selectors": [".reward-star", ".reward-content.dailyClaim .reward-star"],
+            "visible": False,
+            "on_click": {"show": ["server_select", "server_submit"], "delay": 0.3},
+        },
+        "server_select": {
+            "selectors": ["select[name='selserver']", "select.form-control[name='selserver']"],
+            "visible": False,
+            "options": [
+                ["", "-- Choose Server --"],
+                ["1", "Server 1 - EXAMPLE"],
+                ["39", "Server 39 - SSINJAA"],
+            ],
+        },
+        "server_submit": {
+            "selectors": ["#form-server-btnSubmit", "button#form-server-btnSubmit"],
+            "text": "SUBMIT",
+            "visible": False,
+            "on_click": {
+                "hide": ["reward", "server_select", "server_submit"],
+                "show": ["success"],
+                "alert": "Reward berhasil diklaim",
+                "delay": 0.8,
+            },
+        },
+        "success": {
+            "selectors": [".alert-success"],
+            "text": "Berhasil claim hadiah",
+            "visible": False,
+            "attached": False,
+        },
+    }
+}
+
+# Latensi simulasi per operasi (detik, waktu virtual)
+DEFAULT_LATENCY = {
+    "start": 1.5,
+    "quit": 0.3,
+    "navigate": 1.2,
+    "query": 0.01,
+    "click": 0.05,
+    "type": 0.05,
+    "select": 0.03,
+    "script": 0.01,
+    "dialog": 0.02,
+    "screenshot": 0.1,
+}
+
+PNG_HEADER = b"\x89PNG\r\n\x1a\n"
+
+
+def script_name(script):
+    """Nama script dari komentar penanda di awal script: /* script: nama */"""
+    match = re.match(r"\s*/\*\s*script:\s*([\w-]+)", script)
+    return match.group(1) if match else None
+
+
+def load_fixture(path):
+    """Baca fixture DOM dari file JSON"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class FakeElement:
+    """Handle elemen untuk FakeBackend"""
+
+    def __init__(self, backend, element_id):
+        self.backend = backend
+        self.element_id = element_id
+
+    @property
+    def _spec(self):
+        return self.backend.elements[self.element_id]
+
+    @property
+    def text(self):
+        return self._spec.get("text", "")
+
+    def is_displayed(self):
+        return self.backend.is_visible(self.element_id)
+
+    def is_enabled(self):
+        return self._spec.get("enabled", True)
+
+    def get_attribute(self, name):
+        if name == "value":
+            return self._spec.get("value", "")
+        return self._spec.get("attrs", {}).get(name)
+
+    def __repr__(self):
+        return f"<FakeElement {self.element_id}>"
+
+
+class FakeBackend(BrowserBackend):
+    """Backend in-memory berbasis fixture DOM dengan jam virtual.
+
+    Semua latensi dan sleep hanya memajukan jam virtual, sehingga flow
+    lengkap bisa dijalankan ribuan kali per detik tanpa Chrome. Dengan
+    time_scale > 0 jam virtual juga ditunggu secara nyata (dikali
+    time_scale), berguna untuk mengukur runner yang berjalan paralel.
+    screenshot_size > 0 membuat screenshot berukuran sekian byte agar
+    pemakaian disk mendekati screenshot Chrome asli.
+    """
+
+    def __init__(self, fixture=None, latency=None, jitter=0.0, seed=None, write_screenshots=False,
+                 time_scale=0.0, screenshot_size=0):
+        self.fixture = fixture if fixture is not None else DEFAULT_FIXTURE
+        self.latency = dict(DEFAULT_LATENCY)
+        if isinstance(latency, (int, float)):
+            self.latency = {op: float(latency) for op in self.latency}
+        elif latency:
+            self.latency.update(latency)
+        self.jitter = jitter
+        self.random = random.Random(seed)
+        self.write_screenshots = write_screenshots
+        self.time_scale = time_scale
+        self.screenshot_size = screenshot_size
+        self.clock = 0.0
+        self.implicit_wait = 0.0
+        self.calls = {}
+        self.started = False
+        # Simulasi script async per nama (lihat script_name); bisa diganti untuk skenario gagal
+        self.script_handlers = {"fast_login": self._fast_login_script}
+        # Efek on_click login ("login": true) yang bertahan antar navigate seperti cookie sesi
+        self.session = None
+        self._reset_dom()
+
+    def _reset_dom(self):
+        self.elements = copy.deepcopy(self.fixture["elements"])
+        self._selector_index = {}
+        for element_id, spec in self.elements.items():
+            for selector in spec.get("selectors", []):
+                self._selector_index.setdefault(selector, []).append(element_id)
+        # element_id -> waktu virtual saat elemen mulai terlihat
+        self._visible_at = {}
+        for element_id, spec in self.elements.items():
+            if "appear_after" in spec:
+                # Elemen yang baru muncul sekian detik setelah halaman dimuat (hari lambat)
+                self._visible_at[element_id] = self.clock + spec["appear_after"]
+            elif spec.get("visible", True):
+                self._visible_at[element_id] = 0.0
+        # element_id -> waktu virtual saat elemen disembunyikan (on_click hide)
+        self._hidden_at = {}
+        if self.session:
+            # Masih login: halaman langsung tampil dalam keadaan setelah login
+            self._apply(self.session, self.clock)
+        self._pending_alert = None
+        self.current_url = None
+
+    def _op(self, name):
+        self.calls[name] = self.calls.get(name, 0) + 1
+        cost = self.latency.get(name, 0.0)
+        if self.jitter and cost:
+            cost *= 1 + self.random.uniform(-self.jitter, self.jitter)
+        self._advance(cost)
+
+    def _advance(self, seconds):
+        if seconds <= 0:
+            return
+        self.clock += seconds
+        if self.time_scale:
+            time.sleep(seconds * self.time_scale)
+
+    def is_visible(self, element_id):
+        shown_at = self._visible_at.get(element_id)
+        hidden_at = self._hidden_at.get(element_id)
+        return shown_at is not None and shown_at <= self.clock and (hidden_at is None or hidden_at > self.clock)
+
+    def _is_attached(self, element_id):
+        spec = self.elements[element_id]
+        return spec.get("attached", True) or self.is_visible(element_id)
+
+    def start(self):
+        self._op("start")
+        self.started = True
+
+    def quit(self):
+        self._op("quit")
+        self.started = False
+
+    def reset_session(self):
+        self._op("navigate")
+        self.session = None
+        self._reset_dom()
+
+    def navigate(self, url):
+        self._op("navigate")
+        self._reset_dom()
+        self.current_url = url
+
+    def set_implicit_wait(self, seconds):
+        self.implicit_wait = seconds
+
+    def query_selector_all(self, selector):
+        self._op("query")
+        element_ids = self._selector_index.get(selector, [])
+        if not any(self._is_attached(element_id) for element_id in element_ids):
+            # Implicit wait: tunggu elemen yang akan muncul dalam batas implicit wait,
+            # selector yang tetap kosong membayar implicit wait penuh
+            pending = [self._visible_at[element_id] for element_id in element_ids
+                       if self._visible_at.get(element_id, float("inf")) <= self.clock + self.implicit_wait]
+            self._advance(min(pending) - self.clock if pending else self.implicit_wait)
+        return [FakeElement(self, element_id) for element_id in element_ids if self._is_attached(element_id)]
+
+    def click(self, element, method="native"):
+        self._op("click")
+        spec = self.elements[element.element_id]
+        if not element.is_displayed():
+            raise RuntimeError(f"Elemen {element.element_id} tidak bisa diinteraksi")
+        if method == "native" and spec.get("intercept"):
+            raise ClickIntercepted(f"Klik pada {element.element_id} tertahan")
+
+        action = spec.get("on_click")
+        if not action:
+            return
+        if action.get("login"):
+            self.session = action
+        self._apply(action, self.clock + action.get("delay", 0.0))
+
+    def _apply(self, action, ready_at):
+        # Seperti mock_site.py: hide dan show diterapkan bersamaan setelah delay (respon server)
+        for element_id in action.get("hide", []):
+            self._hidden_at[element_id] = ready_at
+        for element_id in action.get("show", []):
+            self._visible_at[element_id] = ready_at
+            self._hidden_at.pop(element_id, None)
+        if "alert" in action:
+            self._pending_alert = (ready_at, action["alert"])
+
+    def type_text(self, element, text):
+        self._op("type")
+        self.elements[element.element_id]["value"] = text
+
+    def list_options(self, element):
+        self._op("query")
+        return [tuple(option) for option in self.elements[element.element_id].get("options", [])]
+
+    def select_option(self, element, text=None, value=None):
+        self._op("select")
+        for option_value, option_text in self.list_options(element):
+            if (text is not None and option_text == text) or (text is None and option_value == value):
+                self.elements[element.element_id]["value"] = option_value
+                return
+        raise ValueError(f"Option tidak ditemukan: {text or value}")
+
+    def scroll_into_view(self, element):
+        self._op("script")
+
+    def execute_script(self, script, *args):
+        self._op("script")
+        return None
+
+    def execute_async_script(self, script, *args, timeout=None):
+        self._op("script")
+        handler = self.script_handlers.get(script_name(script))
+        if handler is None:
+            raise RuntimeError("Script async tidak disimulasikan oleh FakeBackend")
+        return handler(*args)
+
+    def _find_visible(self, selectors):
+        # Pencarian di dalam halaman: tanpa biaya round trip per selector
+        for selector in selectors:
+            for element_id in self._selector_index.get(selector, []):
+                spec = self.elements[element_id]
+                if self.is_visible(element_id) and spec.get("enabled", True):
+                    return element_id, selector
+        return None, None
+
+    def _fast_login_script(self, options):
+        """Simulasi FAST_LOGIN_SCRIPT: isi field, klik submit, tunggu respon (delay on_click)"""
+        started = self.clock
+        deadline = self.clock + options["field_timeout_ms"] / 1000.0
+        while True:
+            found = {key: self._find_visible(options[f"{key}_selectors"]) for key in ("email", "password", "submit")}
+            missing = [key for key, (element_id, _) in found.items() if element_id is None]
+            if not missing or self.clock >= deadline:
+                break
+            self._advance(min(0.05, deadline - self.clock))
+        if missing:
+            return {"ok": False, "stage": missing[0], "message": "elemen form login tidak ditemukan",
+                    "elapsed_ms": int((self.clock - started) * 1000)}
+
+        self.elements[found["email"][0]]["value"] = options["email"]
+        self.elements[found["password"][0]]["value"] = options["password"]
+        submit_id = found["submit"][0]
+        action = self.elements[submit_id].get("on_click") or {}
+        delay = action.get("delay", 0.0)
+        # Seperti di browser, submit diklik sebelum menunggu respon: saat timeout request login tetap berjalan
+        self.click(FakeElement(self, submit_id), method="script")
+        if delay > options["timeout_ms"] / 1000.0:
+            self._advance(options["timeout_ms"] / 1000.0)
+            return {"ok": False, "stage": "timeout", "message": "respon login tidak diterima",
+                    "elapsed_ms": int((self.clock - started) * 1000)}
+
+        # Respon XHR diterima saat efek on_click terjadi
+        self._advance(delay)
+        return {"ok": True, "stage": "response", "status": 200, "message": "",
+                "selectors": {key: selector for key, (_, selector) in found.items()},
+                "elapsed_ms": int((self.clock - started) * 1000)}
+
+    def handle_dialog(self, timeout, accept=True):
+        self._op("dialog")
+        if self._pending_alert is None or self._pending_alert[0] > self.clock + timeout:
+            self._advance(timeout)
+            return None
+        ready_at, text = self._pending_alert
+        self._advance(ready_at - self.clock)
+        self._pending_alert = None
+        return text
+
+    def snapshot_dom(self, regions, roles):
+        # Region HTML hanya tersedia jika fixture berasal dari capture (kunci "regions")
+        self._op("script")
+        elements = {}
+
+        def describe(element_id):
+            spec = self.elements[element_id]
+            info = {
+                "tag": spec.get("tag", "div"),
+                "text": spec.get("text", ""),
+                "attrs": dict(spec.get("attrs", {})),
+                "visible": self.is_visible(element_id),
+                "enabled": spec.get("enabled", True),
+            }
+            if "options" in spec:
+                info["options"] = [list(option) for option in spec["options"]]
+            elements[element_id] = info
+            return element_id
+
+        matches = {
+            role: {
+                selector: [describe(element_id) for element_id in self._selector_index.get(selector, [])
+                           if self._is_attached(element_id)]
+                for selector in selectors
+            }
+            for role, selectors in roles.items()
+        }
+        captured = self.fixture.get("regions", {})
+        return {
+            "url": self.current_url,
+            "regions": {name: captured.get(name) for name in regions},
+            "elements": elements,
+            "matches": matches,
+        }
+
+    def _png(self):
+        # Header PNG, dipadding sampai screenshot_size byte
+        return PNG_HEADER.ljust(self.screenshot_size, b"\0")
+
+    def screenshot(self, path):
+        self._op("screenshot")
+        if self.write_screenshots:
+            with open(path, "wb") as f:
+                f.write(self._png())
+        return True
+
+    def screenshot_png(self):
+        self._op("screenshot")
+        return self._png()
+
+    def now(self):
+        return self.clock
+
+    def sleep(self, seconds):
+        self._advance(seconds)
+
+    def wait_for(self, condition, timeout, poll=0.1):
+        # Seperti SeleniumBackend: implicit wait dimatikan selama polling
+        implicit_wait, self.implicit_wait = self.implicit_wait, 0.0
+        try:
+            return self._poll(condition, timeout, poll)
+        finally:
+            self.implicit_wait = implicit_wait
+
+    def _poll(self, condition, timeout, poll):
+        deadline = self.clock + timeout
+        while True:
+            value = condition(self)
+            if value:
+                return value
+            if self.clock >= deadline:
+                raise BackendTimeout(f"Kondisi tidak terpenuhi dalam {timeout} detik")
+            self._advance(min(deadline, self.clock + poll) - self.clock)
@@ -0,0 +1,98 @@
+"""Profil launch Chrome bernama untuk SeleniumBackend.
+
+Modul ini hanya berisi data (tanpa import Selenium) agar CLI bisa
+menampilkan pilihan profil tanpa memuat browser.
+
+    debug         jendela terlihat, ukuran penuh; untuk melihat flow berjalan
+    headless-new  headless mode baru (--headless=new), perilaku sama dengan Chrome biasa
+    minimal       headless baru, fitur latar belakang dimatikan, viewport kecil,
+                  page load "eager"; paling hemat startup dan RSS
+    legacy        flag lama (--headless lama + user agent Chrome 120), untuk perbandingan
+
+Bandingkan biayanya dengan `python bench.py --skip-flow --skip-startup --launch all`.
+"""
+
+# Flag stabilitas yang dipakai sejak awal oleh bot
+STABILITY_ARGS = ["--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu"]
+
+# Layanan latar belakang Chrome yang tidak dibutuhkan untuk satu kali claim
+MINIMAL_ARGS = [
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-client-side-phishing-detection",
+    "--disable-domain-reliability",
+    "--disable-breakpad",
+    "--disable-features=Translate,OptimizationHints,MediaRouter,AutofillServerCommunication,CertificateTransparencyComponentUpdater",
+    "--metrics-recording-only",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+    "--password-store=basic",
+]
+
+LEGACY_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# headless: None (jendela terlihat), "new" atau "legacy"
+# user_agent: string tetap, "mask" (UA browser asli tanpa penanda HeadlessChrome) atau None
+LAUNCH_PROFILES = {
+    "debug": {
+        "headless": None,
+        "args": STABILITY_ARGS,
+        "window_size": (1920, 1080),
+        "user_agent": None,
+        "page_load_strategy": "normal",
+    },
+    "headless-new": {
+        "headless": "new",
+        "args": STABILITY_ARGS,
+        "window_size": (1920, 1080),
+        "user_agent": "mask",
+        "page_load_strategy": "normal",
+    },
+    "minimal": {
+        "headless": "new",
+        "args": STABILITY_ARGS + MINIMAL_ARGS,
+        "window_size": (1280, 720),
+        "user_agent": "mask",
+        "page_load_strategy": "eager",
+    },
+    "legacy": {
+        "headless": "legacy",
+        "args": STABILITY_ARGS,
+        "window_size": (1920, 1080),
+        "user_agent": LEGACY_USER_AGENT,
+        "page_load_strategy": "normal",
+    },
+}
+
+PROFILE_NAMES = list(LAUNCH_PROFILES)
+
+
+def resolve_profile(name=None, headless=False):
+    """Nama profil yang dipakai: eksplisit, atau default sesuai mode headless"""
+    if name:
+        if name not in LAUNCH_PROFILES:
+            raise ValueError(f"Profil launch tidak dikenal: {name} (pilihan: {', '.join(PROFILE_NAMES)})")
+        return name
+    return "headless-new" if headless else "debug"
+
+
+def chrome_arguments(name):
+    """Daftar argumen command line Chrome untuk profil"""
+    profile = LAUNCH_PROFILES[name]
+    args = []
+    if profile["headless"] == "new":
+        args.append("--headless=new")
+    elif profile["headless"] == "legacy":
+        args.append("--headless")
+    args += profile["args"]
+    args.append("--window-size={},{}".format(*profile["window_size"]))
+    if profile["user_agent"] and profile["user_agent"] != "mask":
+        args.append(f"--user-agent={profile['user_agent']}")
+    return args
@@ -0,0 +1,81 @@
+"""Ledger hasil run: satu baris JSON per akun per run (append-only).
+
+Dipakai untuk melewati akun yang sudah claim hari ini dan sebagai sumber
+data laporan. Lokasi default runs.jsonl, bisa diganti lewat env RUN_LEDGER.
+"""
+import datetime
+import json
+import os
+
+DEFAULT_LEDGER = "runs.jsonl"
+
+# Backend simulasi: run-nya tetap dicatat, tetapi bukan claim sungguhan
+SIMULATED_BACKENDS = ("fake",)
+
+
+def ledger_path(path=None):
+    return path or os.getenv("RUN_LEDGER", DEFAULT_LEDGER)
+
+
+def make_record(email, server, status, duration, backend=None, **extra):
+    """Susun record run; status: success, no_reward atau failed"""
+    now = datetime.datetime.now()
+    record = {
+        "ts": now.isoformat(timespec="seconds"),
+        "date": now.date().isoformat(),
+        "email": email,
+        "server": server,
+        "status": status,
+        "duration": round(duration, 3),
+    }
+    if backend:
+        record["backend"] = backend
+    record.update(extra)
+    return record
+
+
+def append(record, path=None):
+    """Tambahkan satu record ke ledger"""
+    with open(ledger_path(path), "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def iter_records(path=None, offset=0):
+    """Baca record mulai dari byte offset; yield (record, offset_setelahnya)"""
+    path = ledger_path(path)
+    if not os.path.exists(path):
+        return
+    with open(path, "rb") as f:
+        f.seek(offset)
+        for line in f:
+            # Baris terakhir yang belum lengkap (sedang ditulis) dibaca di lain waktu
+            if not line.endswith(b"\n"):
+                break
+            offset += len(line)
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line), offset
+            except ValueError:
+                continue
+
+
+def is_simulated(record):
+    """True jika record berasal dari backend simulasi (FakeBackend)"""
+    return record.get("backend") in SIMULATED_BACKENDS
+
+
+def records_for_date(date=None, path=None):
+    """Semua record pada tanggal tertentu (default hari ini)"""
+    date = date or datetime.date.today().isoformat()
+    return [record for record, _ in iter_records(path) if record.get("date") == date]
+
+
+def claimed_emails(date=None, path=None):
+    """Email yang sudah selesai (claim sukses atau tidak ada hadiah) pada tanggal itu, tanpa run simulasi"""
+    return {
+        record["email"]
+        for record in records_for_date(date, path)
+        if record.get("status") in ("success", "no_reward") and not is_simulated(record)
+    }
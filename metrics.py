@@ -0,0 +1,82 @@
+import collections
+import math
+import threading
+import time
+
+
+def percentile(values, pct):
+    """Persentil (0-100) dengan interpolasi linear; None jika data kosong"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * pct / 100.0
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+class ThroughputWindow:
+    """Catat durasi job terakhir untuk throughput dan persentil latensi live"""
+
+    def __init__(self, window_seconds=300, max_samples=1000):
+        self.window_seconds = window_seconds
+        self._samples = collections.deque(maxlen=max_samples)  # (selesai_pada, durasi)
+        self._lock = threading.Lock()
+
+    def record(self, duration, finished_at=None):
+        with self._lock:
+            self._samples.append((finished_at if finished_at is not None else time.monotonic(), duration))
+
+    def snapshot(self, now=None):
+        now = now if now is not None else time.monotonic()
+        with self._lock:
+            recent = [d for t, d in self._samples if now - t <= self.window_seconds]
+        return {
+            "window_seconds": self.window_seconds,
+            "completed_in_window": len(recent),
+            "jobs_per_minute": len(recent) * 60.0 / self.window_seconds,
+            "latency_p50": percentile(recent, 50),
+            "latency_p95": percentile(recent, 95),
+            "latency_max": max(recent) if recent else None,
+        }
+
+
+class LogHistogram:
+    """Histogram bucket logaritmik (ukuran tetap) untuk persentil inkremental.
+
+    Nilai v masuk bucket ceil(log(v / min_value) / log(growth)); dengan
+    growth 1.1 error relatif persentil paling besar ~10%.
+    """
+
+    def __init__(self, min_value=0.01, growth=1.1, counts=None):
+        self.min_value = min_value
+        self.growth = growth
+        self.counts = {int(k): v for k, v in (counts or {}).items()}
+
+    def add(self, value, count=1):
+        if value <= self.min_value:
+            index = 0
+        else:
+            index = int(math.ceil(math.log(value / self.min_value) / math.log(self.growth)))
+        self.counts[index] = self.counts.get(index, 0) + count
+
+    def total(self):
+        return sum(self.counts.values())
+
+    def percentile(self, pct):
+        """Batas atas bucket yang memuat persentil pct; None jika kosong"""
+        total = self.total()
+        if not total:
+            return None
+        target = total * pct / 100.0
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return self.min_value * self.growth ** index
+        return self.min_value * self.growth ** max(self.counts)
+
+    def to_dict(self):
+        return {str(k): v for k, v in self.counts.items()}
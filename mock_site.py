@@ -0,0 +1,224 @@
+"""Situs tiruan lokal halaman daily event, dibangun dari fixture FakeBackend.
+
+Jika fixture berasal dari capture (page_capture.py fixture ...), markup
+region yang di-capture dipakai apa adanya sehingga selector asli bot
+diuji terhadap markup asli. Tanpa region, dipakai template bawaan yang
+cocok dengan fixture bawaan. Perilaku klik (show/hide/alert/delay)
+mengikuti on_click di fixture; submit login dan submit server juga
+memanggil API lokal (/api/login, /api/claim).
+
+Contoh:
+    python mock_site.py --fixture fixture.json --port 8000
+    python cli.py run --event-url http://127.0.0.1:8000/
+"""
+import argparse
+import html
+import json
+import logging
+import re
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+# Request yang dikirim halaman saat role diklik (sebelum on_click diterapkan)
+ROLE_REQUESTS = {"login_submit": "/api/login", "server_submit": "/api/claim"}
+
+DEFAULT_REGIONS = {
+    "login_area": (
+        '<div class="header"><a href="#" class="btn btn-login login-shinobi loginMethod">LOGIN</a></div>'
+    ),
+    "login_form": (
+        '<div id="LoginForm" class="modal fade in" role="dialog"><form>'
+        '<input type="email" name="email" placeholder="Email">'
+        '<input type="password" name="password" placeholder="Password">'
+        '<button type="button" id="form-login-btnSubmit" class="btn btn-submit" '
+        'data-loading-text="Processing...">SUBMIT</button></form></div>'
+    ),
+    "reward_grid": (
+        '<div class="reward-list">'
+        '<div class="reward-content dailyClaim" data-period="30" data-id="Day-1">'
+        '<div class="reward-star"><i class="fa fa-star"></i></div></div>'
+        '<div class="reward-content" data-period="30" data-id="Day-2"></div></div>'
+    ),
+    "server_form": (
+        '<form id="form-server"><select name="selserver" class="form-control" '
+        'data-parsley-required-message="Must be chosen">{options}</select>'
+        '<button type="button" id="form-server-btnSubmit" class="btn btn-submit" '
+        'data-loading-text="Processing...">SUBMIT</button></form>'
+    ),
+}
+
+PAGE_SCRIPT = """
+var CONFIG = %s;
+function usable(selector) { return selector.indexOf("//") !== 0 && selector.indexOf(":contains") < 0; }
+var roleElements = {};
+Object.keys(CONFIG.roles).forEach(function (role) {
+  var selectors = CONFIG.roles[role].selectors.filter(usable);
+  for (var i = 0; i < selectors.length; i++) {
+    var found = document.querySelector(selectors[i]);
+    if (found) { roleElements[role] = found; found.setAttribute("data-mock-role", role); break; }
+  }
+});
+function setVisible(role, visible) {
+  var el = roleElements[role];
+  if (el) el.style.display = visible ? "" : "none";
+}
+Object.keys(CONFIG.roles).forEach(function (role) {
+  var spec = CONFIG.roles[role];
+  setVisible(role, spec.visible !== false && spec.attached !== false);
+});
+function apply(action) {
+  setTimeout(function () {
+    (action.hide || []).forEach(function (role) { setVisible(role, false); });
+    (action.show || []).forEach(function (role) { setVisible(role, true); });
+    if (action.alert) alert(action.alert);
+  }, (action.delay || 0) * 1000);
+}
+function send(path, done) {
+  var xhr = new XMLHttpRequest(), data = {};
+  document.querySelectorAll("input[name], select[name]").forEach(function (el) { data[el.name] = el.value; });
+  xhr.open("POST", path);
+  xhr.setRequestHeader("Content-Type", "application/json");
+  xhr.onloadend = done;
+  xhr.send(JSON.stringify(data));
+}
+document.addEventListener("click", function (event) {
+  Object.keys(roleElements).forEach(function (role) {
+    if (!roleElements[role].contains(event.target)) return;
+    event.preventDefault();
+    var action = CONFIG.roles[role].on_click;
+    var request = CONFIG.requests[role];
+    if (request) send(request, function () { if (action) apply(action); });
+    else if (action) apply(action);
+  });
+}, true);
+"""
+
+
+def build_page(fixture):
+    """HTML lengkap halaman tiruan dari fixture"""
+    elements = fixture.get("elements", {})
+    options = elements.get("server_select", {}).get("options", [])
+    option_html = "".join(
+        f'<option value="{html.escape(value)}">{html.escape(text)}</option>' for value, text in options
+    )
+
+    regions = dict(DEFAULT_REGIONS)
+    regions["server_form"] = regions["server_form"].format(options=option_html)
+    # Visibilitas diatur oleh script dari fixture, bukan dari state saat capture
+    regions.update({name: re.sub(r' style="display: none"', "", captured)
+                    for name, captured in (fixture.get("regions") or {}).items() if captured})
+
+    success = elements.get("success", {})
+    success_html = f'<div class="alert alert-success">{html.escape(success.get("text", ""))}</div>'
+
+    config = {
+        "roles": {
+            role: {
+                "selectors": spec.get("selectors", []),
+                "visible": spec.get("visible", True),
+                "attached": spec.get("attached", True),
+                "on_click": spec.get("on_click"),
+            }
+            for role, spec in elements.items() if role != "body"
+        },
+        "requests": ROLE_REQUESTS,
+    }
+    body = "\n".join(regions[name] for name in ("login_area", "login_form", "reward_grid", "server_form"))
+    # </script> di dalam JSON akan menutup tag script lebih awal
+    script = PAGE_SCRIPT % json.dumps(config).replace("</", "<\\/")
+    return (
+        "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>Daily Event (mock)</title></head>\n"
+        f"<body>\n{body}\n{success_html}\n<script>{script}</script>\n</body></html>\n"
+    )
+
+
+class MockSiteHandler(BaseHTTPRequestHandler):
+    """Halaman tiruan di semua path GET, API JSON di /api/*"""
+
+    def log_message(self, format, *args):
+        logger.debug("mock " + format % args)
+
+    def _send(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _count(self, key):
+        with self.server.lock:
+            self.server.stats[key] = self.server.stats.get(key, 0) + 1
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/api/stats":
+            with self.server.lock:
+                body = json.dumps(self.server.stats).encode("utf-8")
+            return self._send(200, body, "application/json")
+        self._count("page")
+        self._send(200, self.server.page, "text/html; charset=utf-8")
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        if self.path == "/api/login":
+            self._count("login")
+        elif self.path == "/api/claim":
+            self._count("claim")
+        else:
+            return self._send(404, b'{"status": 0}', "application/json")
+        self._send(200, b'{"status": 1, "message": "OK"}', "application/json")
+
+
+def make_server(fixture=None, host="127.0.0.1", port=0):
+    """Buat server mock (port 0 = port acak); jalankan dengan serve_forever()"""
+    if fixture is None:
+        from fake_backend import DEFAULT_FIXTURE
+        fixture = DEFAULT_FIXTURE
+    server = ThreadingHTTPServer((host, port), MockSiteHandler)
+    server.daemon_threads = True
+    server.page = build_page(fixture).encode("utf-8")
+    server.stats = {}
+    server.lock = threading.Lock()
+    return server
+
+
+def start_in_background(fixture=None, host="127.0.0.1", port=0):
+    """Jalankan server mock di thread daemon; kembalikan (server, url)"""
+    server = make_server(fixture, host, port)
+    threading.Thread(target=server.serve_forever, name="mock-site", daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}/"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Situs tiruan lokal halaman daily event")
+    parser.add_argument("--fixture", help="Fixture JSON (default fixture bawaan FakeBackend)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--dump", action="store_true", help="Cetak HTML halaman lalu keluar")
+    args = parser.parse_args(argv)
+
+    fixture = None
+    if args.fixture:
+        with open(args.fixture, encoding="utf-8") as f:
+            fixture = json.load(f)
+    if args.dump:
+        from fake_backend import DEFAULT_FIXTURE
+        print(build_page(fixture or DEFAULT_FIXTURE))
+        return 0
+
+    server = make_server(fixture, args.host, args.port)
+    print(f"🌐 Mock site berjalan di http://{args.host}:{server.server_address[1]}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,242 +1,593 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait, Select
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
-from selenium.webdriver.common.alert import Alert
-from selenium.webdriver.common.action_chains import ActionChains
-import time
+import itertools
 import logging
 import os
-from dotenv import load_dotenv
+import sys
+import time
+
+from browser_backend import BackendTimeout, ClickIntercepted
+from timing_profile import TimingProfile
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+EVENT_URL = "https://kageherostudio.com/event/?event=daily"
+
+# Tombol login (Step 1), urut dari yang paling spesifik
+LOGIN_BUTTON_SELECTORS = [
+    # Selector utama berdasarkan HTML yang diberikan
+    "a.btn.btn-login.login-shinobi.loginMethod",
+    "a[class='btn btn-login login-shinobi loginMethod']",
+    ".btn.btn-login.login-shinobi.loginMethod",
+    ".loginMethod",
+    ".login-shinobi",
+
+    # Alternatif berdasarkan kombinasi class
+    "a.btn-login.loginMethod",
+    "a.login-shinobi",
+    "a[href='#'].btn-login",
+    "a[href='#'].loginMethod",
+
+    # Berdasarkan text content
+    "//a[contains(@class, 'loginMethod') and text()='LOGIN']",
+    "//a[contains(@class, 'btn-login') and text()='LOGIN']",
+    "//a[contains(@class, 'login-shinobi') and text()='LOGIN']",
+    "//a[contains(text(), 'LOGIN') and contains(@class, 'btn')]",
+
+    # Fallback selectors
+    "a[href='#']:contains('LOGIN')",
+    ".btn:contains('LOGIN')",
+    "//a[@href='#' and contains(text(), 'LOGIN')]",
+    "//a[contains(@class, 'btn') and contains(text(), 'LOGIN')]",
+
+    # Generic fallback
+    "a[href*='login']",
+    "button:contains('Login')",
+    "//a[contains(text(), 'Login')]",
+    "//button[contains(text(), 'Login')]",
+    ".login-btn",
+    "#login-btn",
+    "[data-toggle='modal'][data-target*='login']",
+    "//a[@href='#' and contains(@onclick, 'login')]",
+]
+
+# Modal login: (selector, harus terlihat)
+LOGIN_MODAL_CONDITIONS = [
+    ("#LoginForm", False),
+    ("#LoginForm", True),
+    (".modal.fade.in[role='dialog']", False),
+    (".modal[style*='display: block']", False)
+]
+
+# Field email di modal login
+EMAIL_SELECTORS = [
+    "#LoginForm input[name='email']",
+    "#LoginForm input[type='email']",
+    "#LoginForm input[placeholder*='email']",
+    "#LoginForm input[placeholder*='Email']",
+    "#LoginForm #email",
+    ".modal input[name='email']",
+    ".modal input[type='email']"
+]
+
+# Field password di modal login
+PASSWORD_SELECTORS = [
+    "#LoginForm input[type='password']",
+    ".modal input[type='password']"
+]
+
+# Tombol submit modal login
+LOGIN_SUBMIT_SELECTORS = [
+    "#LoginForm #form-login-btnSubmit",
+    "#form-login-btnSubmit",
+    "#LoginForm button.btn-submit",
+    "#LoginForm button[type='button']",
+    ".modal #form-login-btnSubmit",
+    ".modal button.btn-submit",
+    ".modal button[data-loading-text*='Processing']",
+    "//div[@id='LoginForm']//button[@id='form-login-btnSubmit']",
+    "//div[@id='LoginForm']//button[contains(@class, 'btn-submit')]",
+    "//div[@id='LoginForm']//button[contains(text(), 'SUBMIT')]"
+]
+
+# Hadiah yang bisa diklaim (icon star)
+REWARD_SELECTORS = [
+    # Mencari elemen dengan class reward-star atau yang mengandung star
+    ".reward-star",
+    ".fa-star",
+    "//i[contains(@class, 'fa-star')]/..",
+    "//div[contains(@class, 'reward-star')]",
+
+    # Mencari berdasarkan data atribut dari screenshot
+    "[data-period='30'][data-id*='Day-']",
+
+    # Mencari div yang clickable untuk claim
+    "//div[contains(@class, 'reward-content') and contains(@class, 'dailyClaim')]//div[contains(@class, 'reward-star')]",
+
+    # Berdasarkan struktur HTML dari screenshot  
+    ".reward-content.dailyClaim .reward-star",
+
+    # Alternatif jika menggunakan onclick
+    "//div[@onclick and contains(@class, 'reward')]",
+
+    # Mencari yang memiliki star dan bisa diklik
+    "//div[contains(@class, 'reward-star') and not(contains(@style, 'display: none'))]"
+]
+
+# Grid hadiah harian (juga berisi hari yang sudah diklaim). Jika grid sudah tampil,
+# halaman sudah termuat: tombol login atau bintang yang tidak ada bukan karena lambat
+REWARD_GRID_SELECTORS = [
+    ".reward-content",
+    ".reward-list"
+]
+
+# Dropdown server di popup selserver
+SERVER_SELECT_SELECTORS = [
+    "select[name='selserver']",
+    "select.form-control[name='selserver']",
+    "select[data-parsley-required-message*='Must be chosen']"
+]
+
+# Tombol submit form server
+SERVER_SUBMIT_SELECTORS = [
+    "#form-server-btnSubmit",
+    "button#form-server-btnSubmit",
+    "button[data-loading-text*='Processing']",
+    ".btn.btn-submit",
+    "button.btn-submit",
+    "//button[@id='form-server-btnSubmit']",
+    "//button[contains(@class, 'btn-submit') and text()='SUBMIT']",
+    "//button[contains(@data-loading-text, 'Processing')]"
+]
+
+# Notifikasi sukses setelah claim
+SUCCESS_SELECTORS = [
+    ".alert-success",
+    ".notification-success", 
+    ".success-message",
+    ".toast-success",
+    "//div[contains(@class, 'alert') and contains(@class, 'success')]",
+    "//div[contains(text(), 'success') or contains(text(), 'Success')]",
+    "//div[contains(text(), 'berhasil') or contains(text(), 'Berhasil')]",
+    "//div[contains(text(), 'claimed') or contains(text(), 'Claimed')]"
+]
+
+# Login cepat dalam satu panggilan script async: cari field, isi dengan event input/change,
+# klik submit, lalu tunggu XHR/fetch login selesai di dalam halaman.
+# arguments[0] = {email, password, email_selectors, password_selectors, submit_selectors,
+#                 field_timeout_ms, timeout_ms}; hasil {ok, stage, status, message, ...}
+FAST_LOGIN_SCRIPT = r"""
+/* script: fast_login */
+var opts = arguments[0], callback = arguments[arguments.length - 1];
+var started = Date.now(), finished = false, hooked = false, used = null;
+var origOpen = XMLHttpRequest.prototype.open, origSend = XMLHttpRequest.prototype.send, origFetch = window.fetch;
+function restore() {
+  if (!hooked) return;
+  XMLHttpRequest.prototype.open = origOpen;
+  XMLHttpRequest.prototype.send = origSend;
+  window.fetch = origFetch;
+}
+function finish(result) {
+  if (finished) return;
+  finished = true;
+  restore();
+  result.elapsed_ms = Date.now() - started;
+  result.selectors = used;
+  callback(result);
+}
+function visible(el) { return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length) && !el.disabled; }
+function find(selectors) {
+  for (var i = 0; i < selectors.length; i++) {
+    var found = [];
+    try {
+      if (selectors[i].indexOf("//") === 0) {
+        var snap = document.evaluate(selectors[i], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (var j = 0; j < snap.snapshotLength; j++) found.push(snap.snapshotItem(j));
+      } else {
+        found = document.querySelectorAll(selectors[i]);
+      }
+    } catch (e) { continue; }
+    for (var k = 0; k < found.length; k++) if (visible(found[k])) return [found[k], selectors[i]];
+  }
+  return null;
+}
+function setValue(el, value) {
+  // Setter native agar framework yang membungkus input (React/Vue) ikut melihat perubahan
+  var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+  el.focus();
+  Object.getOwnPropertyDescriptor(proto, "value").set.call(el, value);
+  el.dispatchEvent(new Event("input", {bubbles: true}));
+  el.dispatchEvent(new Event("change", {bubbles: true}));
+  el.blur();
+}
+function settle(status, body, url) {
+  var result = {ok: status >= 200 && status < 400, stage: "response", status: status, url: String(url || ""),
+                message: (body || "").slice(0, 300)};
+  try {
+    var data = JSON.parse(body);
+    if (data && typeof data === "object") {
+      result.message = String(data.message || data.msg || "").slice(0, 300);
+      if (data.status === false || data.status === 0 || data.success === false || data.error) {
+        result.ok = false;
+        result.stage = "rejected";
+      }
+    }
+  } catch (e) {}
+  finish(result);
+}
+function hook() {
+  hooked = true;
+  XMLHttpRequest.prototype.open = function (method, url) {
+    this.__loginUrl = url;
+    this.__loginMethod = String(method).toUpperCase();
+    return origOpen.apply(this, arguments);
+  };
+  XMLHttpRequest.prototype.send = function () {
+    var xhr = this;
+    if (xhr.__loginMethod === "POST") {
+      xhr.addEventListener("loadend", function () { settle(xhr.status, xhr.responseText, xhr.__loginUrl); });
+    }
+    return origSend.apply(this, arguments);
+  };
+  if (origFetch) {
+    window.fetch = function (input, init) {
+      var promise = origFetch.apply(this, arguments);
+      if (init && String(init.method).toUpperCase() === "POST") {
+        promise.then(function (response) {
+          return response.clone().text().then(function (body) { settle(response.status, body, response.url); });
+        }, function (error) { finish({ok: false, stage: "network", message: String(error)}); });
+      }
+      return promise;
+    };
+  }
+}
+function attempt() {
+  var email = find(opts.email_selectors), password = find(opts.password_selectors),
+      submit = find(opts.submit_selectors);
+  if (!email || !password || !submit) {
+    if (Date.now() - started < opts.field_timeout_ms) return setTimeout(attempt, 50);
+    return finish({ok: false, stage: !email ? "email" : !password ? "password" : "submit",
+                   message: "elemen form login tidak ditemukan"});
+  }
+  used = {email: email[1], password: password[1], submit: submit[1]};
+  setValue(email[0], opts.email);
+  setValue(password[0], opts.password);
+  hook();
+  setTimeout(function () { finish({ok: false, stage: "timeout", message: "respon login tidak diterima"}); },
+             opts.timeout_ms);
+  submit[0].click();
+}
+attempt();
+"""
+
+# Tahap hasil FAST_LOGIN_SCRIPT sebelum submit diklik; hanya di tahap ini form aman diisi ulang
+FAST_LOGIN_PRE_SUBMIT_STAGES = ("email", "password", "submit")
+
+# Selector per elemen halaman (nama sama dengan id elemen di fixture FakeBackend),
+# dipakai page_capture untuk mendeteksi perubahan markup
+ROLE_SELECTORS = {
+    "login_button": LOGIN_BUTTON_SELECTORS,
+    "login_form": list(dict.fromkeys(selector for selector, _ in LOGIN_MODAL_CONDITIONS)),
+    "email": EMAIL_SELECTORS,
+    "password": PASSWORD_SELECTORS,
+    "login_submit": LOGIN_SUBMIT_SELECTORS,
+    "reward": REWARD_SELECTORS,
+    "reward_grid": REWARD_GRID_SELECTORS,
+    "server_select": SERVER_SELECT_SELECTORS,
+    "server_submit": SERVER_SUBMIT_SELECTORS,
+    "success": SUCCESS_SELECTORS,
+}
+
+
+# Urutan screenshot dalam proses ini, untuk nama file unik tanpa memindai name_1..name_N
+_screenshot_counter = itertools.count(1)
+
+
+def unique_screenshot_path(filename):
+    """Nama file screenshot yang belum dipakai: name.png, lalu name_<waktu>_<urutan>.png"""
+    if not os.path.exists(filename):
+        return filename
+    name, ext = os.path.splitext(filename)
+    while True:
+        candidate = f"{name}_{time.strftime('%Y%m%d-%H%M%S')}_{next(_screenshot_counter)}{ext}"
+        if not os.path.exists(candidate):
+            return candidate
+
 class NinjaHeroesBot:
-    def __init__(self, email, password, server_choice, headless=False):
+    def __init__(self, email, password, server_choice, headless=False, backend=None, timing=None, event_url=None):
         self.email = email
         self.password = password
         self.server_choice = server_choice
-        self.driver = None
         self.headless = headless
+        # Halaman daily event; bisa diarahkan ke mock_site.py untuk pengujian lokal
+        self.event_url = event_url or EVENT_URL
+        # Backend browser; default Chrome via Selenium, bisa diganti FakeBackend untuk test/benchmark
+        self.backend = backend
+        # Timeout & poll interval tiap step dipelajari dari latensi yang teramati
+        self.timing = timing if timing is not None else TimingProfile()
+        # Hasil run terakhir: success, no_reward atau failed
+        self.last_status = None
+        # Durasi per step flow dan lokasi kegagalan, untuk ledger/laporan
+        self.step_timings = {}
+        self.current_step = None
+        self.failed_selector = None
+        self._step_started = None
+        # Halaman event sudah dibuka lebih dulu (mis. oleh stage launch pipeline)
+        self.page_ready = False
+        # Jika diset, screenshot diserahkan ke sink(filename, png) alih-alih ditulis langsung
+        self.screenshot_sink = None
+        # Opsional: page_capture.PageCapture untuk snapshot DOM per step
+        self.page_capture = None
+        # Coba login satu round trip (FAST_LOGIN_SCRIPT) sebelum jalur langkah per langkah
+        self.use_fast_login = True
+        self.login_method = None
+        # Selector yang menemukan tombol login, dipakai untuk memastikan login selesai
+        self.login_button_selector = None
         
     def setup_driver(self):
-        """Setup Chrome driver dengan opsi yang diperlukan"""
-        chrome_options = Options()
-        
-        if self.headless:
-            chrome_options.add_argument("--headless")
-    
-        # Opsi tambahan untuk stabilitas
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+        """Setup browser backend (default Chrome via Selenium)"""
+        if self.backend is None:
+            # Import di sini agar modul ini bisa dipakai tanpa memuat Selenium
+            from selenium_backend import SeleniumBackend
+            self.backend = SeleniumBackend(headless=self.headless)
         
+        self.begin_step("setup")
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.implicitly_wait(5)  # Dikurangi dari 10 ke 5 detik
+            self.backend.start()
             logger.info("Driver berhasil diinisialisasi")
         except Exception as e:
             logger.error(f"Error saat setup driver: {e}")
             raise
 
-    def find_login_button(self):
-        """Step 1: Mencari tombol login untuk memunculkan popup login form"""
-        logger.info("🔍 Step 1: Mencari tombol login Ninja Heroes...")
+    def begin_step(self, name):
+        """Tutup step flow yang sedang berjalan lalu mulai step baru (None = hanya tutup)"""
+        now = self.backend.now() if self.backend else 0.0
+        if self.current_step and self._step_started is not None:
+            elapsed = now - self._step_started
+            self.step_timings[self.current_step] = self.step_timings.get(self.current_step, 0.0) + elapsed
+        if name is None:
+            self._step_started = None
+            return
+        if self.page_capture is not None:
+            self.page_capture.capture_step(self.backend, name)
+            now = self.backend.now()
+        self.current_step = name
+        self.failed_selector = None
+        self._step_started = now
+
+    def result_fields(self):
+        """Field tambahan untuk record ledger: durasi per step, step dan selector yang gagal"""
+        self.begin_step(None)
+        failed = self.last_status in (None, "failed")
+        return {
+            "steps": {name: round(seconds, 3) for name, seconds in self.step_timings.items()},
+            "failed_step": self.current_step if failed else None,
+            "failed_selector": self.failed_selector if failed else None,
+            "login_method": self.login_method,
+        }
+
+    def wait_step(self, step, selectors, visible=False, enabled=False, record_miss=True):
+        """Tunggu selector pertama yang cocok memakai timeout/poll dari profil timing step"""
+        timeout = self.timing.timeout(step)
+        poll = self.timing.poll(step)
         
-        # Selector untuk tombol login berdasarkan HTML yang diberikan
-        login_button_selectors = [
-            # Selector utama berdasarkan HTML yang diberikan
-            "a.btn.btn-login.login-shinobi.loginMethod",
-            "a[class='btn btn-login login-shinobi loginMethod']",
-            ".btn.btn-login.login-shinobi.loginMethod",
-            ".loginMethod",
-            ".login-shinobi",
-            
-            # Alternatif berdasarkan kombinasi class
-            "a.btn-login.loginMethod",
-            "a.login-shinobi",
-            "a[href='#'].btn-login",
-            "a[href='#'].loginMethod",
-            
-            # Berdasarkan text content
-            "//a[contains(@class, 'loginMethod') and text()='LOGIN']",
-            "//a[contains(@class, 'btn-login') and text()='LOGIN']",
-            "//a[contains(@class, 'login-shinobi') and text()='LOGIN']",
-            "//a[contains(text(), 'LOGIN') and contains(@class, 'btn')]",
-            
-            # Fallback selectors
-            "a[href='#']:contains('LOGIN')",
-            ".btn:contains('LOGIN')",
-            "//a[@href='#' and contains(text(), 'LOGIN')]",
-            "//a[contains(@class, 'btn') and contains(text(), 'LOGIN')]",
-            
-            # Generic fallback
-            "a[href*='login']",
-            "button:contains('Login')",
-            "//a[contains(text(), 'Login')]",
-            "//button[contains(text(), 'Login')]",
-            ".login-btn",
-            "#login-btn",
-            "[data-toggle='modal'][data-target*='login']",
-            "//a[@href='#' and contains(@onclick, 'login')]",
-        ]
+        for selector in selectors:
+            started = self.backend.now()
+            try:
+                element = self.backend.wait_for_selector(selector, timeout, poll, visible=visible, enabled=enabled)
+            except BackendTimeout:
+                continue
+            self.timing.record(step, self.backend.now() - started)
+            self.failed_selector = None
+            return element, selector
         
-        for selector in login_button_selectors:
+        # Selector terakhir yang ditunggu, untuk failed_selector di ledger
+        self.failed_selector = selectors[-1] if selectors else None
+        if record_miss:
+            self.timing.record_timeout(step)
+        return None, None
+
+    def lookup_missed(self):
+        """Catat lookup kosong untuk implicit wait; True jika implicit wait dinaikkan lagi (layak dicoba ulang)"""
+        before = self.timing.timeout("implicit")
+        self.timing.record_timeout("implicit")
+        after = self.timing.timeout("implicit")
+        if after <= before:
+            return False
+        logger.warning(f"⚠️ Elemen tidak ditemukan, implicit wait dinaikkan {before:.2f}s -> {after:.2f}s")
+        self.backend.set_implicit_wait(after)
+        return True
+
+    def reward_grid_loaded(self):
+        """True jika grid hadiah sudah ada di halaman (halaman selesai dimuat)"""
+        for selector in REWARD_GRID_SELECTORS:
             try:
-                if selector.startswith("//"):
-                    element = self.driver.find_element(By.XPATH, selector)
-                else:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
+                if self.backend.find_first(selector, visible=False):
+                    return True
+            except Exception:
+                continue
+        return False
+
+    def _lookup_login_button(self):
+        for selector in LOGIN_BUTTON_SELECTORS:
+            try:
+                started = self.backend.now()
+                element = self.backend.find_first(selector, visible=True, enabled=True)
                 
-                if element.is_displayed() and element.is_enabled():
+                if element:
+                    # Dipakai untuk menentukan implicit wait
+                    self.timing.record("login_button", self.backend.now() - started)
+                    self.timing.record_hit("implicit")
+                    self.login_button_selector = selector
                     logger.info(f"✅ Tombol login ditemukan dengan selector: {selector}")
                     return element
                     
-            except (NoSuchElementException, Exception):
+            except Exception:
                 continue
+        return None
+
+    def find_login_button(self):
+        """Step 1: Mencari tombol login untuk memunculkan popup login form"""
+        logger.info("🔍 Step 1: Mencari tombol login Ninja Heroes...")
+        
+        element = self._lookup_login_button()
+        # Implicit wait hasil belajar bisa terlalu pendek di hari lambat: coba sekali lagi dengan default.
+        # Jika grid hadiah sudah tampil, tombol memang tidak ada (sudah login) dan bukan sinyal implicit wait
+        if element is None and not self.reward_grid_loaded() and self.lookup_missed():
+            element = self._lookup_login_button()
+        if element is not None:
+            return element
         
         logger.error("❌ Tombol login tidak ditemukan dengan semua selector")
         self.take_screenshot("login_button_not_found.png")
         return None
 
+    def fast_login(self):
+        """Step 2 & 3 dalam satu script async.
+
+        Hasil: ok, rejected (ditolak server), submitted (submit sudah diklik tetapi
+        respon tidak diterima; status login dicek, form tidak dikirim ulang) atau
+        fallback (belum sempat submit, aman memakai jalur langkah per langkah).
+        """
+        if not self.use_fast_login:
+            return "fallback"
+        logger.info("⚡ Login cepat: isi form, submit dan tunggu respon dalam satu script...")
+        
+        timeout = self.timing.timeout("fast_login")
+        options = {
+            "email": self.email,
+            "password": self.password,
+            "email_selectors": EMAIL_SELECTORS,
+            "password_selectors": PASSWORD_SELECTORS,
+            "submit_selectors": LOGIN_SUBMIT_SELECTORS,
+            "field_timeout_ms": int(max(self.timing.timeout("login_modal"), 2) * 1000),
+            "timeout_ms": int(timeout * 1000),
+        }
+        started = self.backend.now()
+        try:
+            result = self.backend.execute_async_script(FAST_LOGIN_SCRIPT, options, timeout=timeout + 5)
+        except Exception as e:
+            logger.warning(f"⚠️ Login cepat tidak bisa dijalankan, memakai jalur biasa: {e}")
+            return "fallback"
+        
+        result = result or {}
+        if result.get("ok"):
+            self.timing.record("fast_login", self.backend.now() - started)
+            self.login_method = "fast"
+            logger.info(f"✅ Login cepat berhasil (HTTP {result.get('status')}, {result.get('elapsed_ms')} ms)")
+            return "ok"
+        
+        stage = result.get("stage")
+        if stage in FAST_LOGIN_PRE_SUBMIT_STAGES:
+            logger.warning(f"⚠️ Login cepat gagal di tahap {stage}: {result.get('message')}, memakai jalur biasa")
+            return "fallback"
+        
+        self.login_method = "fast"
+        if stage == "rejected":
+            logger.error(f"❌ Login ditolak: {result.get('message')}")
+            return "rejected"
+        if stage == "timeout":
+            self.timing.record_timeout("fast_login")
+        # Request login mungkin masih berjalan: submit ulang bisa login dua kali atau gagal di modal yang sudah tertutup
+        logger.warning(f"⚠️ Login cepat tanpa respon di tahap {stage}: {result.get('message')}, "
+                       "mengecek status login")
+        return "submitted"
+
+    def is_logged_in(self, backend):
+        """Kondisi setelah login: hadiah sudah tampil, atau modal tertutup dan tombol login hilang"""
+        if backend.find_first(REWARD_SELECTORS[0], visible=True):
+            return True
+        if backend.find_first("#LoginForm", visible=True):
+            return False
+        selector = self.login_button_selector or LOGIN_BUTTON_SELECTORS[0]
+        return backend.find_first(selector, visible=True) is None
+
+    def wait_logged_in(self):
+        """Tunggu halaman setelah login sebagai ganti jeda tetap; False jika login tidak terkonfirmasi"""
+        started = self.backend.now()
+        try:
+            self.backend.wait_for(self.is_logged_in, self.timing.timeout("login_done"), self.timing.poll("login_done"))
+        except BackendTimeout:
+            self.timing.record_timeout("login_done")
+            self.failed_selector = "#LoginForm"
+            return False
+        self.timing.record("login_done", self.backend.now() - started)
+        return True
+
     def fill_login_form(self):
         """Step 2: Mengisi form email dan password lalu submit"""
         logger.info("📝 Step 2: Mengisi form login...")
+        self.login_method = "steps"
         
         try:
             # Tunggu modal login form benar-benar muncul dan siap
             logger.info("⏳ Menunggu modal login form siap...")
             
             # Tunggu modal dengan ID LoginForm muncul dan visible
-            modal_wait = WebDriverWait(self.driver, 0.2)  # Dikurangi dari 15 ke 10
-            modal_wait.until(EC.presence_of_element_located((By.ID, "LoginForm")))
-            modal_wait.until(EC.visibility_of_element_located((By.ID, "LoginForm")))
-            
-            # time.sleep(1)  # Dikurangi dari 2 ke 1 detik
+            modal, _ = self.wait_step("login_modal", ["#LoginForm"], visible=True)
+            if not modal:
+                raise Exception("Modal LoginForm tidak muncul")
             
             # Focus ke dalam modal
-            modal = self.driver.find_element(By.ID, "LoginForm")
-            self.driver.execute_script("arguments[0].focus();", modal)
+            self.backend.execute_script("arguments[0].focus();", modal)
             
             # Cari field email dalam modal
-            email_selectors = [
-                "#LoginForm input[name='email']",
-                "#LoginForm input[type='email']",
-                "#LoginForm input[placeholder*='email']",
-                "#LoginForm input[placeholder*='Email']",
-                "#LoginForm #email",
-                ".modal input[name='email']",
-                ".modal input[type='email']"
-            ]
-            
-            email_field = None
-            for selector in email_selectors:
-                try:
-                    email_field = modal_wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
-                    if email_field.is_displayed():
-                        break
-                except:
-                    continue
+            email_field, _ = self.wait_step("login_field", EMAIL_SELECTORS, visible=True, enabled=True)
             
             if not email_field:
                 raise Exception("Field email tidak ditemukan dalam modal")
             
             # Cari field password dalam modal
-            password_selectors = [
-                "#LoginForm input[type='password']",
-                ".modal input[type='password']"
-            ]
-            
-            password_field = None
-            for selector in password_selectors:
-                try:
-                    password_field = modal_wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
-                    if password_field.is_displayed():
-                        break
-                except:
-                    continue
+            password_field, _ = self.wait_step("login_field", PASSWORD_SELECTORS, visible=True, enabled=True)
             
             if not password_field:
                 raise Exception("Field password tidak ditemukan dalam modal")
             
             # Input email dengan scroll ke element
             logger.info("📧 Memasukkan email...")
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", email_field)
-            time.sleep(0.2)  # Dikurangi dari 0.5 ke 0.2
-            email_field.clear()
-            time.sleep(0.2)  # Dikurangi dari 0.5 ke 0.2
-            email_field.send_keys(self.email)
+            self.backend.scroll_into_view(email_field)
+            self.backend.sleep(0.2)
+            self.backend.type_text(email_field, self.email)
             
-            time.sleep(0.5)  # Dikurangi dari 1 ke 0.5
+            self.backend.sleep(0.5)
             
             # Input password
             logger.info("🔐 Memasukkan password...")
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", password_field)
-            time.sleep(0.2)  # Dikurangi dari 0.5 ke 0.2
-            password_field.clear()
-            time.sleep(0.2)  # Dikurangi dari 0.5 ke 0.2
-            password_field.send_keys(self.password)
+            self.backend.scroll_into_view(password_field)
+            self.backend.sleep(0.2)
+            self.backend.type_text(password_field, self.password)
             
-            time.sleep(0.5)  # Dikurangi dari 1 ke 0.5
+            self.backend.sleep(0.5)
             
             # Cari tombol submit dalam modal
-            submit_selectors = [
-                "#LoginForm #form-login-btnSubmit",
-                "#form-login-btnSubmit",
-                "#LoginForm button.btn-submit",
-                "#LoginForm button[type='button']",
-                ".modal #form-login-btnSubmit",
-                ".modal button.btn-submit",
-                ".modal button[data-loading-text*='Processing']",
-                "//div[@id='LoginForm']//button[@id='form-login-btnSubmit']",
-                "//div[@id='LoginForm']//button[contains(@class, 'btn-submit')]",
-                "//div[@id='LoginForm']//button[contains(text(), 'SUBMIT')]"
-            ]
-            
-            submit_button = None
-            for selector in submit_selectors:
-                try:
-                    if selector.startswith("//"):
-                        submit_button = modal_wait.until(EC.element_to_be_clickable((By.XPATH, selector)))
-                    else:
-                        submit_button = modal_wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
-                
-                    if submit_button.is_displayed() and submit_button.is_enabled():
-                        logger.info(f"✅ Tombol submit ditemukan dengan selector: {selector}")
-                        break
-                except:
-                    continue
+            submit_button, selector = self.wait_step("login_field", LOGIN_SUBMIT_SELECTORS, visible=True, enabled=True)
+            if submit_button:
+                logger.info(f"✅ Tombol submit ditemukan dengan selector: {selector}")
         
+            success = False
             if submit_button:
                 logger.info("🚀 Menekan tombol submit...")
                 
                 # Scroll ke tombol submit dalam modal
-                self.driver.execute_script("""
+                self.backend.execute_script("""
                     arguments[0].scrollIntoView({block: 'center', inline: 'center'});
                     arguments[0].style.border='3px solid red';
                 """, submit_button)
-                time.sleep(0.3)  # Dikurangi dari 1 ke 0.3
+                self.backend.sleep(0.3)
                 
                 # Coba beberapa metode klik
-                success = False
                 
                 # Method 1: Regular click
                 try:
-                    submit_button.click()
+                    self.backend.click(submit_button)
                     success = True
                     logger.info("✅ Submit berhasil dengan regular click")
-                except ElementClickInterceptedException:
+                except ClickIntercepted:
                     logger.info("⚠️ Regular click gagal, mencoba JavaScript click...")
                     
                     # Method 2: JavaScript click
                     try:
-                        self.driver.execute_script("arguments[0].click();", submit_button)
+                        self.backend.click(submit_button, method="script")
                         success = True
                         logger.info("✅ Submit berhasil dengan JavaScript click")
                     except Exception as e:
@@ -244,26 +595,14 @@ class NinjaHeroesBot:
                         
                         # Method 3: Force click dengan koordinat
                         try:
-                            location = submit_button.location_once_scrolled_into_view
-                            self.driver.execute_script(f"""
-                                var element = arguments[0];
-                                var event = new MouseEvent('click', {{
-                                    view: window,
-                                    bubbles: true,
-                                    cancelable: true,
-                                    clientX: {location['x']},
-                                    clientY: {location['y']}
-                                }});
-                                element.dispatchEvent(event);
-                            """, submit_button)
+                            self.backend.click(submit_button, method="event")
                             success = True
                             logger.info("✅ Submit berhasil dengan force click")
                         except Exception as e:
                             logger.error(f"Force click gagal: {e}")
             
             if success:
-                # Tunggu sebentar untuk proses submit
-                time.sleep(5)  # Dikurangi dari 3 ke 2
+                # Proses submit ditunggu oleh wait_logged_in di login()
                 logger.info("✅ Form login berhasil disubmit")
                 return True
             else:
@@ -280,26 +619,14 @@ class NinjaHeroesBot:
         logger.info("⏳ Menunggu popup login form muncul...")
         
         try:
-            # Tunggu modal LoginForm muncul dan visible
-            wait = WebDriverWait(self.driver,0)  # Dikurangi dari 15 ke 10
-            
             # Cek berbagai kondisi modal
-            modal_conditions = [
-                EC.presence_of_element_located((By.ID, "LoginForm")),
-                EC.visibility_of_element_located((By.ID, "LoginForm")),
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".modal.fade.in[role='dialog']")),
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".modal[style*='display: block']"))
-            ]
-            
-            for condition in modal_conditions:
-                try:
-                    wait.until(condition)
+            for selector, visible in LOGIN_MODAL_CONDITIONS:
+                element, _ = self.wait_step("login_popup", [selector], visible=visible, record_miss=False)
+                if element:
                     logger.info("✅ Modal login form ditemukan dan siap")
-                    # time.sleep(1)  # Dikurangi dari 2 ke 1
                     return True
-                except TimeoutException:
-                    continue
             
+            self.timing.record_timeout("login_popup")
             logger.warning("⚠️ Modal login form tidak ditemukan")
             return False
             
@@ -307,49 +634,34 @@ class NinjaHeroesBot:
             logger.error(f"Error menunggu popup login: {e}")
             return False
 
-    def find_claimable_reward(self):
-        """Step 4: Mencari hadiah yang bisa diambil melalui icon star"""
-        logger.info("⭐ Step 4: Mencari hadiah yang bisa diambil...")
-        
+    def _lookup_reward(self):
         # Berdasarkan screenshot, hadiah yang bisa diambil memiliki icon star
-        claimable_selectors = [
-            # Mencari elemen dengan class reward-star atau yang mengandung star
-            ".reward-star",
-            ".fa-star",
-            "//i[contains(@class, 'fa-star')]/..",
-            "//div[contains(@class, 'reward-star')]",
-            
-            # Mencari berdasarkan data atribut dari screenshot
-            "[data-period='30'][data-id*='Day-']",
-            
-            # Mencari div yang clickable untuk claim
-            "//div[contains(@class, 'reward-content') and contains(@class, 'dailyClaim')]//div[contains(@class, 'reward-star')]",
-            
-            # Berdasarkan struktur HTML dari screenshot  
-            ".reward-content.dailyClaim .reward-star",
-            
-            # Alternatif jika menggunakan onclick
-            "//div[@onclick and contains(@class, 'reward')]",
-            
-            # Mencari yang memiliki star dan bisa diklik
-            "//div[contains(@class, 'reward-star') and not(contains(@style, 'display: none'))]"
-        ]
-        
-        for selector in claimable_selectors:
+        for selector in REWARD_SELECTORS:
             try:
-                if selector.startswith("//"):
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                else:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                elements = self.backend.query_selector_all(selector)
                 
                 for element in elements:
                     if element.is_displayed() and element.is_enabled():
+                        self.timing.record_hit("implicit")
                         logger.info("✅ Hadiah yang bisa diklaim ditemukan!")
                         return element
                         
             except Exception as e:
                 logger.debug(f"Error dengan selector {selector}: {e}")
                 continue
+        return None
+
+    def find_claimable_reward(self):
+        """Step 4: Mencari hadiah yang bisa diambil melalui icon star"""
+        logger.info("⭐ Step 4: Mencari hadiah yang bisa diambil...")
+        
+        element = self._lookup_reward()
+        # Jangan simpulkan "tidak ada hadiah" dari implicit wait yang terlalu pendek;
+        # grid yang tampil tanpa bintang berarti hadiah hari ini memang sudah diklaim
+        if element is None and not self.reward_grid_loaded() and self.lookup_missed():
+            element = self._lookup_reward()
+        if element is not None:
+            return element
         
         logger.warning("⚠️ Tidak ada hadiah yang bisa diklaim saat ini")
         return None
@@ -378,34 +690,30 @@ class NinjaHeroesBot:
         
         return None, None
 
+    def matches_server_option(self, option_text, server_number, server_name):
+        """Fleksibel matching teks option dropdown berdasarkan komponen yang diparsing"""
+        # Jika ada server number dan name, cek keduanya
+        if server_number and server_name:
+            return (server_number in option_text or f"Server {server_number}" in option_text) and server_name in option_text
+        # Jika hanya ada nama server (fallback)
+        if server_name:
+            return server_name in option_text
+        # Jika cocok persis dengan string asli
+        return bool(self.server_choice) and self.server_choice in option_text
+
     def select_server_from_popup(self):
         """Step 5: Memilih server dari popup dropdown dengan interaksi spinner"""
         logger.info("🌐 Step 5: Memilih server dari popup...")
         
         try:
             # Tunggu popup server muncul
-            WebDriverWait(self.driver, 1).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "select[name='selserver']"))
-            )
+            if not self.wait_step("server_popup", ["select[name='selserver']"])[0]:
+                raise BackendTimeout("Popup server tidak muncul")
             
             # Cari dropdown server
-            server_dropdown = None
-            server_selectors = [
-                "select[name='selserver']",
-                "select.form-control[name='selserver']",
-                "select[data-parsley-required-message*='Must be chosen']"
-            ]
-            
-            for selector in server_selectors:
-                try:
-                    server_dropdown = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                    if server_dropdown.is_displayed():
-                        logger.info(f"✅ Dropdown server ditemukan: {selector}")
-                        break
-                except:
-                    continue
+            server_dropdown, selector = self.wait_step("server_dropdown", SERVER_SELECT_SELECTORS, visible=True, enabled=True)
+            if server_dropdown:
+                logger.info(f"✅ Dropdown server ditemukan: {selector}")
     
             if not server_dropdown:
                 logger.error("❌ Dropdown server tidak ditemukan")
@@ -413,8 +721,8 @@ class NinjaHeroesBot:
                 return False
             
             # Scroll ke dropdown
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", server_dropdown)
-            time.sleep(0.5)
+            self.backend.scroll_into_view(server_dropdown)
+            self.backend.sleep(0.5)
             
             # Parse server choice untuk mendapatkan komponen pencarian
             server_number, server_name = self.parse_server_choice(self.server_choice)
@@ -424,43 +732,26 @@ class NinjaHeroesBot:
             # METHOD 1: Coba dengan Actions untuk klik dropdown
             try:
                 logger.info("🖱️ Method 1: Menggunakan ActionChains untuk klik dropdown")
-                actions = ActionChains(self.driver)
-                actions.move_to_element(server_dropdown).click().perform()
-                time.sleep(0.5)
+                self.backend.click(server_dropdown, method="actions")
+                self.backend.sleep(0.5)
                 
-                # Gunakan Select setelah dropdown terbuka
-                select = Select(server_dropdown)
+                # Baca options setelah dropdown terbuka
+                options = self.backend.list_options(server_dropdown)
                 logger.info("📋 Server options tersedia:")
-                for option in select.options:
-                    logger.info(f"  - Value: {option.get_attribute('value')} | Text: {option.text}")
+                for value, text in options:
+                    logger.info(f"  - Value: {value} | Text: {text}")
                 
                 # Cari dan pilih server yang sesuai
                 success = False
-                for option in select.options:
-                    option_text = option.text
-                    
-                    # Fleksibel matching berdasarkan komponen yang diparsing
-                    match_found = False
-                    
-                    # Jika ada server number dan name, cek keduanya
-                    if server_number and server_name:
-                        if (server_number in option_text or f"Server {server_number}" in option_text) and server_name in option_text:
-                            match_found = True
-                    # Jika hanya ada nama server (fallback)
-                    elif server_name and server_name in option_text:
-                        match_found = True
-                    # Jika cocok persis dengan string asli
-                    elif self.server_choice in option_text:
-                        match_found = True
-                    
-                    if match_found:
-                        select.select_by_visible_text(option_text)
+                for value, option_text in options:
+                    if self.matches_server_option(option_text, server_number, server_name):
+                        self.backend.select_option(server_dropdown, text=option_text)
                         logger.info(f"✅ Server dipilih dengan ActionChains: {option_text}")
                         success = True
                         break
         
                 if success:
-                    time.sleep(0.5)
+                    self.backend.sleep(0.5)
                     return True
                 
             except Exception as e:
@@ -471,48 +762,31 @@ class NinjaHeroesBot:
                 logger.info("🖱️ Method 2: Force set value dengan JavaScript")
                 
                 # Cari value dari option yang sesuai
-                select = Select(server_dropdown)
                 target_value = None
                 target_text = None
                 
-                for option in select.options:
-                    option_text = option.text
-                    
-                    # Fleksibel matching berdasarkan komponen yang diparsing
-                    match_found = False
-                    
-                    # Jika ada server number dan name, cek keduanya
-                    if server_number and server_name:
-                        if (server_number in option_text or f"Server {server_number}" in option_text) and server_name in option_text:
-                            match_found = True
-                    # Jika hanya ada nama server (fallback)
-                    elif server_name and server_name in option_text:
-                        match_found = True
-                    # Jika cocok persis dengan string asli
-                    elif self.server_choice in option_text:
-                        match_found = True
-                    
-                    if match_found:
-                        target_value = option.get_attribute('value')
+                for value, option_text in self.backend.list_options(server_dropdown):
+                    if self.matches_server_option(option_text, server_number, server_name):
+                        target_value = value
                         target_text = option_text
                         break
             
                 if target_value:
                     # Set value dengan JavaScript
-                    self.driver.execute_script(f"""
+                    self.backend.execute_script("""
                         var select = arguments[0];
-                        select.value = '{target_value}';
+                        select.value = arguments[1];
                         
                         // Trigger events
-                        var changeEvent = new Event('change', {{ bubbles: true }});
-                        var inputEvent = new Event('input', {{ bubbles: true }});
+                        var changeEvent = new Event('change', { bubbles: true });
+                        var inputEvent = new Event('input', { bubbles: true });
                         
                         select.dispatchEvent(inputEvent);
                         select.dispatchEvent(changeEvent);
-                    """, server_dropdown)
+                    """, server_dropdown, target_value)
                     
                     logger.info(f"✅ Server dipilih dengan force JavaScript: {target_text}")
-                    time.sleep(0.5)
+                    self.backend.sleep(0.5)
                     return True
                 else:
                     logger.error(f"❌ Server '{self.server_choice}' tidak ditemukan dalam dropdown options")
@@ -528,37 +802,54 @@ class NinjaHeroesBot:
             self.take_screenshot("server_selection_error.png")
             return False
 
+    def open_event_page(self):
+        """Buka halaman daily event dan tunggu sampai termuat"""
+        logger.info("📱 Membuka halaman daily event...")
+        self.begin_step("page_load")
+        self.backend.navigate(self.event_url)
+        
+        # Tunggu halaman dimuat
+        if not self.wait_step("page_load", ["body"])[0]:
+            raise BackendTimeout("Halaman daily event tidak termuat")
+        self.backend.sleep(0.2)
+        # Tutup step agar waktu antre sebelum login tidak ikut terhitung
+        self.begin_step(None)
+        self.page_ready = True
+        return True
+
     def login(self):
         """Proses login lengkap"""
         try:
             logger.info("=== 🚀 MEMULAI PROSES LOGIN NINJA HEROES ===")
             
-            # Buka halaman daily event
-            logger.info("📱 Membuka halaman daily event...")
-            self.driver.get("https://kageherostudio.com/event/?event=daily")
-            
-            # Tunggu halaman dimuat
-            WebDriverWait(self.driver, 0.3).until(  # Dikurangi dari 15 ke 10
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            time.sleep(0.2)  # Dikurangi dari 3 ke 2
+            # Buka halaman daily event (dilewati jika sudah dibuka lebih dulu)
+            if not self.page_ready:
+                self.open_event_page()
             
             # Step 1: Cari tombol login
+            self.begin_step("login_button")
             login_button = self.find_login_button()
             if login_button:
-                login_button.click()
-                time.sleep(0.2)  # Dikurangi dari 2 ke 1
+                self.backend.click(login_button)
+                self.backend.sleep(0.2)
                 
                 # Tunggu popup login muncul
+                self.begin_step("login_form")
                 if self.wait_for_login_popup():
-                    # Step 2 & 3: Isi form dan submit
-                    if self.fill_login_form():
-                        logger.info("✅ Login berhasil!")
-                        time.sleep(8)  # Dikurangi dari 3 ke 2
-                        return True
-                    else:
+                    # Step 2 & 3: Isi form dan submit (jalur cepat, fallback langkah per langkah)
+                    fast = self.fast_login()
+                    if fast == "rejected":
+                        logger.error("❌ Login ditolak server")
+                        return False
+                    if fast == "fallback" and not self.fill_login_form():
                         logger.error("❌ Gagal mengisi form login")
                         return False
+                    # Tunggu modal tertutup / tombol login hilang alih-alih jeda tetap
+                    if not self.wait_logged_in():
+                        logger.error("❌ Login tidak terkonfirmasi: modal login masih terbuka")
+                        return False
+                    logger.info("✅ Login berhasil!")
+                    return True
                 else:
                     logger.error("❌ Popup login tidak muncul")
                     return False
@@ -577,6 +868,7 @@ class NinjaHeroesBot:
             logger.info("=== 🎁 MEMULAI PROSES CLAIM HADIAH HARIAN ===")
             
             # Step 4: Cari hadiah yang bisa diambil
+            self.begin_step("find_reward")
             claimable_reward = self.find_claimable_reward()
             if not claimable_reward:
                 logger.info("ℹ️ Tidak ada hadiah yang bisa diklaim atau sudah diklaim hari ini")
@@ -584,22 +876,26 @@ class NinjaHeroesBot:
             
             # Klik hadiah yang bisa diklaim
             logger.info("🎯 Mengklik hadiah yang dapat diklaim...")
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", claimable_reward)
-            time.sleep(0.5)  # Dikurangi dari 1 ke 0.5
-            claimable_reward.click()
-            time.sleep(0.2)  # Dikurangi dari 2 ke 1
+            self.backend.execute_script("arguments[0].scrollIntoView(true);", claimable_reward)
+            self.backend.sleep(0.5)
+            self.backend.click(claimable_reward)
+            self.backend.sleep(0.2)
             
             # Step 5: Pilih server dari popup
+            self.begin_step("select_server")
             if self.select_server_from_popup():
                 # Step 6: Submit form server
+                self.begin_step("submit_server")
                 if self.submit_server_form():
-                    time.sleep(0.2)  # Dikurangi dari 2 ke 1
+                    self.backend.sleep(0.2)
                     
                     # Step 7: Handle alert konfirmasi
+                    self.begin_step("alert")
                     if self.handle_chrome_alert():
-                        time.sleep(0.2)  # Dikurangi dari 2 ke 1
+                        self.backend.sleep(0.2)
                         
                         # Step 8: Cek notifikasi sukses
+                        self.begin_step("notify")
                         self.check_success_notification()
                         logger.info("🎊 PROSES CLAIM HADIAH SELESAI!")
                         return True
@@ -616,32 +912,9 @@ class NinjaHeroesBot:
         
         try:
             # Tunggu tombol submit muncul dan siap diklik
-            submit_selectors = [
-                "#form-server-btnSubmit",
-                "button#form-server-btnSubmit",
-                "button[data-loading-text*='Processing']",
-                ".btn.btn-submit",
-                "button.btn-submit",
-                "//button[@id='form-server-btnSubmit']",
-                "//button[contains(@class, 'btn-submit') and text()='SUBMIT']",
-                "//button[contains(@data-loading-text, 'Processing')]"
-            ]
-            
-            submit_button = None
-            wait = WebDriverWait(self.driver, 10)
-            
-            for selector in submit_selectors:
-                try:
-                    if selector.startswith("//"):
-                        submit_button = wait.until(EC.element_to_be_clickable((By.XPATH, selector)))
-                    else:
-                        submit_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
-                
-                    if submit_button.is_displayed() and submit_button.is_enabled():
-                        logger.info(f"✅ Tombol submit server ditemukan: {selector}")
-                        break
-                except:
-                    continue
+            submit_button, selector = self.wait_step("server_submit", SERVER_SUBMIT_SELECTORS, visible=True, enabled=True)
+            if submit_button:
+                logger.info(f"✅ Tombol submit server ditemukan: {selector}")
         
             if not submit_button:
                 logger.error("❌ Tombol submit server tidak ditemukan")
@@ -649,30 +922,30 @@ class NinjaHeroesBot:
                 return False
             
             # Scroll ke tombol submit
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", submit_button)
-            time.sleep(0.5)
+            self.backend.scroll_into_view(submit_button)
+            self.backend.sleep(0.5)
             
             # Highlight tombol untuk debugging
-            self.driver.execute_script("arguments[0].style.border='3px solid red';", submit_button)
-            time.sleep(0.3)
+            self.backend.execute_script("arguments[0].style.border='3px solid red';", submit_button)
+            self.backend.sleep(0.3)
             
             # Method 1: Regular click
             try:
                 logger.info("🖱️ Method 1: Regular click pada tombol submit")
-                submit_button.click()
+                self.backend.click(submit_button)
                 logger.info("✅ Submit berhasil dengan regular click")
-                time.sleep(1)
+                self.backend.sleep(1)
                 return True
                 
-            except ElementClickInterceptedException:
+            except ClickIntercepted:
                 logger.info("⚠️ Regular click gagal, mencoba JavaScript click...")
                 
                 # Method 2: JavaScript click
                 try:
                     logger.info("🖱️ Method 2: JavaScript click pada tombol submit")
-                    self.driver.execute_script("arguments[0].click();", submit_button)
+                    self.backend.click(submit_button, method="script")
                     logger.info("✅ Submit berhasil dengan JavaScript click")
-                    time.sleep(1)
+                    self.backend.sleep(1)
                     return True
                     
                 except Exception as e:
@@ -681,10 +954,9 @@ class NinjaHeroesBot:
                     # Method 3: ActionChains click
                     try:
                         logger.info("🖱️ Method 3: ActionChains click pada tombol submit")
-                        actions = ActionChains(self.driver)
-                        actions.move_to_element(submit_button).click().perform()
+                        self.backend.click(submit_button, method="actions")
                         logger.info("✅ Submit berhasil dengan ActionChains")
-                        time.sleep(1)
+                        self.backend.sleep(1)
                         return True
                         
                     except Exception as e:
@@ -693,17 +965,9 @@ class NinjaHeroesBot:
                         # Method 4: Force submit dengan trigger event
                         try:
                             logger.info("🖱️ Method 4: Force submit dengan event trigger")
-                            self.driver.execute_script("""
-                                var button = arguments[0];
-                                var event = new MouseEvent('click', {
-                                    view: window,
-                                    bubbles: true,
-                                    cancelable: true
-                                });
-                                button.dispatchEvent(event);
-                            """, submit_button)
+                            self.backend.click(submit_button, method="event")
                             logger.info("✅ Submit berhasil dengan force event")
-                            time.sleep(1)
+                            self.backend.sleep(1)
                             return True
                         
                         except Exception as e:
@@ -723,24 +987,20 @@ class NinjaHeroesBot:
         logger.info("🔔 Step 7: Menangani alert konfirmasi...")
         
         try:
-            # Tunggu alert muncul
-            wait = WebDriverWait(self.driver, 10)
-            wait.until(EC.alert_is_present())
+            # Tunggu alert muncul lalu accept (klik OK)
+            started = self.backend.now()
+            alert_text = self.backend.handle_dialog(self.timing.timeout("alert"), accept=True)
+            if alert_text is None:
+                # Dicatat agar timeout alert kembali ke default jika hari ini server lambat
+                self.timing.record_timeout("alert")
+                logger.info("ℹ️ Tidak ada alert yang muncul")
+                return True
             
-            # Handle alert
-            alert = Alert(self.driver)
-            alert_text = alert.text
+            self.timing.record("alert", self.backend.now() - started)
             logger.info(f"📋 Alert text: {alert_text}")
-            
-            # Accept alert (klik OK)
-            alert.accept()
             logger.info("✅ Alert berhasil di-accept")
             return True
             
-        except TimeoutException:
-            logger.info("ℹ️ Tidak ada alert yang muncul")
-            return True
-            
         except Exception as e:
             logger.error(f"❌ Error saat handle alert: {e}")
             return False
@@ -750,36 +1010,13 @@ class NinjaHeroesBot:
         logger.info("🎉 Step 8: Mengecek notifikasi sukses...")
         
         try:
-            # Selectors untuk notifikasi sukses
-            success_selectors = [
-                ".alert-success",
-                ".notification-success", 
-                ".success-message",
-                ".toast-success",
-                "//div[contains(@class, 'alert') and contains(@class, 'success')]",
-                "//div[contains(text(), 'success') or contains(text(), 'Success')]",
-                "//div[contains(text(), 'berhasil') or contains(text(), 'Berhasil')]",
-                "//div[contains(text(), 'claimed') or contains(text(), 'Claimed')]"
-            ]
-            
-            for selector in success_selectors:
-                try:
-                    if selector.startswith("//"):
-                        element = WebDriverWait(self.driver, 0.2).until(
-                            EC.presence_of_element_located((By.XPATH, selector))
-                        )
-                    else:
-                        element = WebDriverWait(self.driver, 0.2).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                        )
+            for selector in SUCCESS_SELECTORS:
+                element, _ = self.wait_step("success_notice", [selector], record_miss=False)
                 
-                    if element.is_displayed():
-                        success_text = element.text
-                        logger.info(f"✅ Notifikasi sukses ditemukan: {success_text}")
-                        return True
-                        
-                except TimeoutException:
-                    continue
+                if element and element.is_displayed():
+                    success_text = element.text
+                    logger.info(f"✅ Notifikasi sukses ditemukan: {success_text}")
+                    return True
         
             logger.info("ℹ️ Tidak ada notifikasi sukses yang terdeteksi, tapi submit telah dilakukan")
             return True
@@ -791,18 +1028,17 @@ class NinjaHeroesBot:
     def take_screenshot(self, filename="screenshot.png"):
         """Ambil screenshot untuk debugging dengan auto-indexing"""
         try:
-            # Pisahkan nama file dan ekstensi
-            name, ext = os.path.splitext(filename)
-            
-            # Cek apakah file sudah ada, jika ya tambahkan index
-            counter = 1
-            new_filename = filename
+            if self.page_capture is not None:
+                self.page_capture.capture(self.backend, os.path.splitext(filename)[0], self.current_step)
             
-            while os.path.exists(new_filename):
-                new_filename = f"{name}_{counter}{ext}"
-                counter += 1
+            if self.screenshot_sink is not None:
+                # Penulisan file dilakukan di luar jalur kritis oleh sink
+                self.screenshot_sink(filename, self.backend.screenshot_png())
+                return filename
             
-            self.driver.save_screenshot(new_filename)
+            # Cek apakah file sudah ada, jika ya tambahkan index
+            new_filename = unique_screenshot_path(filename)
+            self.backend.screenshot(new_filename)
             logger.info(f"📸 Screenshot disimpan: {new_filename}")
             return new_filename
             
@@ -812,77 +1048,64 @@ class NinjaHeroesBot:
 
     def close_driver(self):
         """Tutup driver"""
-        if self.driver:
-            self.driver.quit()
+        if self.backend:
+            self.backend.quit()
             logger.info("🔚 Driver ditutup")
 
+    def run_tasks(self):
+        """Login lalu claim hadiah; backend harus sudah berjalan (dipakai ulang oleh worker daemon)"""
+        self.backend.set_implicit_wait(self.timing.timeout("implicit"))
+        self.last_status = "failed"
+        
+        # Login terlebih dahulu
+        if self.login():
+            self.backend.sleep(0.2)
+            
+            # Claim daily reward
+            claim_result = self.claim_daily_reward()
+            if claim_result == "no_claimable_reward":
+                logger.info("ℹ️ Tidak ada hadiah yang bisa diklaim hari ini")
+                self.last_status = "no_reward"
+                self.take_screenshot("no_reward.png")
+                return True
+            elif claim_result == True:
+                # Sukses claim reward
+                logger.info("✅ Daily reward berhasil diklaim!")
+                logger.info("🎉 BOT BERHASIL MENJALANKAN SEMUA TUGAS!")
+                self.last_status = "success"
+                self.take_screenshot("success.png")
+                return True
+            else:
+                logger.error("❌ Gagal claim daily reward")
+                self.take_screenshot("error_claim.png")
+                return False
+        else:
+            logger.error("❌ Login gagal")
+            self.take_screenshot("error_login.png")
+            return False
+
     def run(self):
         """Jalankan bot utama"""
         try:
             self.setup_driver()
-            
-            # Login terlebih dahulu
-            if self.login():
-                time.sleep(0.2)  # Dikurangi dari 2 ke 1
-                
-                # Claim daily reward
-                claim_result = self.claim_daily_reward()
-                if claim_result == "no_claimable_reward":
-                    logger.info("ℹ️ Tidak ada hadiah yang bisa diklaim hari ini")
-                    self.take_screenshot("no_reward.png")
-                    return True
-                elif claim_result == True:
-                    # Sukses claim reward
-                    logger.info("✅ Daily reward berhasil diklaim!")
-                    logger.info("🎉 BOT BERHASIL MENJALANKAN SEMUA TUGAS!")
-                    self.take_screenshot("success.png")
-                    return True
-                else:
-                    logger.error("❌ Gagal claim daily reward")
-                    self.take_screenshot("error_claim.png")
-                    return False
-            else:
-                logger.error("❌ Login gagal")
-                self.take_screenshot("error_login.png")
-                return False
+            return self.run_tasks()
                 
         except Exception as e:
             logger.error(f"❌ Error dalam menjalankan bot: {e}")
-            self.take_screenshot("error_general.png")
+            self.last_status = "failed"
+            if self.backend:
+                self.take_screenshot("error_general.png")
             return False
         finally:
-            time.sleep(0.5)  # Beri waktu untuk melihat hasil
+            if self.backend:
+                self.backend.sleep(0.5)  # Beri waktu untuk melihat hasil
             self.close_driver()
+            try:
+                self.timing.save()
+            except OSError as e:
+                logger.warning(f"⚠️ Gagal menyimpan profil timing: {e}")
 
-# Cara penggunaan
+# Cara penggunaan: sama dengan `python cli.py run`
 if __name__ == "__main__":
-    load_dotenv("config.env")
-
-    EMAIL = os.getenv("EMAIL")
-    PASSWORD = os.getenv("PASSWORD")
-    SERVER = os.getenv("SERVER")
-
-    # ✅ Validasi environment variables
-    if not EMAIL or not PASSWORD or not SERVER:
-        print("❌ Error: EMAIL, PASSWORD, dan SERVER harus diset di config.env")
-        print("📝 Copy config.env.example menjadi config.env dan isi dengan data Anda")
-        exit(1)
-
-    # Cek apakah masih menggunakan nilai default/example
-    if EMAIL == "your_email@example.com":
-        print("❌ Error: Silakan ganti EMAIL di config.env dengan email asli Anda")
-        exit(1)
-
-    bot = NinjaHeroesBot(
-        email=EMAIL, 
-        password=PASSWORD, 
-        server_choice=SERVER,
-        headless=False
-    )
-
-    success = bot.run()
-
-    if success:
-        print("✅ Bot berhasil dijalankan!")
-    else:
-        print("❌ Bot gagal dijalankan, periksa log untuk detail error")
+    from cli import main
+    sys.exit(main(["run"] + sys.argv[1:]))
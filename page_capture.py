@@ -0,0 +1,350 @@
+"""Capture snapshot DOM per step dan deteksi perubahan markup (page drift).
+
+Jika diaktifkan (--capture DIR), bot menyimpan snapshot DOM yang dipangkas di
+awal setiap step dan setiap kali mengambil screenshot: HTML region penting
+(area tombol login, #LoginForm, grid hadiah, form selserver) beserta daftar
+elemen yang cocok dengan tiap selector di ninja_heroes_bot.
+
+Snapshot bisa dibandingkan dengan fixture yang diketahui benar. Jika
+selector pertama yang cocok bergeser ke belakang daftar, setiap selector
+yang terlewati memakan satu timeout per akun; perubahan itu dilaporkan
+beserta perkiraan biayanya sebelum terasa di seluruh fleet.
+
+Contoh:
+    python page_capture.py diff captures/                      # vs fixture bawaan FakeBackend
+    python page_capture.py diff captures/run-b --against captures/run-a
+    python page_capture.py fixture captures/run-a --output fixture.json
+"""
+import argparse
+import copy
+import datetime
+import difflib
+import json
+import logging
+import os
+import re
+import sys
+
+from ninja_heroes_bot import ROLE_SELECTORS
+from timing_profile import TimingProfile
+
+logger = logging.getLogger(__name__)
+
+# Region yang disimpan HTML-nya: ([selector elemen], selector ancestor yang diambil atau None)
+REGIONS = {
+    "login_area": ([".loginMethod", ".login-shinobi", "a.btn-login"], "div, header, nav"),
+    "login_form": (["#LoginForm"], None),
+    "reward_grid": ([".reward-content", ".reward-star"], ":has(> .reward-content + .reward-content)"),
+    "server_form": (["select[name='selserver']"], "form"),
+}
+
+# Step yang di-capture: setelah halaman termuat dan tidak sedang ada alert terbuka
+# (menjalankan script saat alert terbuka membuat Chrome menutup alert tersebut)
+CAPTURE_STEPS = ("login_button", "login_form", "find_reward", "select_server", "submit_server", "notify")
+
+# Elemen yang harus ada di awal step tertentu
+EXPECTED_ROLES = {
+    "login_button": ["login_button"],
+    "login_form": ["login_form", "email", "password", "login_submit"],
+    "find_reward": ["reward"],
+    "submit_server": ["server_select", "server_submit"],
+}
+
+# Step profil timing yang timeout-nya dibayar untuk setiap selector yang tidak cocok
+ROLE_TIMING_STEP = {
+    "login_button": "implicit",
+    "login_form": "login_popup",
+    "email": "login_field",
+    "password": "login_field",
+    "login_submit": "login_field",
+    "reward": "implicit",
+    "reward_grid": "implicit",
+    "server_select": "server_dropdown",
+    "server_submit": "server_submit",
+    "success": "success_notice",
+}
+
+
+def _slug(text):
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", str(text)).strip("_") or "run"
+
+
+class PageCapture:
+    """Simpan snapshot DOM satu run ke DIR/<waktu>-<nama>/NN_<label>.json"""
+
+    def __init__(self, root, name=None):
+        stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.directory = os.path.join(root, f"{stamp}-{_slug(name)}" if name else stamp)
+        self.count = 0
+
+    def capture_step(self, backend, step):
+        """Capture di awal step flow (hanya step di CAPTURE_STEPS)"""
+        if step not in CAPTURE_STEPS:
+            return None
+        return self.capture(backend, step, step)
+
+    def capture(self, backend, label, step=None):
+        """Ambil snapshot dari backend; kembalikan path file atau None jika gagal"""
+        step = step or label
+        try:
+            snapshot = backend.snapshot_dom(
+                {name: list(spec) for name, spec in REGIONS.items()}, ROLE_SELECTORS
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Gagal capture DOM ({label}): {e}")
+            return None
+        if not snapshot:
+            return None
+
+        snapshot.update(
+            label=label,
+            step=step,
+            captured_at=datetime.datetime.now().isoformat(timespec="seconds"),
+            expect=EXPECTED_ROLES.get(step, []),
+        )
+        self.count += 1
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{self.count:02d}_{_slug(label)}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, indent=1, ensure_ascii=False)
+        return path
+
+
+def load_json(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_snapshots(paths):
+    """Baca snapshot dari file atau direktori (rekursif, urut nama)"""
+    snapshots = []
+    for path in paths:
+        if os.path.isdir(path):
+            files = []
+            for directory, _, names in os.walk(path):
+                files += [os.path.join(directory, name) for name in names if name.endswith(".json")]
+            snapshots += [load_json(file) for file in sorted(files)]
+        else:
+            snapshots.append(load_json(path))
+    return [s for s in snapshots if "matches" in s]
+
+
+def first_match(matches, role):
+    """(indeks, selector) pertama di ROLE_SELECTORS[role] yang cocok dengan elemen, atau None"""
+    for index, selector in enumerate(ROLE_SELECTORS[role]):
+        if matches.get(selector):
+            return index, selector
+    return None
+
+
+def reference_match(reference, role):
+    """first_match untuk referensi berupa snapshot atau fixture FakeBackend"""
+    if "matches" in reference:
+        return first_match(reference["matches"].get(role, {}), role)
+    spec = reference.get("elements", {}).get(role)
+    if not spec:
+        return None
+    selectors = set(spec.get("selectors", []))
+    for index, selector in enumerate(ROLE_SELECTORS[role]):
+        if selector in selectors:
+            return index, selector
+    return None
+
+
+def _options(source, role):
+    """Teks option dropdown dari snapshot atau fixture"""
+    if "matches" in source:
+        match = first_match(source["matches"].get(role, {}), role)
+        if not match:
+            return None
+        element = source["elements"].get(source["matches"][role][match[1]][0], {})
+        options = element.get("options")
+    else:
+        options = source.get("elements", {}).get(role, {}).get("options")
+    return None if options is None else [text for _, text in options]
+
+
+def _miss_cost(role, selectors, matches, timing):
+    """Perkiraan waktu yang terbuang untuk selector yang tidak cocok (selector tidak valid gagal seketika)"""
+    misses = sum(1 for selector in selectors if matches.get(selector) is not None)
+    return misses * timing.timeout(ROLE_TIMING_STEP.get(role, "implicit"))
+
+
+def _normalize_html(html):
+    # Visibilitas berubah sesuai state flow, bukan markup
+    return re.sub(r' style="display: none"', "", html or "")
+
+
+def diff_snapshot(snapshot, reference, timing=None):
+    """Bandingkan snapshot dengan referensi; kembalikan list temuan {level, role, message, cost}"""
+    timing = timing if timing is not None else TimingProfile()
+    findings = []
+
+    for role in snapshot.get("expect", []):
+        matches = snapshot["matches"].get(role, {})
+        current = first_match(matches, role)
+        expected = reference_match(reference, role)
+        if current is None:
+            cost = _miss_cost(role, ROLE_SELECTORS[role], matches, timing)
+            findings.append({"level": "error", "role": role, "cost": cost,
+                             "message": f"tidak cocok dengan semua {len(ROLE_SELECTORS[role])} selector "
+                                        f"(≈ +{cost:.1f}s per akun sebelum gagal)"})
+        elif expected is None:
+            findings.append({"level": "info", "role": role, "cost": 0.0,
+                             "message": f"tidak ada di referensi, sekarang cocok #{current[0]} {current[1]!r}"})
+        elif current[0] > expected[0]:
+            skipped = ROLE_SELECTORS[role][expected[0]:current[0]]
+            cost = _miss_cost(role, skipped, matches, timing)
+            findings.append({"level": "warning", "role": role, "cost": cost,
+                             "message": f"selector pertama yang cocok bergeser #{expected[0]} {expected[1]!r} -> "
+                                        f"#{current[0]} {current[1]!r} (+{len(skipped)} selector, "
+                                        f"≈ +{cost:.1f}s per akun)"})
+
+    current_options = _options(snapshot, "server_select") if "server_select" in snapshot.get("expect", []) else None
+    expected_options = _options(reference, "server_select")
+    if current_options is not None and expected_options is not None and current_options != expected_options:
+        added = [o for o in current_options if o not in expected_options]
+        removed = [o for o in expected_options if o not in current_options]
+        findings.append({"level": "info", "role": "server_select", "cost": 0.0,
+                         "message": f"option server berubah: +{added} -{removed}"})
+
+    for name, html in (snapshot.get("regions") or {}).items():
+        before = (reference.get("regions") or {}).get(name)
+        if not html or not before or _normalize_html(html) == _normalize_html(before):
+            continue
+        lines = difflib.unified_diff(
+            _normalize_html(before).replace(">", ">\n").splitlines(),
+            _normalize_html(html).replace(">", ">\n").splitlines(),
+            "referensi", "snapshot", lineterm="", n=1,
+        )
+        findings.append({"level": "info", "role": name, "cost": 0.0,
+                         "message": "markup region berubah:\n    " + "\n    ".join(list(lines)[2:32])})
+    return findings
+
+
+def snapshots_to_fixture(snapshots, base=None):
+    """Susun fixture FakeBackend dari snapshot.
+
+    Selector, teks, atribut dan option tiap elemen diambil dari halaman
+    yang di-capture; alur klik (on_click) dan visibilitas awal mengikuti
+    fixture dasar. Elemen yang tidak pernah ditemukan ditandai captured=False.
+    """
+    if base is None:
+        from fake_backend import DEFAULT_FIXTURE
+        base = DEFAULT_FIXTURE
+    fixture = copy.deepcopy(base)
+    elements = fixture["elements"]
+
+    for role, selectors in ROLE_SELECTORS.items():
+        matched = []
+        info = None
+        for snapshot in snapshots:
+            matches = snapshot["matches"].get(role, {})
+            first = first_match(matches, role)
+            if not first:
+                continue
+            element_id = matches[first[1]][0]
+            matched += [s for s in selectors if element_id in (matches.get(s) or []) and s not in matched]
+            info = snapshot["elements"].get(element_id, info)
+
+        spec = elements.setdefault(role, {"selectors": []})
+        if not matched:
+            spec["captured"] = False
+            continue
+        spec.pop("captured", None)
+        spec["selectors"] = sorted(matched, key=selectors.index)
+        spec["tag"] = info.get("tag", "div")
+        spec["text"] = info.get("text", "")
+        spec["attrs"] = info.get("attrs", {})
+        if info.get("options") is not None:
+            spec["options"] = info["options"]
+
+    regions = {}
+    for snapshot in snapshots:
+        for name, html in (snapshot.get("regions") or {}).items():
+            if html:
+                regions[name] = html
+    fixture["regions"] = regions
+    fixture["captured_from"] = [
+        {"label": s.get("label"), "url": s.get("url"), "captured_at": s.get("captured_at")} for s in snapshots
+    ]
+    return fixture
+
+
+def cmd_diff(args):
+    snapshots = load_snapshots(args.paths)
+    if not snapshots:
+        print("ℹ️ Tidak ada snapshot ditemukan")
+        return 0
+
+    if args.against:
+        if os.path.isdir(args.against):
+            references = load_snapshots([args.against])
+        else:
+            references = [load_json(args.against)]
+    else:
+        from fake_backend import DEFAULT_FIXTURE
+        references = [DEFAULT_FIXTURE]
+    timing = TimingProfile.load(args.timing) if args.timing else TimingProfile()
+
+    drift = 0
+    for snapshot in snapshots:
+        # Referensi berupa snapshot dicocokkan per label step; fixture dipakai untuk semua step
+        reference = next((r for r in references if r.get("label") == snapshot.get("label")), None)
+        if reference is None:
+            reference = next((r for r in references if "elements" in r and "matches" not in r), references[0])
+        findings = diff_snapshot(snapshot, reference, timing)
+        if not findings:
+            continue
+        print(f"📄 {snapshot.get('label')} ({snapshot.get('captured_at')}, {snapshot.get('url')})")
+        for finding in findings:
+            icon = {"error": "❌", "warning": "⚠️", "info": "ℹ️"}[finding["level"]]
+            print(f"  {icon} {finding['role']}: {finding['message']}")
+            drift += finding["level"] != "info"
+
+    if drift:
+        print(f"❌ {drift} perubahan yang memperlambat/menggagalkan flow")
+        return 1
+    print(f"✅ {len(snapshots)} snapshot tanpa drift selector")
+    return 0
+
+
+def cmd_fixture(args):
+    snapshots = load_snapshots(args.paths)
+    if not snapshots:
+        print("❌ Tidak ada snapshot ditemukan")
+        return 1
+    base = load_json(args.base) if args.base else None
+    fixture = snapshots_to_fixture(snapshots, base)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(fixture, f, indent=1, ensure_ascii=False)
+
+    missing = [role for role, spec in fixture["elements"].items() if spec.get("captured") is False]
+    print(f"✅ Fixture dari {len(snapshots)} snapshot ditulis ke {args.output}")
+    if missing:
+        print(f"⚠️ Tidak ter-capture (memakai fixture dasar): {', '.join(missing)}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Snapshot DOM: deteksi drift markup dan buat fixture")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("diff", help="Bandingkan snapshot dengan fixture/snapshot referensi")
+    p.add_argument("paths", nargs="+", help="File atau direktori snapshot")
+    p.add_argument("--against", help="Fixture JSON atau direktori snapshot referensi (default fixture bawaan)")
+    p.add_argument("--timing", help="Profil timing untuk perkiraan biaya (default timeout bawaan)")
+    p.set_defaults(func=cmd_diff)
+
+    p = sub.add_parser("fixture", help="Buat fixture FakeBackend / mock site dari snapshot")
+    p.add_argument("paths", nargs="+", help="File atau direktori snapshot")
+    p.add_argument("--output", required=True)
+    p.add_argument("--base", help="Fixture dasar untuk alur klik (default fixture bawaan)")
+    p.set_defaults(func=cmd_fixture)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
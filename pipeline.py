@@ -0,0 +1,284 @@
+"""Runner pipeline: browser akun berikutnya disiapkan selagi akun sekarang claim.
+
+Setiap akun melewati stage berikut, masing-masing dengan worker dan
+antrean sendiri:
+
+    launch      buat backend, start browser, buka halaman daily event
+    claim       login + claim hadiah (jalur kritis), tulis ledger
+    teardown    tutup browser
+    screenshot  tulis file screenshot ke disk
+
+Kedalaman antrean tiap stage membatasi berapa item yang boleh menunggu di
+depan stage itu; stage sebelumnya tertahan (blocked) jika antrean penuh.
+Jumlah browser hidup paling banyak kira-kira
+launch_workers + depth(claim) + claim_workers + depth(teardown) + teardown_workers.
+
+Utilisasi per stage = waktu sibuk / (durasi run x jumlah worker). Stage
+dengan utilisasi mendekati 100% adalah bottleneck; stage lain yang banyak
+blocked sedang menunggu stage itu.
+"""
+import logging
+import queue
+import threading
+import time
+
+import ledger
+from ninja_heroes_bot import NinjaHeroesBot, unique_screenshot_path
+from timing_profile import TimingProfile
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+STAGES = ("launch", "claim", "teardown", "screenshot")
+DEFAULT_DEPTH = {"launch": 1, "claim": 1, "teardown": 4, "screenshot": 32}
+
+
+class Stage:
+    """Satu stage pipeline: antrean terbatas + worker thread + metrik utilisasi"""
+
+    def __init__(self, name, handler, workers=1, depth=1):
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+        self.depth = depth
+        self.queue = queue.Queue(maxsize=depth)
+        self.next_stage = None
+        self.items = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.blocked_seconds = 0.0
+        self.max_queued = 0
+        self._lock = threading.Lock()
+        self._stopped = 0
+        self._threads = []
+
+    def start(self):
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._loop, name=f"{self.name}-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def put(self, item):
+        """Masukkan item ke antrean stage; kembalikan lama tertahan karena antrean penuh"""
+        started = time.perf_counter()
+        self.queue.put(item)
+        with self._lock:
+            self.max_queued = max(self.max_queued, self.queue.qsize())
+        return time.perf_counter() - started
+
+    def close(self):
+        """Minta semua worker berhenti setelah antrean habis"""
+        for _ in range(self.workers):
+            self.queue.put(_STOP)
+
+    def join(self):
+        for thread in self._threads:
+            thread.join()
+
+    def _loop(self):
+        while True:
+            item = self.queue.get()
+            if item is _STOP:
+                with self._lock:
+                    self._stopped += 1
+                    last = self._stopped == self.workers
+                # Worker terakhir yang berhenti meneruskan sinyal stop ke stage berikutnya
+                if last and self.next_stage is not None:
+                    self.next_stage.close()
+                return
+
+            started = time.perf_counter()
+            try:
+                result = self.handler(item)
+                failed = False
+            except Exception as e:
+                logger.error(f"❌ Stage {self.name}: {e}")
+                result = None
+                failed = True
+            busy = time.perf_counter() - started
+
+            blocked = 0.0
+            if result is not None and self.next_stage is not None:
+                blocked = self.next_stage.put(result)
+            with self._lock:
+                self.items += 1
+                self.errors += failed
+                self.busy_seconds += busy
+                self.blocked_seconds += blocked
+
+    def stats(self, elapsed):
+        with self._lock:
+            capacity = elapsed * self.workers
+            return {
+                "workers": self.workers,
+                "depth": self.depth,
+                "items": self.items,
+                "errors": self.errors,
+                "queued": self.queue.qsize(),
+                "max_queued": self.max_queued,
+                "busy_seconds": round(self.busy_seconds, 3),
+                "blocked_seconds": round(self.blocked_seconds, 3),
+                "avg_seconds": round(self.busy_seconds / self.items, 3) if self.items else None,
+                "utilization": round(self.busy_seconds / capacity, 3) if capacity else None,
+            }
+
+
+class PipelineRunner:
+    """Jalankan claim banyak akun dengan stage launch/claim/teardown yang tumpang tindih"""
+
+    def __init__(self, backend_factory, launch_workers=1, claim_workers=1, teardown_workers=1,
+                 depth=None, timing=None, ledger_path=None, backend_name="pipeline", write_screenshots=True,
+                 capture_dir=None, event_url=None, fast_login=True):
+        self.backend_factory = backend_factory
+        self.fast_login = fast_login
+        self.event_url = event_url
+        self.capture_dir = capture_dir
+        self.write_screenshots = write_screenshots
+        self.timing = timing if timing is not None else TimingProfile()
+        self.ledger_path = ledger_path
+        self.backend_name = backend_name
+        depth = {**DEFAULT_DEPTH, **(depth or {})}
+
+        self.stages = {
+            "launch": Stage("launch", self._launch, launch_workers, depth["launch"]),
+            "claim": Stage("claim", self._claim, claim_workers, depth["claim"]),
+            "teardown": Stage("teardown", self._teardown, teardown_workers, depth["teardown"]),
+            "screenshot": Stage("screenshot", self._write_screenshot, 1, depth["screenshot"]),
+        }
+        self.stages["launch"].next_stage = self.stages["claim"]
+        self.stages["claim"].next_stage = self.stages["teardown"]
+        self.results = []
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+
+    def run(self, accounts):
+        """Proses semua akun; kembalikan daftar hasil {email, server, status, ok, duration}"""
+        started = time.perf_counter()
+        for stage in self.stages.values():
+            stage.start()
+
+        for account in accounts:
+            self.stages["launch"].put({"account": account})
+        self.stages["launch"].close()
+
+        # Stop mengalir launch -> claim -> teardown; screenshot ditutup setelah teardown selesai
+        for name in ("launch", "claim", "teardown"):
+            self.stages[name].join()
+        self.stages["screenshot"].close()
+        self.stages["screenshot"].join()
+
+        self.elapsed = time.perf_counter() - started
+        try:
+            self.timing.save()
+        except OSError as e:
+            logger.warning(f"⚠️ Gagal menyimpan profil timing: {e}")
+        return list(self.results)
+
+    def stats(self):
+        """Metrik per stage dan throughput run terakhir"""
+        stages = {name: stage.stats(self.elapsed) for name, stage in self.stages.items()}
+        busiest = max(("launch", "claim", "teardown"), key=lambda name: stages[name]["utilization"] or 0)
+        return {
+            "accounts": len(self.results),
+            "wall_seconds": round(self.elapsed, 3),
+            "accounts_per_minute": round(len(self.results) * 60 / self.elapsed, 2) if self.elapsed else None,
+            "bottleneck": busiest,
+            "stages": stages,
+        }
+
+    def _queue_screenshot(self, filename, png):
+        self.stages["screenshot"].put((filename, png))
+
+    def _launch(self, job):
+        account = job["account"]
+        started = time.perf_counter()
+        bot = NinjaHeroesBot(
+            email=account["email"],
+            password=account["password"],
+            server_choice=account["server"],
+            backend=None,
+            timing=self.timing,
+            event_url=self.event_url
+        )
+        bot.screenshot_sink = self._queue_screenshot
+        bot.use_fast_login = self.fast_login
+        if self.capture_dir:
+            from page_capture import PageCapture
+            bot.page_capture = PageCapture(self.capture_dir, account["email"])
+        job["bot"] = bot
+        try:
+            bot.current_step = "setup"
+            bot.backend = self.backend_factory()
+            bot.setup_driver()
+            bot.open_event_page()
+        except Exception as e:
+            # Diteruskan ke claim agar tetap tercatat gagal di ledger, lalu ditutup di teardown
+            logger.error(f"❌ Gagal menyiapkan browser untuk {account['email']}: {e}")
+            job["error"] = str(e)
+        job["launch_seconds"] = time.perf_counter() - started
+        return job
+
+    def _claim(self, job):
+        account = job["account"]
+        bot = job["bot"]
+        started = time.perf_counter()
+        ok = False
+        if not job.get("error"):
+            try:
+                ok = bot.run_tasks()
+            except Exception as e:
+                logger.error(f"❌ Error saat claim {account['email']}: {e}")
+                bot.last_status = "failed"
+                bot.take_screenshot("error_general.png")
+        else:
+            bot.last_status = "failed"
+
+        # Durasi yang dialami akun: launch + claim, tanpa waktu antre di antaranya
+        duration = job["launch_seconds"] + time.perf_counter() - started
+        status = bot.last_status or "failed"
+        try:
+            ledger.append(ledger.make_record(account["email"], account["server"], status, duration,
+                                             backend=self.backend_name, **bot.result_fields()),
+                          self.ledger_path)
+        except OSError as e:
+            logger.warning(f"⚠️ Gagal menulis ledger: {e}")
+        with self._lock:
+            self.results.append({"email": account["email"], "server": account["server"],
+                                 "status": status, "ok": ok, "duration": round(duration, 3)})
+        return job
+
+    def _teardown(self, job):
+        try:
+            job["bot"].close_driver()
+        except Exception as e:
+            logger.warning(f"⚠️ Gagal menutup browser {job['account']['email']}: {e}")
+        try:
+            self.timing.save(min_interval=30)
+        except OSError as e:
+            logger.warning(f"⚠️ Gagal menyimpan profil timing: {e}")
+        return None
+
+    def _write_screenshot(self, item):
+        filename, png = item
+        if not self.write_screenshots:
+            return None
+        path = unique_screenshot_path(filename)
+        with open(path, "wb") as f:
+            f.write(png)
+        logger.info(f"📸 Screenshot disimpan: {path}")
+        return None
+
+
+def format_stats(stats):
+    """Ringkasan metrik pipeline untuk terminal"""
+    lines = [f"⏱️ {stats['accounts']} akun dalam {stats['wall_seconds']:.1f}s "
+             f"({stats['accounts_per_minute'] or 0:.1f} akun/menit), bottleneck: {stats['bottleneck']}",
+             f"{'stage':<12}{'worker':>7}{'depth':>7}{'item':>6}{'avg':>9}{'util':>7}{'blocked':>10}{'maxq':>6}"]
+    for name in STAGES:
+        s = stats["stages"][name]
+        avg = f"{s['avg_seconds']:.2f}s" if s["avg_seconds"] is not None else "-"
+        util = f"{s['utilization'] * 100:.0f}%" if s["utilization"] is not None else "-"
+        lines.append(f"{name:<12}{s['workers']:>7}{s['depth']:>7}{s['items']:>6}{avg:>9}{util:>7}"
+                     f"{s['blocked_seconds']:>9.1f}s{s['max_queued']:>6}")
+    return "\n".join(lines)
@@ -0,0 +1,90 @@
+"""Statistik proses (RSS, file descriptor, jumlah anak) untuk satu process tree.
+
+Memakai psutil jika terpasang; jika tidak, membaca /proc langsung (Linux).
+Di platform tanpa keduanya fungsi mengembalikan None.
+"""
+import os
+
+try:
+    import psutil
+except ImportError:  # opsional
+    psutil = None
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _proc_children():
+    """Peta ppid -> [pid] dari /proc"""
+    children = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/stat", encoding="utf-8") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # Nama proses di dalam kurung bisa mengandung spasi
+        fields = stat.rsplit(")", 1)[1].split()
+        children.setdefault(int(fields[1]), []).append(int(name))
+    return children
+
+
+def process_tree(pid):
+    """PID proses dan seluruh turunannya"""
+    if pid is None:
+        return []
+    if psutil is not None:
+        try:
+            root = psutil.Process(pid)
+            return [pid] + [child.pid for child in root.children(recursive=True)]
+        except psutil.Error:
+            return []
+    if not os.path.isdir("/proc"):
+        return []
+    children = _proc_children()
+    tree, pending = [], [pid]
+    while pending:
+        current = pending.pop()
+        tree.append(current)
+        pending += children.get(current, [])
+    return tree
+
+
+def process_rss(pid):
+    """RSS satu proses (byte), 0 jika proses sudah hilang"""
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except psutil.Error:
+            return 0
+    try:
+        with open(f"/proc/{pid}/statm", encoding="utf-8") as f:
+            return int(f.read().split()[1]) * PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+def open_fds(pid):
+    """Jumlah file descriptor terbuka satu proses"""
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).num_fds()
+        except (psutil.Error, AttributeError):
+            return 0
+    try:
+        return len(os.listdir(f"/proc/{pid}/fd"))
+    except OSError:
+        return 0
+
+
+def tree_stats(pid):
+    """{processes, rss, fds} untuk process tree pid, atau None jika tidak bisa diukur"""
+    pids = process_tree(pid)
+    if not pids:
+        return None
+    return {
+        "processes": len(pids),
+        "rss": sum(process_rss(p) for p in pids),
+        "fds": sum(open_fds(p) for p in pids),
+    }
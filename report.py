@@ -0,0 +1,354 @@
+"""Laporan fleet dari ledger run (runs.jsonl).
+
+Agregat disimpan di cache (report_cache.json) beserta byte offset ledger
+terakhir yang sudah dibaca dan identitas file ledger, sehingga setiap
+pemanggilan hanya memproses record baru. Run FakeBackend dilewati. Persentil per step memakai histogram logaritmik berukuran
+tetap, jadi cache tidak ikut membesar seiring bertambahnya riwayat.
+
+Contoh:
+    python report.py                       # tabel terminal
+    python report.py --format json
+    python report.py --format html --output report.html
+"""
+import argparse
+import datetime
+import hashlib
+import html
+import json
+import os
+import sys
+
+import ledger
+from metrics import LogHistogram
+
+CACHE_VERSION = 3
+DEFAULT_CACHE = "report_cache.json"
+STATUSES = ("success", "no_reward", "failed")
+
+# Urutan step flow di NinjaHeroesBot (begin_step)
+STEP_ORDER = [
+    "setup", "page_load", "login_button", "login_form", "find_reward",
+    "select_server", "submit_server", "alert", "notify",
+]
+
+
+def ledger_identity(path):
+    """Identitas file ledger: inode + hash baris pertama; berubah jika ledger di-rotate/diganti"""
+    try:
+        with open(path, "rb") as f:
+            first_line = f.readline()
+            inode = os.fstat(f.fileno()).st_ino
+    except OSError:
+        return None
+    # Baris pertama yang belum lengkap belum bisa dipakai sebagai identitas
+    head = hashlib.sha1(first_line).hexdigest() if first_line.endswith(b"\n") else None
+    return {"inode": inode, "head": head}
+
+
+def _same_ledger(cached, current):
+    if not cached or not current:
+        return cached == current
+    if cached["inode"] != current["inode"]:
+        return False
+    return cached["head"] is None or cached["head"] == current["head"]
+
+
+def _empty_state(ledger_file):
+    return {
+        "version": CACHE_VERSION,
+        "ledger": ledger_file,
+        "identity": None,
+        "offset": 0,
+        "records": 0,
+        "servers": {},
+        "steps": {},
+        "durations": {},
+        "failed_steps": {},
+        "failed_selectors": {},
+        "days": {},
+    }
+
+
+class FleetReport:
+    """Agregat inkremental hasil run per server, step dan hari"""
+
+    def __init__(self, ledger_file, state=None):
+        self.ledger_file = ledger_file
+        self.state = state or _empty_state(ledger_file)
+
+    @classmethod
+    def load(cls, ledger_file, cache_path=None, rebuild=False):
+        """Muat agregat dari cache; dibangun ulang jika cache tidak cocok dengan ledger"""
+        ledger_file = os.path.abspath(ledger.ledger_path(ledger_file))
+        state = None
+        if cache_path and not rebuild and os.path.exists(cache_path):
+            try:
+                with open(cache_path, encoding="utf-8") as f:
+                    state = json.load(f)
+            except ValueError:
+                state = None
+
+        if state is not None:
+            size = os.path.getsize(ledger_file) if os.path.exists(ledger_file) else 0
+            # Ledger diganti/di-rotate/dipotong -> hitung ulang dari awal
+            if (state.get("version") != CACHE_VERSION or state.get("ledger") != ledger_file
+                    or state.get("offset", 0) > size
+                    or (state.get("offset") and not _same_ledger(state.get("identity"),
+                                                                 ledger_identity(ledger_file)))):
+                state = None
+        return cls(ledger_file, state)
+
+    def update(self):
+        """Proses record baru sejak offset terakhir; kembalikan jumlahnya"""
+        added = 0
+        for record, offset in ledger.iter_records(self.ledger_file, self.state["offset"]):
+            self.add(record)
+            self.state["offset"] = offset
+            added += 1
+        self.state["identity"] = ledger_identity(self.ledger_file)
+        return added
+
+    def save(self, cache_path):
+        tmp_path = f"{cache_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f)
+        os.replace(tmp_path, cache_path)
+
+    def add(self, record):
+        if ledger.is_simulated(record):
+            return
+        state = self.state
+        status = record.get("status") if record.get("status") in STATUSES else "failed"
+        server = record.get("server") or "-"
+        date = record.get("date") or "-"
+
+        state["records"] += 1
+        counts = state["servers"].setdefault(server, {})
+        counts[status] = counts.get(status, 0) + 1
+
+        day = state["days"].setdefault(date, {"duration": {}})
+        day[status] = day.get(status, 0) + 1
+        if record.get("duration") is not None:
+            hist = LogHistogram(counts=day["duration"])
+            hist.add(record["duration"])
+            day["duration"] = hist.to_dict()
+            hist = LogHistogram(counts=state["durations"])
+            hist.add(record["duration"])
+            state["durations"] = hist.to_dict()
+
+        for step, seconds in (record.get("steps") or {}).items():
+            hist = LogHistogram(counts=state["steps"].get(step))
+            hist.add(seconds)
+            state["steps"][step] = hist.to_dict()
+
+        if status == "failed":
+            step = record.get("failed_step") or "unknown"
+            state["failed_steps"][step] = state["failed_steps"].get(step, 0) + 1
+            selector = record.get("failed_selector")
+            if selector:
+                state["failed_selectors"][selector] = state["failed_selectors"].get(selector, 0) + 1
+
+    def summary(self, days=14, top=5):
+        """Ringkasan siap-render (JSON-able)"""
+        state = self.state
+
+        servers = []
+        for server in sorted(state["servers"]):
+            counts = state["servers"][server]
+            total = sum(counts.get(s, 0) for s in STATUSES)
+            servers.append({
+                "server": server,
+                **{s: counts.get(s, 0) for s in STATUSES},
+                "total": total,
+                "success_rate": (counts.get("success", 0) + counts.get("no_reward", 0)) / total if total else None,
+            })
+
+        ordered_steps = [s for s in STEP_ORDER if s in state["steps"]]
+        ordered_steps += sorted(s for s in state["steps"] if s not in STEP_ORDER)
+        steps = []
+        for step in ordered_steps:
+            hist = LogHistogram(counts=state["steps"][step])
+            steps.append({
+                "step": step,
+                "count": hist.total(),
+                "p50": hist.percentile(50),
+                "p95": hist.percentile(95),
+                "p99": hist.percentile(99),
+            })
+
+        def top_items(counter):
+            return [{"name": k, "count": v} for k, v in sorted(counter.items(), key=lambda kv: -kv[1])[:top]]
+
+        trend = []
+        for date in sorted(state["days"])[-days:]:
+            day = state["days"][date]
+            total = sum(day.get(s, 0) for s in STATUSES)
+            hist = LogHistogram(counts=day.get("duration"))
+            trend.append({
+                "date": date,
+                **{s: day.get(s, 0) for s in STATUSES},
+                "total": total,
+                "success_rate": (day.get("success", 0) + day.get("no_reward", 0)) / total if total else None,
+                "duration_p50": hist.percentile(50),
+                "duration_p95": hist.percentile(95),
+            })
+
+        durations = LogHistogram(counts=state["durations"])
+        return {
+            "generated_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "ledger": state["ledger"],
+            "records": state["records"],
+            "duration": {"p50": durations.percentile(50), "p95": durations.percentile(95),
+                         "p99": durations.percentile(99)},
+            "servers": servers,
+            "steps": steps,
+            "top_failed_steps": top_items(state["failed_steps"]),
+            "top_failed_selectors": top_items(state["failed_selectors"]),
+            "trend": trend,
+        }
+
+
+def _sec(value):
+    return "-" if value is None else f"{value:.2f}s"
+
+
+def _pct(value):
+    return "-" if value is None else f"{value * 100:.0f}%"
+
+
+def render_table(summary):
+    """Render ringkasan sebagai teks untuk terminal"""
+    lines = [f"📊 Laporan fleet: {summary['records']} run "
+             f"(durasi p50 {_sec(summary['duration']['p50'])}, p95 {_sec(summary['duration']['p95'])})", ""]
+
+    lines.append(f"{'server':<32}{'success':>9}{'no_reward':>11}{'failed':>8}{'ok%':>6}")
+    for row in summary["servers"]:
+        lines.append(f"{row['server']:<32}{row['success']:>9}{row['no_reward']:>11}{row['failed']:>8}"
+                     f"{_pct(row['success_rate']):>6}")
+
+    lines += ["", f"{'step':<16}{'n':>7}{'p50':>9}{'p95':>9}{'p99':>9}"]
+    for row in summary["steps"]:
+        lines.append(f"{row['step']:<16}{row['count']:>7}{_sec(row['p50']):>9}{_sec(row['p95']):>9}{_sec(row['p99']):>9}")
+
+    lines += ["", "Step gagal terbanyak:"]
+    lines += [f"  {row['count']:>5}  {row['name']}" for row in summary["top_failed_steps"]] or ["  -"]
+    lines += ["Selector gagal terbanyak:"]
+    lines += [f"  {row['count']:>5}  {row['name']}" for row in summary["top_failed_selectors"]] or ["  -"]
+
+    lines += ["", f"{'tanggal':<12}{'run':>6}{'success':>9}{'no_reward':>11}{'failed':>8}{'ok%':>6}{'p50':>9}"]
+    for row in summary["trend"]:
+        lines.append(f"{row['date']:<12}{row['total']:>6}{row['success']:>9}{row['no_reward']:>11}{row['failed']:>8}"
+                     f"{_pct(row['success_rate']):>6}{_sec(row['duration_p50']):>9}")
+    return "\n".join(lines)
+
+
+def _html_table(headers, rows):
+    head = "".join(f"<th>{html.escape(h)}</th>" for h in headers)
+    body = "".join("<tr>" + "".join(f"<td>{html.escape(str(c))}</td>" for c in row) + "</tr>" for row in rows)
+    return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+
+def render_html(summary):
+    """Render ringkasan sebagai halaman HTML statis (tanpa aset eksternal)"""
+    servers = _html_table(
+        ["Server", "Success", "No reward", "Failed", "OK%"],
+        [(r["server"], r["success"], r["no_reward"], r["failed"], _pct(r["success_rate"])) for r in summary["servers"]],
+    )
+    steps = _html_table(
+        ["Step", "n", "p50", "p95", "p99"],
+        [(r["step"], r["count"], _sec(r["p50"]), _sec(r["p95"]), _sec(r["p99"])) for r in summary["steps"]],
+    )
+    failed_steps = _html_table(["Step", "Gagal"], [(r["name"], r["count"]) for r in summary["top_failed_steps"]])
+    failed_selectors = _html_table(["Selector", "Gagal"],
+                                   [(r["name"], r["count"]) for r in summary["top_failed_selectors"]])
+
+    trend_rows = []
+    for r in summary["trend"]:
+        rate = r["success_rate"] or 0
+        bar = f'<div class="bar"><span style="width:{rate * 100:.0f}%"></span></div>'
+        trend_rows.append(
+            f"<tr><td>{html.escape(r['date'])}</td><td>{r['total']}</td><td>{r['success']}</td>"
+            f"<td>{r['no_reward']}</td><td>{r['failed']}</td><td>{bar} {_pct(r['success_rate'])}</td>"
+            f"<td>{_sec(r['duration_p50'])}</td></tr>"
+        )
+    trend = ("<table><thead><tr><th>Tanggal</th><th>Run</th><th>Success</th><th>No reward</th><th>Failed</th>"
+             "<th>OK%</th><th>Durasi p50</th></tr></thead><tbody>" + "".join(trend_rows) + "</tbody></table>")
+
+    return f"""<!DOCTYPE html>
+<html lang="id">
+<head>
+<meta charset="utf-8">
+<title>Laporan Fleet Ninja Heroes</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; color: #222; }}
+table {{ border-collapse: collapse; margin-bottom: 2em; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 10px; text-align: left; }}
+th {{ background: #f0f0f0; }}
+.bar {{ display: inline-block; width: 80px; height: 10px; background: #f3c0c0; vertical-align: middle; }}
+.bar span {{ display: block; height: 100%; background: #5cb85c; }}
+</style>
+</head>
+<body>
+<h1>Laporan Fleet Ninja Heroes</h1>
+<p>{summary['records']} run &middot; durasi p50 {_sec(summary['duration']['p50'])}, p95 {_sec(summary['duration']['p95'])}
+&middot; dibuat {html.escape(summary['generated_at'])}</p>
+<h2>Per server</h2>
+{servers}
+<h2>Latensi per step</h2>
+{steps}
+<h2>Step gagal terbanyak</h2>
+{failed_steps}
+<h2>Selector gagal terbanyak</h2>
+{failed_selectors}
+<h2>Tren harian</h2>
+{trend}
+</body>
+</html>
+"""
+
+
+def build_report(ledger_file=None, cache_path=DEFAULT_CACHE, rebuild=False):
+    """Muat cache, proses record baru, simpan cache; kembalikan FleetReport"""
+    report = FleetReport.load(ledger_file, cache_path, rebuild=rebuild)
+    if report.update() and cache_path:
+        report.save(cache_path)
+    return report
+
+
+def add_arguments(parser):
+    parser.add_argument("--format", choices=["table", "json", "html"], default="table")
+    parser.add_argument("--output", help="Tulis ke file (default stdout)")
+    parser.add_argument("--cache", default=os.getenv("REPORT_CACHE", DEFAULT_CACHE), help="File cache agregat")
+    parser.add_argument("--days", type=int, default=14, help="Jumlah hari di tren")
+    parser.add_argument("--rebuild", action="store_true", help="Abaikan cache dan hitung ulang")
+
+
+def run(args, ledger_file=None):
+    report = build_report(ledger_file, args.cache, rebuild=args.rebuild)
+    summary = report.summary(days=args.days)
+    if args.format == "json":
+        output = json.dumps(summary, indent=2, ensure_ascii=False)
+    elif args.format == "html":
+        output = render_html(summary)
+    else:
+        output = render_table(summary)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+        print(f"📄 Laporan ditulis ke {args.output}")
+    else:
+        print(output)
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Laporan fleet dari ledger run")
+    parser.add_argument("--ledger", default=os.getenv("RUN_LEDGER"), help="File ledger (default runs.jsonl)")
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    return run(args, args.ledger)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait, Select
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException, ElementClickInterceptedException, WebDriverException
+from selenium.webdriver.common.alert import Alert
+from selenium.webdriver.common.action_chains import ActionChains
+import logging
+from urllib.parse import urlsplit
+
+from browser_backend import BrowserBackend, ClickIntercepted
+from launch_profiles import LAUNCH_PROFILES, chrome_arguments, resolve_profile
+
+logger = logging.getLogger(__name__)
+
+
+def _by(selector):
+    """Tentukan strategi pencarian dari bentuk selector"""
+    return By.XPATH if selector.startswith("//") else By.CSS_SELECTOR
+
+
+def _origin(url):
+    """scheme://host[:port] dari URL http(s), selain itu None"""
+    parts = urlsplit(url or "")
+    if parts.scheme not in ("http", "https"):
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class SeleniumBackend(BrowserBackend):
+    """Backend Chrome nyata melalui Selenium WebDriver"""
+
+    def __init__(self, headless=False, profile=None):
+        self.headless = headless
+        # Profil launch bernama (launch_profiles.py); default mengikuti headless
+        self.profile = resolve_profile(profile, headless)
+        self.driver = None
+        self.implicit_wait = 5
+        # Origin yang pernah dibuka, storage-nya dihapus saat reset_session
+        self.origins = set()
+
+    def start(self):
+        """Setup Chrome driver dengan opsi dari profil launch"""
+        profile = LAUNCH_PROFILES[self.profile]
+        chrome_options = Options()
+        for argument in chrome_arguments(self.profile):
+            chrome_options.add_argument(argument)
+        chrome_options.page_load_strategy = profile["page_load_strategy"]
+
+        self.driver = webdriver.Chrome(options=chrome_options)
+        self.driver.implicitly_wait(self.implicit_wait)  # Default; bot menimpa dari profil timing
+
+        if profile["user_agent"] == "mask":
+            # UA versi Chrome yang sebenarnya, tanpa penanda "HeadlessChrome"
+            user_agent = self.driver.execute_script("return navigator.userAgent")
+            self.driver.execute_cdp_cmd("Network.setUserAgentOverride",
+                                        {"userAgent": user_agent.replace("HeadlessChrome", "Chrome")})
+        logger.info(f"Chrome dijalankan dengan profil {self.profile}")
+
+    def process_id(self):
+        """PID chromedriver; proses Chrome adalah turunannya"""
+        if self.driver and self.driver.service.process:
+            return self.driver.service.process.pid
+        return None
+
+    def quit(self):
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+
+    def reset_session(self):
+        """Hapus semua state akun sebelumnya agar akun berikutnya tidak claim di sesi yang salah"""
+        try:
+            # sessionStorage terikat ke tab, tidak ikut terhapus oleh Storage.clearDataForOrigin
+            self.driver.execute_script("try { sessionStorage.clear(); localStorage.clear(); } catch (e) {}")
+        except WebDriverException as e:
+            logger.debug(f"Gagal membersihkan storage halaman: {e}")
+        # Cookie semua domain, bukan hanya domain halaman aktif seperti delete_all_cookies
+        self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        origins = self.origins | {_origin(self.driver.current_url)}
+        for origin in sorted(origin for origin in origins if origin):
+            self.driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        self.origins.clear()
+        self.driver.get("about:blank")
+
+    def set_implicit_wait(self, seconds):
+        self.implicit_wait = seconds
+        self.driver.implicitly_wait(seconds)
+
+    def wait_for(self, condition, timeout, poll=0.1):
+        # Tanpa implicit wait selama polling: setiap poll kosong akan memblok selama implicit wait
+        # sehingga timeout step hasil belajar (mis. 0.2 detik) tidak berlaku
+        self.driver.implicitly_wait(0)
+        try:
+            return super().wait_for(condition, timeout, poll)
+        finally:
+            self.driver.implicitly_wait(self.implicit_wait)
+
+    def navigate(self, url):
+        self.driver.get(url)
+        self.origins.update(origin for origin in (_origin(url), _origin(self.driver.current_url)) if origin)
+
+    def query_selector_all(self, selector):
+        return self.driver.find_elements(_by(selector), selector)
+
+    def click(self, element, method="native"):
+        if method == "native":
+            try:
+                element.click()
+            except ElementClickInterceptedException as e:
+                raise ClickIntercepted(str(e))
+        elif method == "script":
+            self.driver.execute_script("arguments[0].click();", element)
+        elif method == "actions":
+            ActionChains(self.driver).move_to_element(element).click().perform()
+        elif method == "event":
+            self.driver.execute_script("""
+                var element = arguments[0];
+                var rect = element.getBoundingClientRect();
+                var event = new MouseEvent('click', {
+                    view: window,
+                    bubbles: true,
+                    cancelable: true,
+                    clientX: rect.left + rect.width / 2,
+                    clientY: rect.top + rect.height / 2
+                });
+                element.dispatchEvent(event);
+            """, element)
+        else:
+            raise ValueError(f"Metode klik tidak dikenal: {method}")
+
+    def type_text(self, element, text):
+        element.clear()
+        element.send_keys(text)
+
+    def list_options(self, element):
+        return [(option.get_attribute("value"), option.text) for option in Select(element).options]
+
+    def select_option(self, element, text=None, value=None):
+        select = Select(element)
+        if text is not None:
+            select.select_by_visible_text(text)
+        else:
+            select.select_by_value(value)
+
+    def scroll_into_view(self, element):
+        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+
+    def execute_script(self, script, *args):
+        return self.driver.execute_script(script, *args)
+
+    def execute_async_script(self, script, *args, timeout=None):
+        if timeout is not None:
+            self.driver.set_script_timeout(timeout)
+        return self.driver.execute_async_script(script, *args)
+
+    def handle_dialog(self, timeout, accept=True):
+        try:
+            WebDriverWait(self.driver, timeout).until(EC.alert_is_present())
+        except TimeoutException:
+            return None
+
+        alert = Alert(self.driver)
+        text = alert.text
+        if accept:
+            alert.accept()
+        else:
+            alert.dismiss()
+        return text
+
+    def screenshot(self, path):
+        return self.driver.save_screenshot(path)
+
+    def screenshot_png(self):
+        return self.driver.get_screenshot_as_png()
@@ -0,0 +1,379 @@
+"""Soak test: ribuan claim simulasi terhadap situs tiruan lokal selama berjam-jam.
+
+WorkerPool daemon (browser hangat dipakai ulang antar akun) diberi job
+terus-menerus. Setiap --interval detik diambil sampel process tree proses
+ini (RSS, file descriptor, jumlah proses anak seperti chromedriver dan
+Chrome) serta pemakaian disk: file di direktori kerja (screenshot dsb.)
+dan profil sementara Chrome di direktori temp. Screenshot dirotasi oleh
+pool (--max-screenshots) seperti di daemon, sehingga jumlah file harus
+mendatar setelah warmup.
+
+Setelah selesai, kemiringan tiap metrik per jam dihitung dengan least
+squares dari sampel setelah warmup. Dengan FakeBackend "jam" berarti jam
+simulasi (jam nyata dibagi --time-scale), sehingga batas yang sama berlaku
+untuk run Chrome maupun run tiruan yang dipercepat. Soak gagal jika ada kemiringan yang
+melewati batas, atau jika masih ada proses anak setelah pool ditutup
+(chromedriver/Chrome yatim).
+
+Contoh:
+    python soak.py --duration 600                                  # FakeBackend, 10 menit
+    python soak.py --backend selenium --profile minimal --duration 14400
+    python soak.py --claims 5000 --max-rss-slope 20 --output soak.jsonl
+"""
+import argparse
+import glob
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import proc_stats
+from launch_profiles import PROFILE_NAMES
+
+logger = logging.getLogger(__name__)
+
+# Batas default kemiringan per jam; None = hanya ditampilkan
+SOAK_METRICS = {
+    "rss": {"label": "RSS process tree", "unit": "MB", "scale": 1 / 2 ** 20, "max_slope": 64.0},
+    "fds": {"label": "file descriptor", "unit": "", "scale": 1, "max_slope": 50.0},
+    "children": {"label": "proses anak", "unit": "", "scale": 1, "max_slope": 2.0},
+    "disk": {"label": "disk", "unit": "MB", "scale": 1 / 2 ** 20, "max_slope": 100.0},
+    "files": {"label": "file", "unit": "", "scale": 1, "max_slope": 100.0},
+    "latency": {"label": "latensi p50", "unit": "s", "scale": 1, "max_slope": None},
+}
+
+# Direktori profil sementara yang dibuat Chrome/chromedriver di direktori temp
+TEMP_PROFILE_PATTERNS = (".org.chromium.Chromium.*", ".com.google.Chrome.*", "scoped_dir*")
+
+# File milik soak sendiri di direktori kerja, tidak dihitung sebagai disk
+SOAK_FILES = ("soak_runs.jsonl", "timing_profile.json")
+
+
+def _path_size(path):
+    """Ukuran file, atau total ukuran file di dalam direktori"""
+    if not os.path.isdir(path):
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+def directory_usage(path, exclude=SOAK_FILES):
+    """(jumlah file, total byte) di direktori kerja, tanpa file milik soak"""
+    files = size = 0
+    for root, _, names in os.walk(path):
+        for name in names:
+            if root == path and name in exclude:
+                continue
+            try:
+                size += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                continue
+            files += 1
+    return files, size
+
+
+def temp_profile_usage(tempdir=None):
+    """(jumlah, total byte) profil sementara Chrome di direktori temp"""
+    tempdir = tempdir or tempfile.gettempdir()
+    paths = [p for pattern in TEMP_PROFILE_PATTERNS for p in glob.glob(os.path.join(tempdir, pattern))]
+    return len(paths), sum(_path_size(p) for p in paths)
+
+
+def least_squares_slope(points):
+    """Kemiringan garis least squares untuk [(x, y)], None jika kurang dari 2 titik"""
+    if len(points) < 2:
+        return None
+    n = len(points)
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if not var_x:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x
+
+
+class SoakSampler:
+    """Ambil sampel metrik process tree dan disk, tulis ke file JSONL secara bertahap"""
+
+    def __init__(self, workdir, output=None, pid=None):
+        self.workdir = workdir
+        self.pid = pid or os.getpid()
+        self.output = output
+        self.samples = []
+        self.started = time.monotonic()
+
+    def sample(self, claims=0, failed=0, latency=None, record=True):
+        stats = proc_stats.tree_stats(self.pid) or {"processes": 1, "rss": 0, "fds": 0}
+        files, file_bytes = directory_usage(self.workdir)
+        profiles, profile_bytes = temp_profile_usage()
+        sample = {
+            "t": round(time.monotonic() - self.started, 3),
+            "claims": claims,
+            "failed": failed,
+            "rss": stats["rss"],
+            "fds": stats["fds"],
+            "children": stats["processes"] - 1,
+            "disk": file_bytes + profile_bytes,
+            "files": files,
+            "temp_profiles": profiles,
+            "latency": latency,
+        }
+        if not record:
+            return sample
+        self.samples.append(sample)
+        if self.output:
+            with open(self.output, "a", encoding="utf-8") as f:
+                f.write(json.dumps(sample) + "\n")
+        return sample
+
+
+def evaluate(samples, warmup=0.0, limits=None, time_scale=1.0):
+    """Kemiringan per jam (dan per 1000 claim) tiap metrik dari sampel setelah warmup.
+
+    time_scale < 1 berarti satu detik nyata mewakili 1/time_scale detik
+    simulasi; kemiringan dihitung per jam simulasi. Kembalikan {metric: {slope_per_hour, slope_per_1000_claims, max_slope, ok}};
+    metrik tanpa cukup data bernilai None.
+    """
+    limits = limits or {}
+    steady = [s for s in samples if s["t"] >= warmup]
+    results = {}
+    for metric, spec in SOAK_METRICS.items():
+        points = [(s["t"], s[metric]) for s in steady if s.get(metric) is not None]
+        per_second = least_squares_slope(points)
+        per_claim = least_squares_slope([(s["claims"], s[metric]) for s in steady if s.get(metric) is not None])
+        max_slope = limits.get(metric, spec["max_slope"])
+        if per_second is None:
+            results[metric] = None
+            continue
+        per_hour = per_second * 3600 * time_scale * spec["scale"]
+        results[metric] = {
+            "slope_per_hour": per_hour,
+            "slope_per_1000_claims": per_claim * 1000 * spec["scale"] if per_claim is not None else None,
+            "max_slope": max_slope,
+            "ok": max_slope is None or per_hour <= max_slope,
+        }
+    return results
+
+
+def format_sample(sample):
+    latency = f"{sample['latency']:.2f}s" if sample["latency"] is not None else "-"
+    return (f"🧪 {sample['t'] / 60:7.1f} mnt  claim {sample['claims']:>7} (gagal {sample['failed']})  "
+            f"RSS {sample['rss'] / 2 ** 20:7.1f} MB  fd {sample['fds']:>5}  anak {sample['children']:>3}  "
+            f"disk {sample['disk'] / 2 ** 20:7.1f} MB ({sample['files']} file, {sample['temp_profiles']} profil)  "
+            f"p50 {latency}")
+
+
+def format_verdict(results):
+    """Tabel kemiringan per metrik untuk terminal"""
+    lines = [f"{'metrik':<18}{'per jam':>12}{'per 1000 claim':>16}{'batas/jam':>11}"]
+    for metric, spec in SOAK_METRICS.items():
+        result = results.get(metric)
+        unit = f" {spec['unit']}" if spec["unit"] else ""
+        if result is None:
+            lines.append(f"   {spec['label']:<15}{'-':>12}{'-':>16}{'-':>11}")
+            continue
+        per_claim = result["slope_per_1000_claims"]
+        per_claim = f"{per_claim:+.2f}" if per_claim is not None else "-"
+        limit = f"{result['max_slope']:g}" if result["max_slope"] is not None else "-"
+        mark = "✅" if result["ok"] else "❌"
+        lines.append(f"{mark} {spec['label']:<15}{result['slope_per_hour']:>+12.2f}{per_claim:>16}{limit:>11}{unit}")
+    return "\n".join(lines)
+
+
+def _make_account(index):
+    return {"email": f"soak{index}@example.com", "password": "rahasia", "server": "Server 39 - SSINJAA"}
+
+
+def _backend_factory(args):
+    if args.backend == "fake":
+        from fake_backend import FakeBackend
+        # Screenshot ditulis sungguhan (seukuran PNG Chrome) agar penumpukan file dan disk ikut terukur
+        return lambda: FakeBackend(write_screenshots=True, time_scale=args.time_scale,
+                                   screenshot_size=int(args.screenshot_kb * 1024))
+    from daemon import make_backend_factory
+    return make_backend_factory("selenium", headless=True, profile=args.profile)
+
+
+def _wait_for_children(sampler, baseline, grace):
+    """Tunggu proses anak keluar setelah pool ditutup; kembalikan sampel terakhir"""
+    deadline = time.monotonic() + grace
+    while True:
+        sample = sampler.sample(record=False)
+        if sample["children"] <= baseline or time.monotonic() >= deadline:
+            return sample
+        time.sleep(0.5)
+
+
+def run_soak(args):
+    """Jalankan soak sesuai argumen; kembalikan exit code"""
+    from daemon import WorkerPool
+    from timing_profile import TimingProfile
+
+    # Log per-step terlalu banyak untuk ribuan claim; diset setelah import bot (basicConfig INFO)
+    logging.getLogger().setLevel(logging.WARNING)
+
+    created_workdir = args.workdir is None
+    workdir = os.path.abspath(args.workdir or tempfile.mkdtemp(prefix="soak-"))
+    os.makedirs(workdir, exist_ok=True)
+    output = os.path.abspath(args.output)
+    open(output, "w").close()
+
+    server = None
+    event_url = args.event_url
+    if args.backend == "selenium" and not event_url:
+        import mock_site
+        fixture = None
+        if args.fixture:
+            with open(args.fixture, encoding="utf-8") as f:
+                fixture = json.load(f)
+        server, event_url = mock_site.start_in_background(fixture)
+        print(f"🌐 Mock site: {event_url}")
+
+    previous_cwd = os.getcwd()
+    # Screenshot ditulis relatif terhadap cwd
+    os.chdir(workdir)
+    try:
+        sampler = SoakSampler(workdir, output)
+        baseline = sampler.sample()
+        print(f"📁 Direktori kerja: {workdir}")
+        print(format_sample(baseline))
+
+        pool = WorkerPool(
+            _backend_factory(args),
+            workers=args.workers,
+            timing=TimingProfile(path=os.path.join(workdir, "timing_profile.json")),
+            ledger_path=os.path.join(workdir, "soak_runs.jsonl"),
+            event_url=event_url,
+            backend_name=args.backend,
+            max_screenshots=args.max_screenshots or None,
+        )
+        pool.start()
+
+        submitted = 0
+        next_sample = time.monotonic() + args.interval
+        deadline = time.monotonic() + args.duration
+        try:
+            while time.monotonic() < deadline and (not args.claims or submitted < args.claims):
+                status = pool.status()
+                # Antrean dijaga pendek agar job tidak menumpuk di memori
+                while status["queue_depth"] < args.workers and (not args.claims or submitted < args.claims):
+                    pool.enqueue(_make_account(submitted))
+                    submitted += 1
+                    status["queue_depth"] += 1
+                if time.monotonic() >= next_sample:
+                    status = pool.status()
+                    print(format_sample(sampler.sample(status["completed_total"], status["failed_total"],
+                                                       status["throughput"]["latency_p50"])))
+                    next_sample += args.interval
+                time.sleep(0.05)
+        except KeyboardInterrupt:
+            print("🛑 Dihentikan, menunggu job berjalan selesai...")
+
+        pool.drain()
+        pool.wait()
+        status = pool.status()
+        final = sampler.sample(status["completed_total"], status["failed_total"],
+                               status["throughput"]["latency_p50"])
+        print(format_sample(final))
+        after_close = _wait_for_children(sampler, baseline["children"], args.grace)
+    finally:
+        os.chdir(previous_cwd)
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    # Baseline diambil sebelum browser pertama dibuat
+    samples = sampler.samples[1:]
+    warmup = min(args.warmup, final["t"] / 4)
+    time_scale = _time_scale(args)
+    results = evaluate(samples, warmup, limits=_limits(args), time_scale=time_scale)
+    clock = f", jam simulasi x{1 / time_scale:g}" if time_scale != 1.0 else ""
+    print(f"\n📈 Kemiringan setelah warmup {warmup:.0f}s ({len(samples)} sampel, {final['claims']} claim, "
+          f"{final['failed']} gagal{clock}):")
+    print(format_verdict(results))
+
+    ok = True
+    if len([s for s in samples if s["t"] >= warmup]) < 3:
+        print("⚠️ Sampel setelah warmup kurang dari 3; perpanjang --duration atau perkecil --interval")
+        ok = False
+    if any(result is not None and not result["ok"] for result in results.values()):
+        ok = False
+    orphans = after_close["children"] - baseline["children"]
+    if orphans > 0:
+        print(f"❌ {orphans} proses anak masih hidup setelah pool ditutup (chromedriver/Chrome yatim)")
+        ok = False
+    if final["failed"] > final["claims"] * args.max_failure_rate:
+        print(f"❌ {final['failed']} dari {final['claims']} claim gagal")
+        ok = False
+
+    print(f"📝 Sampel: {output}")
+    if created_workdir and not args.keep_workdir:
+        shutil.rmtree(workdir, ignore_errors=True)
+    print("✅ Soak lolos" if ok else "❌ Soak gagal")
+    return 0 if ok else 1
+
+
+def _time_scale(args):
+    """Faktor jam nyata terhadap jam simulasi; 1 untuk Chrome atau FakeBackend tanpa sleep"""
+    if args.backend == "fake" and args.time_scale > 0:
+        return args.time_scale
+    return 1.0
+
+
+def _limits(args):
+    return {metric: getattr(args, f"max_{metric}_slope") for metric in SOAK_METRICS}
+
+
+def add_arguments(parser):
+    parser.add_argument("--backend", choices=["fake", "selenium"], default="fake",
+                        help="fake (tanpa Chrome) atau selenium terhadap mock_site.py")
+    parser.add_argument("--profile", choices=PROFILE_NAMES, default=os.getenv("CHROME_PROFILE"),
+                        help="Profil launch Chrome untuk --backend selenium")
+    parser.add_argument("--event-url", help="Pakai situs ini alih-alih mock site lokal")
+    parser.add_argument("--fixture", help="Fixture JSON untuk mock site (default fixture bawaan)")
+    parser.add_argument("--workers", type=int, default=2, help="Jumlah browser hangat")
+    parser.add_argument("--duration", type=float, default=3600, help="Lama soak dalam detik")
+    parser.add_argument("--claims", type=int, default=0, help="Berhenti setelah N claim (0 = sampai --duration)")
+    parser.add_argument("--interval", type=float, default=30, help="Jarak antar sampel (detik)")
+    parser.add_argument("--warmup", type=float, default=300,
+                        help="Sampel sebelum detik ini tidak dipakai (paling banyak 1/4 durasi run)")
+    parser.add_argument("--time-scale", type=float, default=0.1,
+                        help="Faktor jam nyata FakeBackend (0.1 = 1 detik virtual -> 100 ms)")
+    parser.add_argument("--screenshot-kb", type=float, default=100,
+                        help="Ukuran screenshot FakeBackend (KB)")
+    parser.add_argument("--max-screenshots", type=int, default=100,
+                        help="Retensi screenshot pool seperti daemon --max-screenshots (0 = tanpa batas); "
+                             "sebaiknya tercapai sebelum warmup selesai")
+    parser.add_argument("--grace", type=float, default=10,
+                        help="Waktu tunggu proses anak keluar setelah pool ditutup (detik)")
+    parser.add_argument("--max-failure-rate", type=float, default=0.01, help="Batas rasio claim gagal")
+    for metric, spec in SOAK_METRICS.items():
+        unit = f" {spec['unit']}" if spec["unit"] else ""
+        parser.add_argument(f"--max-{metric}-slope", type=float, default=spec["max_slope"],
+                            help=f"Batas kenaikan {spec['label']} per jam{unit} (default {spec['max_slope']})")
+    parser.add_argument("--workdir", help="Direktori kerja (default direktori temp yang dihapus setelah selesai)")
+    parser.add_argument("--keep-workdir", action="store_true", help="Jangan hapus direktori kerja temp")
+    parser.add_argument("--output", default="soak_samples.jsonl", help="File JSONL sampel")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Soak test kebocoran proses, fd dan disk untuk fleet jangka panjang")
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    return run_soak(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
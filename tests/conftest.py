@@ -0,0 +1,39 @@
+import copy
+import os
+import sys
+
+import pytest
+
+# Modul bot berada di root repo (tanpa package)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_backend import DEFAULT_FIXTURE, FakeBackend  # noqa: E402
+from ninja_heroes_bot import NinjaHeroesBot  # noqa: E402
+
+
+@pytest.fixture
+def fixture():
+    """Salinan fixture bawaan FakeBackend yang boleh diubah per test"""
+    return copy.deepcopy(DEFAULT_FIXTURE)
+
+
+@pytest.fixture
+def make_bot():
+    """Factory NinjaHeroesBot di atas FakeBackend (fixture bawaan jika backend tidak diberikan)"""
+    def make(backend=None, timing=None, fast_login=True):
+        bot = NinjaHeroesBot(
+            email="akun@example.com",
+            password="rahasia",
+            server_choice="Server 39 - SSINJAA",
+            backend=backend if backend is not None else FakeBackend(),
+            timing=timing,
+        )
+        bot.use_fast_login = fast_login
+        return bot
+    return make
+
+
+@pytest.fixture(autouse=True)
+def _workdir(tmp_path, monkeypatch):
+    # Screenshot, ledger dan profil timing ditulis relatif terhadap cwd
+    monkeypatch.chdir(tmp_path)
@@ -0,0 +1,70 @@
+from fake_backend import FakeBackend
+from ninja_heroes_bot import EMAIL_SELECTORS
+
+
+def test_success_with_fast_login(make_bot):
+    bot = make_bot()
+    assert bot.run() is True
+    assert bot.last_status == "success"
+    assert bot.login_method == "fast"
+    fields = bot.result_fields()
+    assert fields["failed_step"] is None
+    assert {"login_button", "login_form", "select_server", "submit_server", "alert"} <= set(fields["steps"])
+
+
+def test_success_with_step_by_step_login(make_bot):
+    bot = make_bot(fast_login=False)
+    assert bot.run() is True
+    assert bot.last_status == "success"
+    assert bot.login_method == "steps"
+
+
+def test_no_reward(make_bot, fixture):
+    fixture["elements"]["login_submit"]["on_click"]["show"] = []
+    bot = make_bot(FakeBackend(fixture=fixture))
+    assert bot.run() is True
+    assert bot.last_status == "no_reward"
+
+
+def test_intercepted_submit_falls_back_to_script_click(make_bot, fixture):
+    fixture["elements"]["login_submit"]["intercept"] = True
+    backend = FakeBackend(fixture=fixture)
+    clicks = []
+    original_click = backend.click
+
+    def click(element, method="native"):
+        clicks.append((element.element_id, method))
+        return original_click(element, method)
+
+    backend.click = click
+    bot = make_bot(backend, fast_login=False)
+    assert bot.run() is True
+    assert bot.last_status == "success"
+    # Klik native tertahan, lalu klik JavaScript berhasil
+    submit_clicks = [method for element_id, method in clicks if element_id == "login_submit"]
+    assert submit_clicks == ["native", "script"]
+
+
+def test_missing_login_modal_fails_at_login_form(make_bot, fixture):
+    fixture["elements"]["login_button"]["on_click"]["show"] = []
+    bot = make_bot(FakeBackend(fixture=fixture))
+    assert bot.run() is False
+    assert bot.last_status == "failed"
+    assert bot.result_fields()["failed_step"] == "login_form"
+
+
+def test_missing_login_modal_records_its_selector(make_bot, fixture):
+    fixture["elements"]["login_button"]["on_click"]["show"] = []
+    bot = make_bot(FakeBackend(fixture=fixture))
+    assert bot.run() is False
+    assert bot.result_fields()["failed_selector"] == "#LoginForm"
+
+
+def test_failed_selector_is_last_selector_waited_for(make_bot, fixture):
+    # Modal muncul tetapi field email tidak cocok dengan selector mana pun
+    fixture["elements"]["email"]["selectors"] = ["#user-mail"]
+    bot = make_bot(FakeBackend(fixture=fixture), fast_login=False)
+    assert bot.run() is False
+    fields = bot.result_fields()
+    assert fields["failed_step"] == "login_form"
+    assert fields["failed_selector"] == EMAIL_SELECTORS[-1]
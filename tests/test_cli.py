@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+import cli
+import ledger
+import report
+
+
+@pytest.mark.parametrize("argv, attr, expected", [
+    (["bench", "--skip-flow", "--accounts", "3"], "bench_args", ["--skip-flow", "--accounts", "3"]),
+    (["capture", "diff", "captures/", "--against", "old/"], "capture_args", ["diff", "captures/", "--against", "old/"]),
+    (["soak", "--duration", "60"], "soak_args", ["--duration", "60"]),
+])
+def test_passthrough_commands_receive_leading_options(monkeypatch, argv, attr, expected):
+    received = []
+    monkeypatch.setattr(cli, f"cmd_{argv[0]}", lambda args: received.append(getattr(args, attr)) or 0)
+    assert cli.main(argv) == 0
+    assert received == [expected]
+
+
+def test_unknown_option_still_rejected_for_other_commands(capsys):
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["ledger", "--bogus"])
+    assert exc.value.code == 2
+    assert "--bogus" in capsys.readouterr().err
+
+
+def test_fake_backend_runs_are_not_real_claims(tmp_path, monkeypatch):
+    monkeypatch.delenv("TIMING_PROFILE", raising=False)
+    accounts = tmp_path / "accounts.json"
+    accounts.write_text(json.dumps([{"email": "akun@example.com", "password": "rahasia",
+                                     "server": "Server 39 - SSINJAA"}]))
+    runs = str(tmp_path / "runs.jsonl")
+    assert cli.main(["--ledger", runs, "batch", "--backend", "fake", "--accounts", str(accounts)]) == 0
+
+    records = list(ledger.records_for_date(path=runs))
+    assert [(r["status"], r["backend"]) for r in records] == [("success", "fake")]
+    assert ledger.claimed_emails(path=runs) == set()
+    assert report.build_report(runs, str(tmp_path / "cache.json")).state["records"] == 0
+    # Latensi virtual tidak melatih profil timing Chrome
+    assert not (tmp_path / "timing_profile.json").exists()
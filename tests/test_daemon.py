@@ -0,0 +1,158 @@
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+import ledger
+from daemon import ControlHandler, PoolDraining, WorkerPool
+from fake_backend import FakeBackend
+from ninja_heroes_bot import LOGIN_BUTTON_SELECTORS
+
+
+def account(index):
+    return {"email": f"akun{index}@example.com", "password": "rahasia", "server": "Server 39 - SSINJAA"}
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("kondisi tidak terpenuhi")
+        time.sleep(0.01)
+
+
+def test_workers_do_not_overwrite_each_others_screenshots(tmp_path):
+    pool = WorkerPool(lambda: FakeBackend(time_scale=0.001), workers=4, ledger_path=str(tmp_path / "runs.jsonl"))
+    pool.start()
+    for index in range(40):
+        pool.enqueue(account(index))
+    pool.drain()
+    pool.wait()
+    assert pool.status()["completed_total"] == 40
+    assert len([name for name in os.listdir(tmp_path) if name.startswith("success")]) == 40
+
+
+def test_browsers_are_started_before_first_job(tmp_path):
+    backends = []
+
+    def factory():
+        backends.append(FakeBackend())
+        return backends[-1]
+
+    pool = WorkerPool(factory, workers=2, ledger_path=str(tmp_path / "runs.jsonl"))
+    pool.start()
+    wait_until(lambda: set(pool.status()["workers"].values()) == {"idle"})
+    assert len(backends) == 2 and all(backend.started for backend in backends)
+
+    pool.enqueue(account(0))
+    pool.drain()
+    pool.wait()
+    # Browser hangat dipakai langsung: tidak ada browser baru dan tidak ada reset sesi
+    assert len(backends) == 2
+    assert pool.get_job(1)["status"] == "success"
+
+
+def test_jobs_queued_before_drain_are_finished(tmp_path):
+    pool = WorkerPool(FakeBackend, workers=2, ledger_path=str(tmp_path / "runs.jsonl"))
+    pool.start()
+    jobs = [pool.enqueue(account(index)) for index in range(6)]
+    pool.drain()
+    with pytest.raises(PoolDraining):
+        pool.enqueue(account(99))
+    pool.wait()
+    assert [pool.get_job(job["id"])["status"] for job in jobs] == ["success"] * 6
+
+
+@pytest.fixture
+def api(tmp_path):
+    pool = WorkerPool(FakeBackend, workers=1, ledger_path=str(tmp_path / "runs.jsonl"))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ControlHandler)
+    server.pool = pool
+    server.on_drain = lambda: None
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    pool.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+    pool.drain()
+    pool.wait()
+
+
+def post(url, body):
+    request = urllib.request.Request(url, data=body.encode("utf-8"), method="POST")
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+@pytest.mark.parametrize("body", ["[1]", '"email"', "not json"])
+def test_non_object_body_is_rejected(api, body):
+    status, payload = post(f"{api}/jobs", body)
+    assert status == 400
+    assert "error" in payload
+
+
+def test_ad_hoc_job_without_email_is_rejected(api):
+    status, payload = post(f"{api}/jobs", json.dumps({"password": "rahasia", "server": "Server 39 - SSINJAA"}))
+    assert status == 400
+    assert "email" in payload["error"]
+
+
+def test_ad_hoc_job_is_accepted(api):
+    status, payload = post(f"{api}/jobs", json.dumps(account(1)))
+    assert status == 202
+    assert payload["email"] == "akun1@example.com"
+
+
+def test_ledger_records_real_backend_name(tmp_path):
+    runs = str(tmp_path / "runs.jsonl")
+    pool = WorkerPool(FakeBackend, workers=1, ledger_path=runs, backend_name="fake")
+    pool.start()
+    pool.enqueue(account(0))
+    pool.drain()
+    pool.wait()
+    assert [record["backend"] for record in ledger.records_for_date(path=runs)] == ["fake"]
+    assert ledger.claimed_emails(path=runs) == set()
+
+
+def test_next_job_starts_logged_out(tmp_path):
+    runs = str(tmp_path / "runs.jsonl")
+    pool = WorkerPool(FakeBackend, workers=1, ledger_path=runs, backend_name="fake")
+    pool.start()
+    pool.enqueue(account(0))
+    pool.enqueue(account(1))
+    pool.drain()
+    pool.wait()
+    records = ledger.records_for_date(path=runs)
+    # Akun kedua login sendiri, bukan claim di sesi akun pertama yang masih tersimpan
+    assert [(record["email"], record["login_method"]) for record in records] == [
+        ("akun0@example.com", "fast"), ("akun1@example.com", "fast")]
+
+
+def test_fake_session_survives_navigate_but_not_reset(make_bot):
+    backend = FakeBackend()
+    assert make_bot(backend).run() is True
+    backend.navigate("https://ninjaheroes.example/event")
+    assert not backend.find_first(LOGIN_BUTTON_SELECTORS[0], visible=True)
+    backend.reset_session()
+    backend.navigate("https://ninjaheroes.example/event")
+    assert backend.find_first(LOGIN_BUTTON_SELECTORS[0], visible=True)
+
+
+def test_old_screenshots_are_removed_over_limit(tmp_path):
+    pool = WorkerPool(FakeBackend, workers=2, ledger_path=str(tmp_path / "runs.jsonl"), max_screenshots=5)
+    pool.start()
+    for index in range(12):
+        pool.enqueue(account(index))
+    pool.drain()
+    pool.wait()
+    screenshots = [name for name in os.listdir(tmp_path) if name.startswith("success")]
+    assert len(screenshots) == 5
+    assert sorted(screenshots) == sorted(pool._screenshots)
@@ -0,0 +1,72 @@
+from fake_backend import FakeBackend
+from timing_profile import TimingProfile
+
+
+def count_submit_clicks(backend):
+    clicks = []
+    original_click = backend.click
+
+    def click(element, method="native"):
+        if element.element_id == "login_submit":
+            clicks.append(method)
+        return original_click(element, method)
+
+    backend.click = click
+    return clicks
+
+
+def test_fast_login_skips_fixed_post_login_sleep(make_bot):
+    bot = make_bot()
+    assert bot.run() is True
+    assert bot.login_method == "fast"
+    # Respon login 1.5 detik + pengecekan status, bukan jeda tetap 8 detik
+    assert bot.step_timings["login_form"] < 3
+
+
+def test_rejected_login_does_not_fall_back(make_bot):
+    backend = FakeBackend()
+    backend.script_handlers["fast_login"] = lambda options: {
+        "ok": False, "stage": "rejected", "status": 200, "message": "Password salah"}
+    bot = make_bot(backend)
+    assert bot.run() is False
+    assert bot.login_method == "fast"
+    assert bot.result_fields()["failed_step"] == "login_form"
+    # Form tidak diisi ulang lewat jalur step-by-step
+    assert "type" not in backend.calls
+
+
+def test_missing_field_before_submit_falls_back_to_steps(make_bot):
+    backend = FakeBackend()
+    backend.script_handlers["fast_login"] = lambda options: {
+        "ok": False, "stage": "email", "message": "elemen form login tidak ditemukan"}
+    bot = make_bot(backend)
+    assert bot.run() is True
+    assert bot.last_status == "success"
+    assert bot.login_method == "steps"
+
+
+def test_timeout_after_submit_checks_login_instead_of_resubmitting(make_bot, fixture):
+    # Respon login (delay on_click) datang setelah timeout login cepat
+    fixture["elements"]["login_submit"]["on_click"]["delay"] = 3
+    backend = FakeBackend(fixture=fixture)
+    clicks = count_submit_clicks(backend)
+    timing = TimingProfile(overrides={"fast_login": {"timeout": 1}})
+    bot = make_bot(backend, timing=timing)
+    assert bot.run() is True
+    assert bot.last_status == "success"
+    assert bot.login_method == "fast"
+    assert timing.recent["fast_login"] == [0]
+    assert clicks == ["script"]
+    assert "type" not in backend.calls
+
+
+def test_unconfirmed_login_after_submit_fails_without_resubmitting(make_bot, fixture):
+    fixture["elements"]["login_submit"]["on_click"]["delay"] = 60
+    backend = FakeBackend(fixture=fixture)
+    clicks = count_submit_clicks(backend)
+    bot = make_bot(backend, timing=TimingProfile(overrides={"fast_login": {"timeout": 1}}))
+    assert bot.run() is False
+    fields = bot.result_fields()
+    assert fields["failed_step"] == "login_form"
+    assert fields["failed_selector"] == "#LoginForm"
+    assert clicks == ["script"]
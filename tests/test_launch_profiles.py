@@ -0,0 +1,53 @@
+import pytest
+
+from launch_profiles import (LEGACY_USER_AGENT, MINIMAL_ARGS, PROFILE_NAMES, STABILITY_ARGS, chrome_arguments,
+                             resolve_profile)
+
+
+def headless_flags(arguments):
+    return [argument for argument in arguments if argument.startswith("--headless")]
+
+
+def test_default_profile_follows_headless():
+    assert resolve_profile(None, headless=True) == "headless-new"
+    assert resolve_profile(None, headless=False) == "debug"
+    assert resolve_profile("minimal", headless=False) == "minimal"
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError, match="tidak dikenal"):
+        resolve_profile("turbo")
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("debug", []),
+    ("headless-new", ["--headless=new"]),
+    ("minimal", ["--headless=new"]),
+    ("legacy", ["--headless"]),
+])
+def test_headless_variant(name, expected):
+    assert headless_flags(chrome_arguments(name)) == expected
+
+
+def test_every_profile_keeps_stability_flags():
+    for name in PROFILE_NAMES:
+        assert set(STABILITY_ARGS) <= set(chrome_arguments(name))
+
+
+def test_minimal_profile_disables_background_features():
+    arguments = chrome_arguments("minimal")
+    assert set(MINIMAL_ARGS) <= set(arguments)
+    assert "--window-size=1280,720" in arguments
+    assert not set(MINIMAL_ARGS) & set(chrome_arguments("headless-new"))
+
+
+@pytest.mark.parametrize("name", ["debug", "headless-new", "legacy"])
+def test_full_window_size(name):
+    assert "--window-size=1920,1080" in chrome_arguments(name)
+
+
+def test_user_agent_flag_only_for_fixed_user_agent():
+    user_agents = {name: [a for a in chrome_arguments(name) if a.startswith("--user-agent")] for name in PROFILE_NAMES}
+    # "mask" diterapkan lewat CDP setelah start, bukan flag
+    assert user_agents == {"debug": [], "headless-new": [], "minimal": [],
+                           "legacy": [f"--user-agent={LEGACY_USER_AGENT}"]}
@@ -0,0 +1,76 @@
+import pytest
+
+from fake_backend import DEFAULT_FIXTURE, FakeBackend
+from ninja_heroes_bot import ROLE_SELECTORS
+from page_capture import PageCapture, diff_snapshot, load_snapshots, snapshots_to_fixture
+from timing_profile import TimingProfile
+
+
+@pytest.fixture
+def capture_run(make_bot):
+    """Jalankan flow di FakeBackend dengan capture; kembalikan (berhasil, snapshot)"""
+    def run(tmp_path, fixture):
+        bot = make_bot(FakeBackend(fixture=fixture))
+        bot.page_capture = PageCapture(str(tmp_path / "captures"), "akun")
+        ok = bot.run()
+        return ok, load_snapshots([bot.page_capture.directory])
+    return run
+
+
+def findings_by_role(snapshots, reference, timing=None):
+    findings = {}
+    for snapshot in snapshots:
+        for finding in diff_snapshot(snapshot, reference, timing):
+            findings.setdefault(finding["role"], []).append(finding)
+    return findings
+
+
+def test_unchanged_page_has_no_drift(capture_run, tmp_path):
+    ok, snapshots = capture_run(tmp_path, DEFAULT_FIXTURE)
+    assert ok
+    assert {s["step"] for s in snapshots} >= {"login_button", "login_form", "find_reward", "submit_server"}
+    assert findings_by_role(snapshots, DEFAULT_FIXTURE) == {}
+
+
+def test_first_selector_shift_is_a_warning_with_cost(capture_run, tmp_path, fixture):
+    # Markup baru hanya cocok dengan selector ketiga tombol login
+    fixture["elements"]["login_button"]["selectors"] = [ROLE_SELECTORS["login_button"][2]]
+    ok, snapshots = capture_run(tmp_path, fixture)
+    assert ok
+
+    timing = TimingProfile(overrides={"implicit": {"timeout": 2}})
+    findings = findings_by_role(snapshots, DEFAULT_FIXTURE, timing)
+    assert list(findings) == ["login_button"]
+    finding = findings["login_button"][0]
+    assert finding["level"] == "warning"
+    assert finding["cost"] == pytest.approx(2 * 2)
+
+
+def test_missing_element_is_an_error(capture_run, tmp_path, fixture):
+    fixture["elements"]["email"]["selectors"] = ["#LoginForm input#user-mail"]
+    _, snapshots = capture_run(tmp_path, fixture)
+    findings = findings_by_role(snapshots, DEFAULT_FIXTURE)
+    # Snapshot awal step dan snapshot screenshot error sama-sama melaporkannya
+    assert {f["level"] for f in findings["email"]} == {"error"}
+    assert all(f["cost"] > 0 for f in findings["email"])
+
+
+def test_server_option_change_is_reported(capture_run, tmp_path, fixture):
+    fixture["elements"]["server_select"]["options"].append(["40", "Server 40 - BARU"])
+    ok, snapshots = capture_run(tmp_path, fixture)
+    assert ok
+    findings = findings_by_role(snapshots, DEFAULT_FIXTURE)
+    assert [f["level"] for f in findings["server_select"]] == ["info"]
+    assert "Server 40 - BARU" in findings["server_select"][0]["message"]
+
+
+def test_fixture_from_snapshots_round_trips(capture_run, tmp_path, fixture):
+    fixture["elements"]["login_button"]["selectors"] = [ROLE_SELECTORS["login_button"][2]]
+    _, snapshots = capture_run(tmp_path, fixture)
+    generated = snapshots_to_fixture(snapshots)
+    assert generated["elements"]["login_button"]["selectors"] == [ROLE_SELECTORS["login_button"][2]]
+    # Snapshot yang sama tidak punya drift terhadap fixture hasil capture-nya
+    assert findings_by_role(snapshots, generated) == {}
+
+    ok, _ = capture_run(tmp_path / "again", generated)
+    assert ok
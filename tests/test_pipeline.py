@@ -0,0 +1,107 @@
+import threading
+import time
+
+import ledger
+from fake_backend import FakeBackend
+from pipeline import STAGES, PipelineRunner, Stage
+
+
+def accounts(count):
+    return [{"email": f"akun{i}@example.com", "password": "rahasia", "server": "Server 39 - SSINJAA"}
+            for i in range(count)]
+
+
+class BrokenPageBackend(FakeBackend):
+    """Browser berhasil start tetapi halaman event gagal dibuka"""
+
+    def navigate(self, url):
+        raise RuntimeError("net::ERR_CONNECTION_RESET")
+
+
+def tracking_factory(backends, broken=()):
+    lock = threading.Lock()
+
+    def factory():
+        with lock:
+            backend = BrokenPageBackend() if len(backends) in broken else FakeBackend()
+            backends.append(backend)
+        return backend
+    return factory
+
+
+def run_in_thread(runner, items, timeout=10):
+    thread = threading.Thread(target=runner.run, args=(items,), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return not thread.is_alive()
+
+
+def test_all_accounts_are_claimed_and_recorded(tmp_path):
+    runs = str(tmp_path / "runs.jsonl")
+    runner = PipelineRunner(FakeBackend, launch_workers=2, claim_workers=2, ledger_path=runs, backend_name="fake")
+    results = runner.run(accounts(8))
+    expected = {account["email"] for account in accounts(8)}
+    assert {result["email"] for result in results} == expected
+    assert all(result["status"] == "success" for result in results)
+    records = ledger.records_for_date(path=runs)
+    assert sorted(record["email"] for record in records) == sorted(expected)
+    assert {record["backend"] for record in records} == {"fake"}
+    assert runner.stats()["accounts"] == 8
+
+
+def test_launch_failure_is_recorded_and_torn_down(tmp_path):
+    runs = str(tmp_path / "runs.jsonl")
+    backends = []
+    runner = PipelineRunner(tracking_factory(backends, broken={1}), ledger_path=runs, backend_name="fake")
+    results = runner.run(accounts(3))
+    assert [result["status"] for result in results] == ["success", "failed", "success"]
+    assert [record["status"] for record in ledger.records_for_date(path=runs)] == ["success", "failed", "success"]
+    # Browser yang gagal membuka halaman tetap ditutup di teardown
+    assert len(backends) == 3
+    assert not any(backend.started for backend in backends)
+    assert isinstance(backends[1], BrokenPageBackend) and "quit" in backends[1].calls
+    assert runner.stats()["stages"]["teardown"]["items"] == 3
+
+
+def test_queues_never_exceed_their_depth(tmp_path):
+    depth = {"launch": 1, "claim": 2, "teardown": 1, "screenshot": 3}
+    runner = PipelineRunner(lambda: FakeBackend(time_scale=0.0005), launch_workers=3, claim_workers=1,
+                            depth=depth, ledger_path=str(tmp_path / "runs.jsonl"), backend_name="fake")
+    runner.run(accounts(10))
+    stages = runner.stats()["stages"]
+    for name in STAGES:
+        assert stages[name]["max_queued"] <= depth[name]
+    # Launch lebih cepat dari claim sehingga antrean claim benar-benar terisi
+    assert stages["claim"]["max_queued"] == depth["claim"]
+
+
+def test_stop_propagates_through_multi_worker_stages(tmp_path):
+    def slow_launch():
+        # Worker launch lain masih memegang akun saat worker pertama menerima sinyal stop
+        time.sleep(0.05)
+        return FakeBackend()
+
+    runner = PipelineRunner(slow_launch, launch_workers=3, claim_workers=2, teardown_workers=2,
+                            ledger_path=str(tmp_path / "runs.jsonl"), backend_name="fake")
+    assert run_in_thread(runner, accounts(5))
+    assert len(runner.results) == 5
+    assert run_in_thread(PipelineRunner(FakeBackend, launch_workers=2, backend_name="fake"), [])
+
+
+def test_stage_errors_do_not_block_stop():
+    def fail(item):
+        raise ValueError(item)
+
+    seen = []
+    first = Stage("first", fail, workers=2, depth=1)
+    second = Stage("second", seen.append, workers=2, depth=1)
+    first.next_stage = second
+    first.start()
+    second.start()
+    for item in range(4):
+        first.put(item)
+    first.close()
+    first.join()
+    second.join()
+    assert first.stats(1.0)["errors"] == 4
+    assert seen == []
@@ -0,0 +1,72 @@
+import json
+import os
+
+import ledger
+import report
+
+
+def write(path, records, mode="a"):
+    with open(path, mode, encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+def record(status="success", server="Server 39 - SSINJAA", duration=20.0, **extra):
+    return ledger.make_record("akun@example.com", server, status, duration,
+                              steps={"login_form": 2.0, "alert": 0.5}, **extra)
+
+
+def test_incremental_update_reads_only_new_records(tmp_path):
+    ledger_file, cache = str(tmp_path / "runs.jsonl"), str(tmp_path / "cache.json")
+    write(ledger_file, [record(), record("no_reward")])
+    first = report.build_report(ledger_file, cache)
+    assert first.state["records"] == 2
+
+    write(ledger_file, [record("failed", failed_step="login_form", failed_selector="#LoginForm")])
+    loaded = report.FleetReport.load(ledger_file, cache)
+    assert loaded.state["offset"] == first.state["offset"]
+    assert loaded.update() == 1
+
+    summary = loaded.summary()
+    assert summary["records"] == 3
+    assert summary["servers"][0]["failed"] == 1
+    assert summary["top_failed_steps"] == [{"name": "login_form", "count": 1}]
+    assert summary["top_failed_selectors"] == [{"name": "#LoginForm", "count": 1}]
+    assert [step["step"] for step in summary["steps"]] == ["login_form", "alert"]
+
+
+def test_incomplete_last_line_is_read_later(tmp_path):
+    ledger_file = str(tmp_path / "runs.jsonl")
+    write(ledger_file, [record()])
+    with open(ledger_file, "a", encoding="utf-8") as f:
+        f.write('{"status": "succ')
+    fleet = report.FleetReport.load(ledger_file)
+    assert fleet.update() == 1
+    with open(ledger_file, "a", encoding="utf-8") as f:
+        f.write('ess", "server": "Server 1 - EXAMPLE"}\n')
+    assert fleet.update() == 1
+    assert fleet.state["records"] == 2
+
+
+def test_rotated_ledger_larger_than_offset_is_rebuilt(tmp_path):
+    ledger_file, cache = str(tmp_path / "runs.jsonl"), str(tmp_path / "cache.json")
+    write(ledger_file, [record(duration=1.0)])
+    report.build_report(ledger_file, cache)
+
+    # Rotasi: file baru (inode lain) yang sudah lebih besar dari offset cache
+    os.replace(ledger_file, str(tmp_path / "runs.jsonl.1"))
+    write(ledger_file, [record("failed", duration=123.456) for _ in range(5)])
+    rebuilt = report.build_report(ledger_file, cache)
+    assert rebuilt.state["records"] == 5
+    assert rebuilt.summary()["servers"][0]["failed"] == 5
+
+
+def test_rewritten_ledger_with_same_inode_is_rebuilt(tmp_path):
+    ledger_file, cache = str(tmp_path / "runs.jsonl"), str(tmp_path / "cache.json")
+    write(ledger_file, [record(duration=1.0)])
+    report.build_report(ledger_file, cache)
+
+    write(ledger_file, [record("no_reward", duration=99.0) for _ in range(4)], mode="w")
+    rebuilt = report.build_report(ledger_file, cache)
+    assert rebuilt.state["records"] == 4
+    assert rebuilt.summary()["servers"][0]["no_reward"] == 4
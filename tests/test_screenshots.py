@@ -0,0 +1,20 @@
+from ninja_heroes_bot import unique_screenshot_path
+
+
+def test_first_screenshot_keeps_its_name():
+    assert unique_screenshot_path("success.png") == "success.png"
+
+
+def test_existing_names_are_not_probed_one_by_one(monkeypatch):
+    checked = []
+
+    def exists(path):
+        checked.append(path)
+        return path == "success.png"
+
+    monkeypatch.setattr("os.path.exists", exists)
+    paths = {unique_screenshot_path("success.png") for _ in range(50)}
+    assert len(paths) == 50
+    assert all(path.startswith("success_") and path.endswith(".png") for path in paths)
+    # Satu pengecekan nama asli dan satu untuk nama baru per screenshot, bukan name_1..name_N
+    assert len(checked) == 100
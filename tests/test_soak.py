@@ -0,0 +1,70 @@
+import os
+
+import pytest
+
+from fake_backend import FakeBackend
+from soak import SOAK_METRICS, directory_usage, evaluate, least_squares_slope
+
+
+def series(count=10, step=60, warmup_spike=0, **growth):
+    """Sampel tiap `step` detik; growth = kenaikan per sampel per metrik"""
+    samples = []
+    for i in range(count):
+        sample = {"t": i * step, "claims": i * 10, "failed": 0, "rss": 100 * 2 ** 20, "fds": 20,
+                  "children": 0, "disk": 0, "files": 0, "latency": 1.0}
+        for metric, per_sample in growth.items():
+            sample[metric] += i * per_sample
+        if i == 0:
+            sample["rss"] += warmup_spike
+        samples.append(sample)
+    return samples
+
+
+def test_least_squares_slope():
+    assert least_squares_slope([(0, 1), (1, 3), (2, 5)]) == pytest.approx(2)
+    assert least_squares_slope([(0, 1)]) is None
+    assert least_squares_slope([(1, 1), (1, 2)]) is None
+
+
+def test_flat_series_passes():
+    results = evaluate(series())
+    assert all(result["ok"] for result in results.values())
+    assert results["rss"]["slope_per_hour"] == pytest.approx(0)
+
+
+def test_growth_over_limit_fails():
+    # 1 file per menit = 60 file/jam (lolos), 2 file per menit = 120 file/jam (gagal)
+    assert evaluate(series(files=1))["files"]["ok"]
+    results = evaluate(series(files=2))
+    assert results["files"]["slope_per_hour"] == pytest.approx(120)
+    assert results["files"]["slope_per_1000_claims"] == pytest.approx(200)
+    assert not results["files"]["ok"]
+    assert evaluate(series(files=2), limits={"files": 150})["files"]["ok"]
+
+
+def test_warmup_excludes_early_samples():
+    samples = series(warmup_spike=-50 * 2 ** 20)
+    assert not evaluate(samples)["rss"]["ok"]
+    assert evaluate(samples, warmup=60)["rss"]["slope_per_hour"] == pytest.approx(0)
+
+
+def test_slope_per_simulated_hour():
+    # 2 MB per menit nyata = 120 MB/jam, tetapi dengan time_scale 0.1 hanya 12 MB per jam simulasi
+    results = evaluate(series(disk=2 * 2 ** 20), time_scale=0.1)
+    assert results["disk"]["slope_per_hour"] == pytest.approx(12)
+    assert results["disk"]["ok"]
+
+
+def test_metric_without_limit_and_without_data():
+    results = evaluate(series(latency=5))
+    assert SOAK_METRICS["latency"]["max_slope"] is None
+    assert results["latency"]["ok"]
+    assert evaluate(series(count=1)) == {metric: None for metric in SOAK_METRICS}
+
+
+def test_directory_usage_skips_soak_files(tmp_path):
+    backend = FakeBackend(write_screenshots=True, screenshot_size=4096)
+    backend.screenshot(str(tmp_path / "a.png"))
+    (tmp_path / "soak_runs.jsonl").write_text("{}\n")
+    assert os.path.getsize(tmp_path / "a.png") == 4096
+    assert directory_usage(str(tmp_path)) == (1, 4096)
@@ -0,0 +1,109 @@
+import pytest
+
+from fake_backend import FakeBackend
+from timing_profile import DEFAULT_TIMEOUTS, MIN_TIMEOUTS, TimingProfile
+
+
+def trained(step, seconds, count=20, **kwargs):
+    profile = TimingProfile(**kwargs)
+    for _ in range(count):
+        profile.record(step, seconds)
+    return profile
+
+
+def test_default_until_enough_samples():
+    profile = trained("alert", 0.5, count=19)
+    assert profile.timeout("alert") == DEFAULT_TIMEOUTS["alert"]
+
+
+def test_percentile_plus_margin_after_enough_samples():
+    profile = trained("alert", 0.5)
+    assert profile.timeout("alert") == pytest.approx(0.5 * 1.5 + 0.05)
+    assert profile.poll("alert") == pytest.approx(0.08)
+
+
+def test_recent_timeout_keeps_default_until_window_passes():
+    profile = trained("alert", 0.5, recent_window=3)
+    profile.record_timeout("alert")
+    assert profile.timeout("alert") == DEFAULT_TIMEOUTS["alert"]
+    for _ in range(3):
+        profile.record("alert", 0.5)
+    assert profile.timeout("alert") == pytest.approx(0.8)
+
+
+def test_overrides_and_cap():
+    profile = trained("alert", 50, overrides={"server_submit": {"timeout": 3}})
+    assert profile.timeout("server_submit") == 3
+    assert profile.timeout("alert") == profile.max_timeout
+
+
+def test_implicit_has_floor_and_reacts_to_misses():
+    profile = trained("login_button", 0.02)
+    assert profile.timeout("implicit") == MIN_TIMEOUTS["implicit"]
+
+    profile.record_timeout("implicit")
+    assert profile.timeout("implicit") == DEFAULT_TIMEOUTS["implicit"]
+    # Sampel tombol login yang cepat saja tidak cukup untuk menurunkannya lagi
+    profile.record("login_button", 0.02)
+    assert profile.timeout("implicit") == DEFAULT_TIMEOUTS["implicit"]
+    for _ in range(profile.recent_window):
+        profile.record_hit("implicit")
+    assert profile.timeout("implicit") == MIN_TIMEOUTS["implicit"]
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "timing.json")
+    profile = trained("alert", 0.5, path=path, overrides={"alert": {"max_timeout": 0.6}})
+    profile.record_timeout("login_modal")
+    assert profile.save()
+    loaded = TimingProfile.load(path)
+    assert loaded.samples["alert"] == profile.samples["alert"]
+    assert loaded.recent["login_modal"] == [0]
+    assert loaded.timeout("alert") == 0.6
+
+
+def test_slow_login_button_is_retried_with_default_implicit_wait(fixture, make_bot):
+    # Profil dari hari cepat: implicit wait turun ke batas bawah
+    timing = trained("login_button", 0.02)
+    # Hari lambat: tombol login dan grid hadiah baru muncul setelah satu putaran semua selector
+    # (25 selector x implicit wait 1 detik) plus pengecekan grid habis
+    for element_id in ("login_button", "reward_grid"):
+        fixture["elements"][element_id].update(attached=False, appear_after=30.0)
+    backend = FakeBackend(fixture=fixture)
+    bot = make_bot(backend, timing=timing)
+    assert bot.run() is True
+    assert bot.last_status == "success"
+    assert backend.implicit_wait == DEFAULT_TIMEOUTS["implicit"]
+    assert timing.recent["implicit"][:2] == [0, 1]
+
+
+def test_no_reward_is_not_an_implicit_wait_miss(fixture, make_bot):
+    # Akun yang sudah claim hari ini: grid hadiah tampil tanpa bintang
+    fixture["elements"]["login_submit"]["on_click"]["show"] = []
+    timing = trained("login_button", 0.02)
+    backend = FakeBackend(fixture=fixture)
+    bot = make_bot(backend, timing=timing)
+    assert bot.run() is True
+    assert bot.last_status == "no_reward"
+    assert timing.recent["implicit"] == [1]
+    assert backend.implicit_wait == MIN_TIMEOUTS["implicit"]
+
+
+def test_already_logged_in_is_not_an_implicit_wait_miss(fixture, make_bot):
+    fixture["elements"]["login_button"]["visible"] = False
+    fixture["elements"]["reward"]["visible"] = True
+    timing = trained("login_button", 0.02)
+    bot = make_bot(FakeBackend(fixture=fixture), timing=timing)
+    assert bot.run() is True
+    assert bot.last_status == "success"
+    assert timing.recent["implicit"] == [1]
+
+
+def test_step_wait_is_not_stretched_by_implicit_wait(fixture, make_bot):
+    # Field email tidak cocok dengan 7 selector: setiap poll kosong tidak boleh memblok selama implicit wait
+    fixture["elements"]["email"]["selectors"] = ["#user-mail"]
+    backend = FakeBackend(fixture=fixture)
+    bot = make_bot(backend, fast_login=False)
+    assert bot.run() is False
+    assert backend.implicit_wait == DEFAULT_TIMEOUTS["implicit"]
+    assert bot.result_fields()["steps"]["login_form"] < DEFAULT_TIMEOUTS["implicit"]
@@ -0,0 +1,192 @@
+"""Profil timing adaptif untuk timeout dan poll interval setiap step.
+
+Setiap wait di flow bot dicatat latensi aslinya per step. Timeout step
+diambil dari persentil tinggi (default p95) ditambah margin, sehingga di
+hari cepat bot tidak menunggu lebih lama dari perlu. Jika step pernah
+timeout di beberapa percobaan terakhir (hari lambat), timeout tidak boleh
+lebih kecil dari default lama sampai step kembali lancar.
+
+Contoh melihat isi profil:
+    python timing_profile.py timing_profile.json
+"""
+import json
+import os
+import sys
+import threading
+import time
+
+from metrics import percentile
+
+# Timeout default (detik) = angka lama di ninja_heroes_bot.py, dipakai sampai sampel cukup
+DEFAULT_TIMEOUTS = {
+    "page_load": 0.3,        # body setelah driver.get
+    "login_popup": 0,        # cek sekali modal login setelah klik tombol login
+    "login_modal": 0.2,      # #LoginForm muncul dan terlihat
+    "login_field": 0.2,      # field email/password/tombol submit di modal
+    "server_popup": 1,       # select[name='selserver'] muncul
+    "server_dropdown": 5,    # dropdown server bisa diklik
+    "server_submit": 10,     # tombol submit server bisa diklik
+    "alert": 10,             # alert konfirmasi setelah submit
+    "success_notice": 0.2,   # notifikasi sukses per selector
+    "fast_login": 10,        # respon XHR login di jalur login cepat
+    "login_done": 8,         # modal login tertutup / tombol login hilang setelah submit (dulu sleep(8))
+    "implicit": 5,           # implicitly_wait driver
+}
+
+# Step yang sampelnya dipinjam dari step lain
+SAMPLE_SOURCE = {
+    "implicit": "login_button",
+}
+
+# Batas bawah timeout hasil sampel. Implicit wait dipakai semua lookup elemen,
+# bukan hanya tombol login yang sampelnya dipinjam
+MIN_TIMEOUTS = {
+    "implicit": 1.0,
+}
+
+
+class TimingProfile:
+    """Sampel latensi per step + aturan turunan timeout/poll"""
+
+    def __init__(self, path=None, pct=95, margin=0.5, pad=0.05, min_samples=20,
+                 max_samples=200, recent_window=10, max_timeout=30.0, overrides=None):
+        self.path = path
+        self.pct = pct
+        self.margin = margin
+        self.pad = pad
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.recent_window = recent_window
+        self.max_timeout = max_timeout
+        self.overrides = dict(overrides or {})
+        self.samples = {}   # step -> [latensi sukses]
+        self.recent = {}    # step -> [1 sukses / 0 timeout]
+        self._lock = threading.Lock()
+        self._last_saved = 0.0
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        """Buat profil dari file JSON (file belum ada = profil kosong)"""
+        profile = cls(path=path, **kwargs)
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            for step, entry in data.get("steps", {}).items():
+                profile.samples[step] = list(entry.get("samples", []))[-profile.max_samples:]
+                profile.recent[step] = list(entry.get("recent", []))[-profile.recent_window:]
+            # Override dari argumen menang atas override di file
+            file_overrides = data.get("overrides", {})
+            file_overrides.update(profile.overrides)
+            profile.overrides = file_overrides
+        return profile
+
+    def save(self, min_interval=0.0):
+        """Simpan profil ke file; min_interval membatasi frekuensi tulis"""
+        if not self.path:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            if min_interval and now - self._last_saved < min_interval:
+                return False
+            data = {
+                "steps": {
+                    step: {
+                        "samples": [round(v, 4) for v in self.samples.get(step, [])],
+                        "recent": self.recent.get(step, []),
+                    }
+                    for step in set(self.samples) | set(self.recent)
+                },
+                "overrides": self.overrides,
+            }
+            self._last_saved = now
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        return True
+
+    def record(self, step, seconds):
+        """Catat wait yang berhasil beserta latensinya"""
+        with self._lock:
+            samples = self.samples.setdefault(step, [])
+            samples.append(max(0.0, seconds))
+            del samples[:-self.max_samples]
+            self._push_recent(step, 1)
+
+    def record_hit(self, step):
+        """Catat wait yang berhasil tanpa sampel latensi (step yang sampelnya dipinjam)"""
+        with self._lock:
+            self._push_recent(step, 1)
+
+    def record_timeout(self, step):
+        """Catat wait yang habis waktu (semua selector/kondisi gagal)"""
+        with self._lock:
+            self._push_recent(step, 0)
+
+    def _push_recent(self, step, outcome):
+        recent = self.recent.setdefault(step, [])
+        recent.append(outcome)
+        del recent[:-self.recent_window]
+
+    def timeout(self, step):
+        """Timeout step: override > persentil+margin (minimal MIN_TIMEOUTS) > default, minimal default jika baru-baru ini timeout"""
+        override = self.overrides.get(step, {})
+        if "timeout" in override:
+            return override["timeout"]
+
+        default = DEFAULT_TIMEOUTS.get(step, 5)
+        with self._lock:
+            samples = list(self.samples.get(SAMPLE_SOURCE.get(step, step), []))
+            misses = self.recent.get(step, []).count(0)
+
+        if len(samples) >= self.min_samples:
+            value = percentile(samples, self.pct) * (1 + self.margin) + self.pad
+            value = max(value, MIN_TIMEOUTS.get(step, 0.0))
+        else:
+            value = default
+
+        if misses:
+            value = max(value, default)
+
+        return min(value, override.get("max_timeout", self.max_timeout))
+
+    def poll(self, step):
+        """Poll interval: sekitar 1/10 timeout, antara 0.05 dan 0.5 detik"""
+        override = self.overrides.get(step, {})
+        if "poll" in override:
+            return override["poll"]
+        return min(0.5, max(0.05, self.timeout(step) / 10))
+
+    def describe(self):
+        """Baris ringkasan per step: (step, n, p50, p95, timeout, poll, timeout terbaru)"""
+        rows = []
+        for step in sorted(set(DEFAULT_TIMEOUTS) | set(self.samples)):
+            samples = self.samples.get(SAMPLE_SOURCE.get(step, step), [])
+            rows.append((
+                step,
+                len(samples),
+                percentile(samples, 50),
+                percentile(samples, 95),
+                self.timeout(step) if step in DEFAULT_TIMEOUTS else None,
+                self.poll(step) if step in DEFAULT_TIMEOUTS else None,
+                self.recent.get(step, []).count(0),
+            ))
+        return rows
+
+
+def _fmt(value):
+    return "-" if value is None else f"{value:.3f}"
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    path = argv[0] if argv else "timing_profile.json"
+    profile = TimingProfile.load(path)
+    print(f"{'step':<16}{'n':>5}{'p50':>9}{'p95':>9}{'timeout':>9}{'poll':>7}{'miss':>6}")
+    for step, n, p50, p95, timeout, poll, misses in profile.describe():
+        print(f"{step:<16}{n:>5}{_fmt(p50):>9}{_fmt(p95):>9}{_fmt(timeout):>9}{_fmt(poll):>7}{misses:>6}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())